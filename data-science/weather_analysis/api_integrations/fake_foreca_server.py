@@ -0,0 +1,421 @@
+"""
+Fake Foreca Server
+A local HTTP stand-in for the Foreca API with configurable latency, errors and rate limiting, for benchmarks,
+tests and load tests.
+"""
+
+import argparse
+import json
+import random
+import re
+import threading
+import time
+from collections import Counter
+from functools import lru_cache
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, unquote, urlparse
+import numpy as np
+import pandas as pd
+
+SYMBOLS = ("d000", "d100", "d200", "d210", "d220", "d300", "d320", "d400", "d430")
+
+# A 1x1 transparent PNG, served for every map tile
+MAP_TILE = bytes.fromhex(
+    "89504e470d0a1a0a0000000d4948445200000001000000010806000000"
+    "1f15c4890000000d49444154789c6360000002000001e221bc330000000049454e44ae426082"
+)
+
+# (id, name, country, lat, lon) of the locations known to the search endpoint
+CITIES = (
+    (100264374, "London", "GB", 51.5085, -0.1257),
+    (100745044, "Paris", "FR", 48.8534, 2.3488),
+    (102950159, "Berlin", "DE", 52.5244, 13.4105),
+    (100524901, "Moscow", "RU", 55.7522, 37.6156),
+    (101850147, "Tokyo", "JP", 35.6895, 139.6917),
+    (105128581, "New York", "US", 40.7143, -74.0060),
+    (103451190, "Rio de Janeiro", "BR", -22.9028, -43.2075),
+    (102147714, "Sydney", "AU", -33.8679, 151.2073),
+)
+
+# (method, path pattern, handler name); handlers take the unquoted path groups, the query parameters and the body
+ROUTES = (
+    ("POST", re.compile(r"^/authorize/token$"), "_token"),
+    ("POST", re.compile(r"^/usage/(day|month)/([^/]+)$"), "_usage"),
+    ("GET", re.compile(r"^/api/v1/forecast/(daily|hourly)/([^/]+)$"), "_forecast"),
+    ("GET", re.compile(r"^/api/v1/current/([^/]+)$"), "_current"),
+    ("GET", re.compile(r"^/api/v1/location/search/([^/]+)$"), "_search"),
+    ("GET", re.compile(r"^/api/v1/airquality/([^/]+)$"), "_air_quality"),
+    ("GET", re.compile(r"^/api/v1/observation/history/([^/]+)$"), "_history"),
+    ("GET", re.compile(r"^/api/v1/map/([^/]+)/([^/]+)/([^/]+)/(\d+)/(\d+)/(\d+)$"), "_map"),
+)
+
+# Endpoints that authenticate with credentials instead of a bearer token
+UNAUTHENTICATED = ("_token", "_usage")
+
+
+def _seed(location: str) -> int:
+    """Stable random seed for a location, so every request for it returns the same data."""
+    return sum(ord(char) * 31 ** i for i, char in enumerate(location)) % 2 ** 32
+
+
+def daily_records(location: str, periods: int) -> List[Dict]:
+    """Synthetic daily forecast records in the shape returned by /api/v1/forecast/daily."""
+    rng = np.random.default_rng(_seed(location))
+    dates = pd.date_range("2024-01-01", periods=periods, freq="D").strftime("%Y-%m-%d")
+    max_temp = rng.integers(-10, 40, periods)
+    return [
+        {
+            "date": date,
+            "symbol": SYMBOLS[symbol],
+            "maxTemp": int(high),
+            "minTemp": int(high - spread),
+            "precipAccum": round(float(precip), 1),
+            "maxWindSpeed": int(wind),
+            "windDir": int(direction),
+            "precipProb": int(prob),
+        }
+        for date, symbol, high, spread, precip, wind, direction, prob in zip(
+            dates, rng.integers(0, len(SYMBOLS), periods), max_temp, rng.integers(2, 15, periods),
+            rng.uniform(0, 30, periods) * (rng.random(periods) > 0.4), rng.integers(0, 40, periods),
+            rng.integers(0, 360, periods), rng.integers(0, 100, periods))
+    ]
+
+
+def hourly_records(location: str, periods: int, tz: str = "UTC", start: str = "2024-01-01") -> List[Dict]:
+    """Synthetic hourly records in the shape returned by /api/v1/forecast/hourly (also used for observations)."""
+    rng = np.random.default_rng(_seed(location))
+    times = pd.date_range(start, periods=periods, freq="h", tz=tz)
+    times = [time.isoformat(timespec="minutes") for time in times]
+    temperature = 10 + 8 * np.sin(np.arange(periods) * 2 * np.pi / 24) + rng.normal(0, 2, periods)
+    precip = rng.uniform(0, 4, periods) * (rng.random(periods) > 0.7)
+    return [
+        {
+            "time": time,
+            "symbol": SYMBOLS[symbol],
+            "temperature": round(float(temp), 1),
+            "feelsLikeTemp": round(float(temp) - 2, 1),
+            "relHumidity": int(humidity),
+            "windSpeed": int(wind),
+            "windDir": int(direction),
+            "precipProb": int(prob),
+            "precipAccum": round(float(rain), 1),
+        }
+        for time, symbol, temp, humidity, wind, direction, prob, rain in zip(
+            times, rng.integers(0, len(SYMBOLS), periods), temperature, rng.integers(30, 100, periods),
+            rng.integers(0, 25, periods), rng.integers(0, 360, periods), rng.integers(0, 100, periods), precip)
+    ]
+
+
+@lru_cache(maxsize=4096)
+def _forecast_body(kind: str, location: str, periods: int, tz: str) -> bytes:
+    """Encoded forecast response, cached so the server adds little time to client benchmarks."""
+    records = daily_records(location, periods) if kind == "daily" else hourly_records(location, periods, tz)
+    return json.dumps({"forecast": records}).encode()
+
+
+class _HTTPServer(ThreadingHTTPServer):
+    """Threading HTTP server that knows its FakeForecaServer."""
+
+    daemon_threads = True
+
+    def __init__(self, address: Tuple[str, int], fake: "FakeForecaServer"):
+        super().__init__(address, _Handler)
+        self.fake = fake
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """Applies the server's fault injection, then routes requests to the fake endpoints."""
+
+    protocol_version = "HTTP/1.1"  # keep-alive, like the real API
+    disable_nagle_algorithm = True  # headers and body are separate writes; avoid delayed-ACK stalls
+
+    def log_message(self, format, *args):
+        pass
+
+    def _send(self, body: bytes, status: int = 200, content_type: str = "application/json",
+              headers: Optional[Dict[str, str]] = None) -> None:
+        self.server.fake._record(status)
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _send_json(self, payload: Dict, status: int = 200, headers: Optional[Dict[str, str]] = None) -> None:
+        self._send(json.dumps(payload).encode(), status, headers=headers)
+
+    def _dispatch(self, method: str) -> None:
+        fake = self.server.fake
+        url = urlparse(self.path)
+        length = int(self.headers.get("Content-Length") or 0)
+        body = self.rfile.read(length) if length else b""
+
+        fault = fake._fault()
+        if fault is not None:
+            status, headers = fault
+            self._send_json({"error": "injected failure"}, status, headers)
+            return
+
+        for route_method, pattern, handler in ROUTES:
+            match = pattern.match(url.path)
+            if match and route_method == method:
+                break
+        else:
+            self._send_json({"error": "not found"}, 404)
+            return
+
+        if handler not in UNAUTHENTICATED and not fake._valid_token(self.headers.get("Authorization")):
+            self._send_json({"error": "unauthorized"}, 401)
+            return
+
+        params = {name: values[-1] for name, values in parse_qs(url.query).items()}
+        groups = [unquote(group) for group in match.groups()]
+        getattr(self, handler)(*groups, params=params, body=body)
+
+    def do_GET(self):
+        self._dispatch("GET")
+
+    def do_POST(self):
+        self._dispatch("POST")
+
+    def _token(self, params: Dict, body: bytes) -> None:
+        try:
+            credentials = json.loads(body or b"{}")
+        except ValueError:
+            credentials = {}
+        if not credentials.get("user") or not credentials.get("password"):
+            self._send_json({"error": "missing credentials"}, 400)
+            return
+        token, lifetime = self.server.fake._issue_token()
+        self._send_json({"access_token": token, "expires_in": lifetime, "token_type": "bearer"})
+
+    def _usage(self, period: str, value: str, params: Dict, body: bytes) -> None:
+        self._send_json({"hits": self.server.fake.stats()["requests"], period: value})
+
+    def _forecast(self, kind: str, location: str, params: Dict, body: bytes) -> None:
+        periods = int(params.get("periods", 7 if kind == "daily" else 24))
+        self._send(_forecast_body(kind, location, periods, params.get("tz", "UTC")))
+
+    def _current(self, location: str, params: Dict, body: bytes) -> None:
+        self._send_json({"current": hourly_records(location, 1)[0]})
+
+    def _search(self, query: str, params: Dict, body: bytes) -> None:
+        if re.match(r"^-?[\d.]+,-?[\d.]+$", query):
+            lat, lon = map(float, query.split(","))
+            cities = [min(CITIES, key=lambda city: (city[3] - lat) ** 2 + (city[4] - lon) ** 2)]
+        else:
+            cities = [city for city in CITIES if query.lower() in city[1].lower()]
+        self._send_json({"locations": [
+            {"id": location_id, "name": name, "country": country, "lat": lat, "lon": lon}
+            for location_id, name, country, lat, lon in cities
+            if params.get("country", country) == country
+        ]})
+
+    def _air_quality(self, location: str, params: Dict, body: bytes) -> None:
+        rng = np.random.default_rng(_seed(location))
+        times = pd.date_range("2024-01-01", periods=24, freq="h", tz="UTC")
+        self._send_json({"airquality": [
+            {"time": time.isoformat(timespec="minutes"), "AQI": int(aqi),
+             "PM25": round(float(aqi) * 0.4, 1), "PM10": round(float(aqi) * 0.7, 1)}
+            for time, aqi in zip(times, rng.integers(5, 120, 24))
+        ]})
+
+    def _history(self, location: str, params: Dict, body: bytes) -> None:
+        try:
+            start = pd.Timestamp(params.get("start", "2024-01-01")).normalize()
+            end = pd.Timestamp(params.get("end", str(start.date()))).normalize()
+        except ValueError:
+            self._send_json({"error": "invalid date"}, 400)
+            return
+        hours = max(0, (end - start) // pd.Timedelta(hours=1) + 24)
+        records = hourly_records(f"{location}@{start.date()}", hours, start=str(start.date()))
+        self._send_json({"observations": records})
+
+    def _map(self, layer: str, lat: str, lon: str, zoom: str, width: str, height: str,
+             params: Dict, body: bytes) -> None:
+        self._send(MAP_TILE, content_type="image/png")
+
+
+class FakeForecaServer:
+    """
+    A Foreca API stand-in listening on localhost.
+
+    Serves the token endpoint, daily and hourly forecasts, current
+    conditions, location search, air quality, observation history, map
+    tiles and usage statistics with deterministic synthetic data. Any
+    non-empty credentials get a token; data endpoints require a valid,
+    unexpired one.
+
+    Latency, transient errors and 429s can be injected to exercise the
+    client's pooling, retry and rate-limit handling offline. Use it as a
+    context manager and point a client at `url`:
+
+        with FakeForecaServer(latency=0.02, error_rate=0.01, rate_limit=200) as server:
+            api = ForecaWeatherAPI("user", "password", base_url=server.url, map_url=server.url)
+    """
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0, latency: float = 0.0, jitter: float = 0.0,
+                 error_rate: float = 0.0, error_status: int = 503, throttle_rate: float = 0.0,
+                 rate_limit: Optional[float] = None, burst: Optional[float] = None, retry_after: float = 1,
+                 token_lifetime: int = 7200, seed: Optional[int] = None):
+        """
+        Initialize the server.
+
+        Args:
+            host (str): Interface to listen on.
+            port (int): Port to listen on; 0 picks a free port.
+            latency (float): Seconds added to every response.
+            jitter (float): Extra random delay of up to this many seconds per response.
+            error_rate (float): Fraction of requests answered with `error_status`.
+            error_status (int): Status code of injected errors.
+            throttle_rate (float): Fraction of requests answered with 429, regardless of load.
+            rate_limit (float, optional): Requests per second served; requests above it get 429.
+            burst (float, optional): Requests allowed back-to-back under `rate_limit` (one second's worth if omitted).
+            retry_after (float): Retry-After seconds sent with 429 responses.
+            token_lifetime (int): Lifetime of issued access tokens in seconds.
+            seed (int, optional): Seed for the injected faults, for reproducible runs.
+        """
+        self.host = host
+        self.port = port
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.throttle_rate = throttle_rate
+        self.rate_limit = rate_limit
+        self.burst = burst if burst is not None else max(1.0, rate_limit or 1.0)
+        self.retry_after = retry_after
+        self.token_lifetime = token_lifetime
+
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._allowance = self.burst
+        self._allowance_at = time.monotonic()
+        self._tokens: Dict[str, float] = {}  # access token -> monotonic expiry
+        self._issued = 0
+        self._statuses: Counter = Counter()
+        self._server: Optional[_HTTPServer] = None
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        """Base URL of the running server."""
+        return f"http://{self.host}:{self.port}"
+
+    def _fault(self) -> Optional[Tuple[int, Dict[str, str]]]:
+        """Wait out the configured latency, then decide whether this request is throttled or fails."""
+        with self._lock:
+            delay = self.latency + (self._random.uniform(0, self.jitter) if self.jitter else 0.0)
+            draw = self._random.random()
+            throttled = draw < self.throttle_rate
+            failed = not throttled and draw < self.throttle_rate + self.error_rate
+            if self.rate_limit and not (throttled or failed):
+                now = time.monotonic()
+                self._allowance = min(self.burst, self._allowance + (now - self._allowance_at) * self.rate_limit)
+                self._allowance_at = now
+                if self._allowance < 1:
+                    throttled = True
+                else:
+                    self._allowance -= 1
+        if delay:
+            time.sleep(delay)
+        if throttled:
+            return 429, {"Retry-After": f"{self.retry_after:g}"}
+        if failed:
+            return self.error_status, {}
+        return None
+
+    def _issue_token(self) -> Tuple[str, int]:
+        with self._lock:
+            self._issued += 1
+            token = f"fake-token-{self._issued}"
+            self._tokens[token] = time.monotonic() + self.token_lifetime
+        return token, self.token_lifetime
+
+    def _valid_token(self, authorization: Optional[str]) -> bool:
+        if not authorization or not authorization.startswith("Bearer "):
+            return False
+        with self._lock:
+            expires_at = self._tokens.get(authorization[len("Bearer "):])
+        return expires_at is not None and time.monotonic() < expires_at
+
+    def _record(self, status: int) -> None:
+        with self._lock:
+            self._statuses[status] += 1
+
+    @property
+    def tokens_issued(self) -> int:
+        """Number of access tokens issued so far."""
+        return self._issued
+
+    def expire_tokens(self) -> None:
+        """Invalidate every issued token, as if they had all expired."""
+        with self._lock:
+            self._tokens.clear()
+
+    def stats(self) -> Dict:
+        """Number of responses sent, in total and by status code."""
+        with self._lock:
+            statuses = dict(self._statuses)
+        return {"requests": sum(statuses.values()), "statuses": statuses}
+
+    def reset_stats(self) -> None:
+        """Reset the response counters."""
+        with self._lock:
+            self._statuses.clear()
+
+    def start(self) -> None:
+        """Start serving in a background thread."""
+        if self._server is not None:
+            return
+        self._server = _HTTPServer((self.host, self.port), self)
+        self.port = self._server.server_address[1]
+        self._thread = threading.Thread(target=self._server.serve_forever, name="fake-foreca", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the server and wait for its thread."""
+        if self._server is None:
+            return
+        self._server.shutdown()
+        self._server.server_close()
+        self._thread.join()
+        self._server = self._thread = None
+
+    def __enter__(self) -> "FakeForecaServer":
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run a local fake Foreca API until interrupted.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument("--jitter", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--throttle-rate", type=float, default=0.0)
+    parser.add_argument("--rate-limit", type=float)
+    parser.add_argument("--retry-after", type=float, default=1.0)
+    args = parser.parse_args()
+
+    server = FakeForecaServer(args.host, args.port, latency=args.latency, jitter=args.jitter,
+                              error_rate=args.error_rate, throttle_rate=args.throttle_rate,
+                              rate_limit=args.rate_limit, retry_after=args.retry_after)
+    with server:
+        print(f"Fake Foreca API listening on {server.url} (Ctrl+C to stop)")
+        try:
+            while True:
+                time.sleep(3600)
+        except KeyboardInterrupt:
+            pass
+
+
+if __name__ == "__main__":
+    main()
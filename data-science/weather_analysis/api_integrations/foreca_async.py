@@ -0,0 +1,127 @@
+"""
+Asynchronous batch access to the Foreca Weather API.
+Fans out forecast requests for many locations under a bounded concurrency limit.
+"""
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterable, Optional
+import pandas as pd
+import logging
+
+from .forecast_parsing import FORECAST_KINDS, build_forecast_panel
+from .foreca_weather_api import ForecaWeatherAPI
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncForecaWeatherAPI:
+    """
+    An asyncio counterpart to ForecaWeatherAPI for multi-location pulls.
+
+    Requests are executed through the wrapped synchronous client on a
+    dedicated pool of `max_concurrency` worker threads (the event loop's
+    default executor is capped at min(32, cpus + 4) threads), so every
+    request shares its session, token and settings.
+    """
+
+    def __init__(self, client: ForecaWeatherAPI, max_concurrency: int = 10):
+        """
+        Initialize the asynchronous client.
+
+        Args:
+            client (ForecaWeatherAPI): An initialized synchronous client.
+            max_concurrency (int): Maximum number of requests in flight at once.
+        """
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+
+        self.client = client
+        self.max_concurrency = max_concurrency
+
+        if client.pool_maxsize is not None and client.pool_maxsize < max_concurrency:
+            logger.warning(f"Client connection pool ({client.pool_maxsize}) is smaller than max_concurrency "
+                           f"({max_concurrency}); create the client with pool_maxsize={max_concurrency} "
+                           "to reuse connections.")
+        if client.limit_lookups and client.rate_limiter.rate < max_concurrency:
+            logger.warning(f"Client rate limiter ({client.rate_limiter.rate:g} requests/s) is slower than "
+                           f"max_concurrency ({max_concurrency}); forecasts will be throttled to its rate.")
+
+    async def get_forecast_panel(self, location_ids: Iterable[int], kind: str = "daily",
+                                 periods: Optional[int] = None, tz: str = "UTC",
+                                 compact: bool = False) -> pd.DataFrame:
+        """
+        Get forecasts for many locations concurrently as one long-format DataFrame.
+
+        Args:
+            location_ids (Iterable[int]): The IDs of the locations.
+            kind (str): "daily" or "hourly".
+            periods (int, optional): Days or hours per location (defaults: 7 daily, 24 hourly).
+            tz (str): Timezone for hourly forecasts.
+            compact (bool): Store measurements as float32 to halve their memory footprint.
+
+        Returns:
+            pd.DataFrame: Forecasts indexed by (location_id, date) or (location_id, time).
+        """
+        if kind not in FORECAST_KINDS:
+            raise ValueError("kind must be 'daily' or 'hourly'")
+        if periods is None:
+            periods = 7 if kind == "daily" else 24
+
+        location_ids = list(location_ids)
+        if not location_ids:
+            return pd.DataFrame()
+
+        loop = asyncio.get_running_loop()
+        executor = ThreadPoolExecutor(max_workers=min(self.max_concurrency, len(location_ids)),
+                                      thread_name_prefix="foreca-async")
+        try:
+            # Authenticate once before fanning out so workers reuse the same token
+            await loop.run_in_executor(executor, self.client._authenticate)
+            records = await asyncio.gather(*(
+                loop.run_in_executor(executor, self.client._fetch_forecast_records, kind, location_id, periods, tz)
+                for location_id in location_ids
+            ))
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+        panel = build_forecast_panel(zip(location_ids, records), kind, compact=compact)
+
+        if panel.empty:
+            logger.warning("No forecast data returned for any of the requested locations.")
+        else:
+            n_locations = panel.index.get_level_values(0).nunique()
+            logger.info(f"Retrieved forecasts for {n_locations}/{len(location_ids)} locations.")
+        return panel
+
+    async def get_daily_forecast_many(self, location_ids: Iterable[int], periods: int = 7,
+                                      compact: bool = False) -> pd.DataFrame:
+        """
+        Get daily forecasts for many locations concurrently.
+
+        Args:
+            location_ids (Iterable[int]): The IDs of the locations.
+            periods (int): Number of days for each forecast (max 14).
+            compact (bool): Store measurements as float32 to halve their memory footprint.
+
+        Returns:
+            pd.DataFrame: A single DataFrame keyed by `location_id`.
+        """
+        panel = await self.get_forecast_panel(location_ids, "daily", periods, compact=compact)
+        return panel.reset_index() if not panel.empty else panel
+
+    async def get_hourly_forecast_many(self, location_ids: Iterable[int], periods: int = 24,
+                                       tz: str = "UTC", compact: bool = False) -> pd.DataFrame:
+        """
+        Get hourly forecasts for many locations concurrently.
+
+        Args:
+            location_ids (Iterable[int]): The IDs of the locations.
+            periods (int): Number of time periods for each forecast (max 168).
+            tz (str): Timezone for the response (e.g., "UTC", "Europe/London").
+            compact (bool): Store measurements as float32 to halve their memory footprint.
+
+        Returns:
+            pd.DataFrame: A single DataFrame keyed by `location_id`.
+        """
+        panel = await self.get_forecast_panel(location_ids, "hourly", periods, tz, compact)
+        return panel.reset_index() if not panel.empty else panel
@@ -4,17 +4,57 @@ A comprehensive wrapper for the Foreca Weather API to fetch and process weather
 """
 
 import requests
+from requests.adapters import HTTPAdapter
 import json
 import time
-from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Union, Tuple
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from functools import partial
+from typing import Dict, Iterable, Iterator, List, Optional, Union, Tuple
 import pandas as pd
 import logging
 
+from .forecast_parsing import build_forecast_panel, parse_daily_forecast, parse_hourly_forecast
+from .forecast_storage import write_forecast
+from .rate_limiter import TokenBucket
+from .response_cache import ResponseCache
+from .retry_policy import RetryPolicy
+from .token_manager import TokenManager
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Default (connect, read) timeouts in seconds, so a stuck socket never blocks a worker forever
+DEFAULT_TIMEOUT = (3.05, 30)
+
+
+def create_session(pool_connections: int = 10, pool_maxsize: int = 10,
+                   compress: bool = True) -> requests.Session:
+    """
+    Create a keep-alive HTTP session tuned for the Foreca API.
+
+    The session can be shared by many ForecaWeatherAPI instances (and threads)
+    so they reuse the same pool of open connections.
+
+    Args:
+        pool_connections (int): Number of hosts to keep connection pools for.
+        pool_maxsize (int): Maximum open connections kept per host; match your concurrency.
+        compress (bool): Ask the server for gzip/deflate-compressed responses.
+
+    Returns:
+        requests.Session: The configured session.
+    """
+    session = requests.Session()
+    # Retries are handled by RetryPolicy, so the adapter itself never retries.
+    adapter = HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize, max_retries=0)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers["Accept-Encoding"] = "gzip, deflate" if compress else "identity"
+    session.headers["Connection"] = "keep-alive"
+    return session
+
 
 class ForecaWeatherAPI:
     """
@@ -24,7 +64,14 @@ class ForecaWeatherAPI:
 
     def __init__(self, username: str, password: str,
                  base_url: str = "https://pfa.foreca.com",
-                 map_url: str = "https://map-eu.foreca.com"):
+                 map_url: str = "https://map-eu.foreca.com",
+                 cache: Optional[ResponseCache] = None,
+                 rate_limiter: Optional[TokenBucket] = None,
+                 retry_policy: Optional[RetryPolicy] = None,
+                 session: Optional[requests.Session] = None,
+                 timeout: Union[float, Tuple[float, float], None] = DEFAULT_TIMEOUT,
+                 pool_maxsize: int = 10,
+                 token_refresh_skew: float = 300):
         """
         Initialize the Foreca Weather API client.
 
@@ -33,37 +80,72 @@ class ForecaWeatherAPI:
             password (str): Foreca API password.
             base_url (str): Base URL for the main weather API.
             map_url (str): Base URL for the weather map API.
+            cache (ResponseCache, optional): Response cache consulted before every GET request.
+            rate_limiter (TokenBucket, optional): Limiter shared by every request. Pass the same
+                instance (or a FileTokenBucket) to several clients to share one quota.
+                If omitted, a limiter of 10 requests per second without bursts throttles
+                authentication, air quality, history, map and usage requests only, leaving
+                forecasts, current conditions and location searches unthrottled.
+            retry_policy (RetryPolicy, optional): How transient failures are retried.
+                Defaults to 4 attempts with exponential backoff within 60 seconds.
+            session (requests.Session, optional): Session to share with other clients
+                (see `create_session`). A new pooled session is created if omitted.
+            timeout (float or tuple): Per-request timeout in seconds, or a (connect, read) pair.
+            pool_maxsize (int): Connections kept open to the API when creating a new session.
+            token_refresh_skew (float): Seconds before expiry at which the token is refreshed
+                (at most half of the token lifetime).
         """
         self.username = username
         self.password = password
         self.base_url = base_url
         self.map_url = map_url
-        self.access_token = None
-        self.token_expires_at = None
-        self.session = requests.Session()
+        self.token_manager = TokenManager(self._request_token, refresh_skew=token_refresh_skew)
+        self.session = session if session is not None else create_session(pool_maxsize=pool_maxsize)
+        self.pool_maxsize = None if session is not None else pool_maxsize
+        self.timeout = timeout
 
         # Rate limiting
-        self.last_request_time = 0
-        self.min_request_interval = 0.1  # 100ms between requests
+        self.rate_limiter = rate_limiter or TokenBucket(rate=10, burst=1)  # 100ms between requests
+        # Forecast, current-conditions and search lookups are only throttled by a caller's own limiter
+        self.limit_lookups = rate_limiter is not None
+
+        # Retries for transient failures
+        self.retry_policy = retry_policy or RetryPolicy()
 
         # Cache for location data
         self.location_cache = {}
 
+        # Optional response cache shared with other clients, workers or processes
+        self.cache = cache
+
         logger.info("ForecaWeatherAPI initialized.")
 
-    def _rate_limit(self):
-        """Implement rate limiting to respect API limits."""
-        current_time = time.time()
-        time_since_last = current_time - self.last_request_time
-        if time_since_last < self.min_request_interval:
-            time.sleep(self.min_request_interval - time_since_last)
-        self.last_request_time = time.time()
+    def _rate_limit(self) -> float:
+        """
+        Implement rate limiting to respect API limits.
 
-    def _authenticate(self) -> None:
-        """Authenticate and retrieve an access token."""
-        if self.access_token and self.token_expires_at and datetime.now() < self.token_expires_at:
-            return
+        Returns:
+            float: Seconds spent waiting for the rate limiter.
+        """
+        return self.rate_limiter.acquire()
+
+    @property
+    def access_token(self) -> Optional[str]:
+        """The current access token, if authenticated."""
+        return self.token_manager.access_token
+
+    @property
+    def token_expires_at(self) -> Optional[datetime]:
+        """When the current access token expires, if authenticated."""
+        return self.token_manager.expires_at
+
+    def _request_token(self) -> Tuple[str, float]:
+        """
+        Request a new access token from the token endpoint.
 
+        Returns:
+            Tuple[str, float]: The access token and its lifetime in seconds.
+        """
         auth_url = f"{self.base_url}/authorize/token"
         auth_data = {
             "user": self.username,
@@ -72,48 +154,132 @@ class ForecaWeatherAPI:
         }
 
         try:
-            self._rate_limit()
-            response = self.session.post(auth_url, json=auth_data)
-            response.raise_for_status()
+            response = self._send(auth_url, method="POST", json=auth_data, authenticated=False)
+            if response is None:
+                raise requests.exceptions.RequestException("no response from the token endpoint")
 
             auth_response = response.json()
-            self.access_token = auth_response["access_token"]
-            self.token_expires_at = datetime.now() + timedelta(seconds=auth_response["expires_in"])
-
             logger.info("Authentication successful. Token is valid for 2 hours.")
+            return auth_response["access_token"], auth_response["expires_in"]
 
         except requests.exceptions.RequestException as e:
             logger.error(f"Authentication failed: {e}")
             raise Exception(f"Failed to authenticate with Foreca API: {e}")
 
+    def _authenticate(self) -> None:
+        """Make sure a valid access token is available, refreshing it ahead of expiry."""
+        self.token_manager.get_headers()
+
     def _get_auth_headers(self) -> Dict[str, str]:
         """Get authentication headers with a valid token."""
-        self._authenticate()
-        return {
-            "Authorization": f"Bearer {self.access_token}",
-            "Content-Type": "application/json"
-        }
+        return self.token_manager.get_headers()
+
+    def _send(self, url: str, params: Optional[Dict] = None, method: str = "GET",
+              json: Optional[Dict] = None, authenticated: bool = True,
+              rate_limited: bool = True) -> Optional[requests.Response]:
+        """
+        Send a request, retrying transient failures according to the retry policy.
+
+        Connection errors, timeouts and retryable status codes (429, 5xx, ...) are
+        retried with backoff, honoring `Retry-After`. Other HTTP errors fail fast.
+        A 401 response refreshes the token once before giving up.
+
+        Args:
+            url (str): The full URL for the API endpoint.
+            params (dict, optional): URL parameters for the request.
+            method (str): HTTP method.
+            json (dict, optional): JSON body for the request.
+            authenticated (bool): Whether to send the bearer token.
+            rate_limited (bool): Whether each attempt waits for the rate limiter.
 
-    def _make_request(self, url: str, params: Optional[Dict] = None) -> Dict:
+        Returns:
+            requests.Response: The successful response, or None if the request failed.
+        """
+        policy = self.retry_policy
+        deadline = time.monotonic() + policy.deadline
+        attempt = 0
+        refreshed_token = False
+
+        while True:
+            attempt += 1
+            retry_after = None
+            try:
+                headers = self._get_auth_headers() if authenticated else None
+                if rate_limited:
+                    self._rate_limit()
+                response = self.session.request(method, url, headers=headers, params=params,
+                                                json=json, timeout=self.timeout)
+
+                if response.status_code == 401 and authenticated and not refreshed_token:
+                    logger.warning("Access token rejected, re-authenticating.")
+                    self.token_manager.invalidate()
+                    refreshed_token = True
+                    attempt -= 1
+                    continue
+
+                if not policy.is_retryable_status(response.status_code):
+                    response.raise_for_status()
+                    return response
+
+                error = f"HTTP {response.status_code}"
+                retry_after = policy.parse_retry_after(response.headers.get("Retry-After"))
+
+            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout,
+                    requests.exceptions.ChunkedEncodingError) as e:
+                error = e
+
+            except requests.exceptions.RequestException as e:
+                logger.error(f"API request failed for URL {url}: {e}")
+                return None
+
+            delay = policy.delay(attempt, retry_after)
+            if attempt >= policy.max_attempts or time.monotonic() + delay > deadline:
+                logger.error(f"API request failed for URL {url} after {attempt} attempt(s): {error}")
+                return None
+
+            logger.warning(f"Request to {url} failed ({error}), retrying in {delay:.2f}s "
+                           f"(attempt {attempt}/{policy.max_attempts}).")
+            time.sleep(delay)
+
+    def _make_request(self, url: str, params: Optional[Dict] = None, lookup: bool = False) -> Dict:
         """
         Make an authenticated GET request to the Foreca API.
 
         Args:
             url (str): The full URL for the API endpoint.
             params (dict, optional): URL parameters for the request.
+            lookup (bool): Whether this is a forecast, current-conditions or search lookup,
+                which is only rate limited when the client was given a limiter.
 
         Returns:
-            Dict: The JSON response from the API.
+            Dict: The JSON response from the API, or {} if the request failed.
         """
+        data = self._get_json(url, params, lookup)
+        return {} if data is None else data
+
+    def _get_json(self, url: str, params: Optional[Dict] = None, lookup: bool = False) -> Optional[Dict]:
+        """
+        Like `_make_request`, but returns None if the request failed, so that
+        failures can be told apart from empty results.
+        """
+        if self.cache is not None:
+            cached = self.cache.get(url, params)
+            if cached is not None:
+                return cached
+
+        response = self._send(url, params, rate_limited=self.limit_lookups or not lookup)
+        if response is None:
+            return None
+
         try:
-            headers = self._get_auth_headers()
-            response = self.session.get(url, headers=headers, params=params)
-            response.raise_for_status()
-            return response.json()
+            data = response.json()
+        except ValueError as e:
+            logger.error(f"Invalid JSON response for URL {url}: {e}")
+            return None
 
-        except requests.exceptions.RequestException as e:
-            logger.error(f"API request failed for URL {url}: {e}")
-            return {}
+        if self.cache is not None:
+            self.cache.set(url, params, data)
+        return data
 
     def search_location(self, query: str, lang: str = "en", country: Optional[str] = None) -> List[Dict]:
         """
@@ -132,38 +298,64 @@ class ForecaWeatherAPI:
         if country:
             params["country"] = country
 
-        locations_data = self._make_request(url, params)
+        locations_data = self._make_request(url, params, lookup=True)
         locations = locations_data.get("locations", [])
         logger.info(f"Found {len(locations)} locations for query: '{query}'.")
         return locations
 
-    def get_daily_forecast(self, location_id: int, periods: int = 7) -> pd.DataFrame:
+    def _fetch_forecast_records(self, kind: str, location_id: int, periods: int,
+                                tz: str = "UTC") -> List[Dict]:
+        """
+        Fetch the raw forecast records for one location.
+
+        Args:
+            kind (str): "daily" or "hourly".
+            location_id (int): The ID of the location.
+            periods (int): Number of days (max 14) or hours (max 168).
+            tz (str): Timezone for hourly forecasts.
+
+        Returns:
+            List[Dict]: The forecast records, empty if the request failed.
+        """
+        if kind == "daily":
+            url = f"{self.base_url}/api/v1/forecast/daily/{location_id}"
+            params = {"periods": min(periods, 14)}
+        elif kind == "hourly":
+            url = f"{self.base_url}/api/v1/forecast/hourly/{location_id}"
+            params = {
+                "periods": min(periods, 168),
+                "tz": tz
+            }
+        else:
+            raise ValueError("kind must be 'daily' or 'hourly'")
+
+        forecast_data = self._make_request(url, params, lookup=True)
+        return forecast_data.get("forecast", [])
+
+    def get_daily_forecast(self, location_id: int, periods: int = 7, compact: bool = False) -> pd.DataFrame:
         """
         Get the daily weather forecast for a specific location ID.
 
         Args:
             location_id (int): The ID of the location.
             periods (int): Number of days for the forecast (max 14).
+            compact (bool): Store measurements as float32 to halve their memory footprint.
 
         Returns:
             pd.DataFrame: A DataFrame containing the daily forecast data.
         """
-        url = f"{self.base_url}/api/v1/forecast/daily/{location_id}"
-        params = {"periods": min(periods, 14)}
-
-        forecast_data = self._make_request(url, params)
-        forecasts = forecast_data.get("forecast", [])
+        forecasts = self._fetch_forecast_records("daily", location_id, periods)
 
         if not forecasts:
             logger.warning(f"No daily forecast data returned for location ID {location_id}.")
             return pd.DataFrame()
 
-        df = pd.DataFrame(forecasts)
-        df["date"] = pd.to_datetime(df["date"])
+        df = parse_daily_forecast(forecasts, compact=compact)
         logger.info(f"Retrieved daily forecast for location ID {location_id}.")
         return df
 
-    def get_hourly_forecast(self, location_id: int, periods: int = 24, tz: str = "UTC") -> pd.DataFrame:
+    def get_hourly_forecast(self, location_id: int, periods: int = 24, tz: str = "UTC",
+                            compact: bool = False) -> pd.DataFrame:
         """
         Get the hourly weather forecast for a location.
 
@@ -171,28 +363,49 @@ class ForecaWeatherAPI:
             location_id (int): The ID of the location.
             periods (int): Number of time periods (max 168).
             tz (str): Timezone for the response (e.g., "UTC", "Europe/London").
+            compact (bool): Store measurements as float32 to halve their memory footprint.
 
         Returns:
             pd.DataFrame: A DataFrame containing the hourly forecast data.
         """
-        url = f"{self.base_url}/api/v1/forecast/hourly/{location_id}"
-        params = {
-            "periods": min(periods, 168),
-            "tz": tz
-        }
-
-        forecast_data = self._make_request(url, params)
-        forecasts = forecast_data.get("forecast", [])
+        forecasts = self._fetch_forecast_records("hourly", location_id, periods, tz)
 
         if not forecasts:
             logger.warning(f"No hourly forecast data returned for location ID {location_id}.")
             return pd.DataFrame()
 
-        df = pd.DataFrame(forecasts)
-        df["time"] = pd.to_datetime(df["time"])
+        df = parse_hourly_forecast(forecasts, compact=compact)
         logger.info(f"Retrieved hourly forecast for location ID {location_id}.")
         return df
 
+    def get_forecast_panel(self, location_ids: Iterable[int], kind: str = "daily",
+                           periods: Optional[int] = None, tz: str = "UTC",
+                           compact: bool = False) -> pd.DataFrame:
+        """
+        Get forecasts for many locations as one long-format DataFrame.
+
+        Args:
+            location_ids (Iterable[int]): The IDs of the locations.
+            kind (str): "daily" or "hourly".
+            periods (int, optional): Days or hours per location (defaults: 7 daily, 24 hourly).
+            tz (str): Timezone for hourly forecasts.
+            compact (bool): Store measurements as float32 to halve their memory footprint.
+
+        Returns:
+            pd.DataFrame: Forecasts indexed by (location_id, date) or (location_id, time).
+        """
+        if periods is None:
+            periods = 7 if kind == "daily" else 24
+
+        location_ids = list(location_ids)
+        records = ((location_id, self._fetch_forecast_records(kind, location_id, periods, tz))
+                   for location_id in location_ids)
+        panel = build_forecast_panel(records, kind, compact=compact)
+
+        n_locations = panel.index.get_level_values(0).nunique() if not panel.empty else 0
+        logger.info(f"Retrieved {kind} forecast panel for {n_locations}/{len(location_ids)} locations.")
+        return panel
+
     def get_location_by_coordinates(self, lat: float, lon: float) -> Optional[Dict]:
         """
         Get location information by coordinates.
@@ -208,6 +421,29 @@ class ForecaWeatherAPI:
         locations = self.search_location(query)
         return locations[0] if locations else None
 
+    def get_current_conditions(self, location: Union[str, int, Tuple[float, float]]) -> Dict:
+        """
+        Get the current weather conditions for a location.
+
+        Args:
+            location: Location ID or (lat, lon) tuple
+
+        Returns:
+            Dict: Current conditions (temperature, symbol, wind, ...), or {} on failure
+        """
+        if isinstance(location, tuple):
+            location_str = f"{location[0]},{location[1]}"
+        else:
+            location_str = str(location)
+
+        url = f"{self.base_url}/api/v1/current/{location_str}"
+        data = self._make_request(url, lookup=True)
+        current = data.get("current", {})
+
+        if not current:
+            logger.warning(f"No current conditions returned for {location_str}.")
+        return current
+
     def get_air_quality(self, location: Union[str, Tuple[float, float]]) -> pd.DataFrame:
         """
         Get air quality data for a location.
@@ -218,31 +454,26 @@ class ForecaWeatherAPI:
         Returns:
             pd.DataFrame: Air quality data
         """
-        try:
-            self._rate_limit()
-
-            if isinstance(location, tuple):
-                location_str = f"{location[0]},{location[1]}"
-            else:
-                location_str = str(location)
+        if isinstance(location, tuple):
+            location_str = f"{location[0]},{location[1]}"
+        else:
+            location_str = str(location)
 
-            url = f"{self.base_url}/api/v1/airquality/{location_str}"
-            headers = self._get_auth_headers()
-            response = self.session.get(url, headers=headers)
-            response.raise_for_status()
+        url = f"{self.base_url}/api/v1/airquality/{location_str}"
+        data = self._make_request(url)
+        records = data.get("airquality", [])
 
-            data = response.json()
-            df = pd.DataFrame(data["airquality"])
+        if not records:
+            logger.warning(f"No air quality data returned for {location_str}.")
+            return pd.DataFrame()
 
-            # Convert time column to datetime
-            df["time"] = pd.to_datetime(df["time"])
+        df = pd.DataFrame(records)
 
-            logger.info(f"Retrieved air quality data for {location_str}")
-            return df
+        # Convert time column to datetime
+        df["time"] = pd.to_datetime(df["time"])
 
-        except requests.exceptions.RequestException as e:
-            logger.error(f"Air quality data failed: {e}")
-            return pd.DataFrame()
+        logger.info(f"Retrieved air quality data for {location_str}")
+        return df
 
     def get_weather_maps(self, layer: str, lat: float, lon: float,
                         zoom: int = 8, width: int = 800, height: int = 600) -> bytes:
@@ -260,21 +491,16 @@ class ForecaWeatherAPI:
         Returns:
             bytes: Image data
         """
-        try:
-            self._rate_limit()
-
-            url = f"{self.map_url}/api/v1/map/{layer}/{lat}/{lon}/{zoom}/{width}/{height}"
-            headers = self._get_auth_headers()
-            response = self.session.get(url, headers=headers)
-            response.raise_for_status()
-
-            logger.info(f"Retrieved weather map for layer: {layer}")
-            return response.content
+        url = f"{self.map_url}/api/v1/map/{layer}/{lat}/{lon}/{zoom}/{width}/{height}"
+        response = self._send(url)
 
-        except requests.exceptions.RequestException as e:
-            logger.error(f"Weather map failed: {e}")
+        if response is None:
+            logger.error(f"Weather map failed for layer: {layer}")
             return b""
 
+        logger.info(f"Retrieved weather map for layer: {layer}")
+        return response.content
+
     def get_weather_history(self, location: Union[str, Tuple[float, float]],
                           start_date: str, end_date: str) -> pd.DataFrame:
         """
@@ -288,36 +514,122 @@ class ForecaWeatherAPI:
         Returns:
             pd.DataFrame: Historical weather data
         """
-        try:
-            self._rate_limit()
+        return self._fetch_weather_history(location, start_date, end_date)
 
-            if isinstance(location, tuple):
-                location_str = f"{location[0]},{location[1]}"
-            else:
-                location_str = str(location)
+    def _fetch_weather_history(self, location: Union[str, Tuple[float, float]], start_date: str,
+                               end_date: str, raise_on_failure: bool = False) -> pd.DataFrame:
+        """
+        Fetch historical weather data, optionally raising instead of returning an
+        empty DataFrame when the request fails.
 
-            url = f"{self.base_url}/api/v1/observation/history/{location_str}"
-            params = {
-                "start": start_date,
-                "end": end_date
-            }
+        Raises:
+            requests.exceptions.RequestException: If the request failed and `raise_on_failure` is set.
+        """
+        if isinstance(location, tuple):
+            location_str = f"{location[0]},{location[1]}"
+        else:
+            location_str = str(location)
+
+        url = f"{self.base_url}/api/v1/observation/history/{location_str}"
+        params = {
+            "start": start_date,
+            "end": end_date
+        }
 
-            headers = self._get_auth_headers()
-            response = self.session.get(url, headers=headers, params=params)
-            response.raise_for_status()
+        data = self._get_json(url, params)
+        if data is None:
+            if raise_on_failure:
+                raise requests.exceptions.RequestException(
+                    f"Weather history request failed for {location_str} ({start_date} to {end_date})")
+            data = {}
+        records = data.get("observations", [])
 
-            data = response.json()
-            df = pd.DataFrame(data["observations"])
+        if not records:
+            logger.warning(f"No weather history returned for {location_str}.")
+            return pd.DataFrame()
 
-            # Convert time column to datetime
-            df["time"] = pd.to_datetime(df["time"])
+        df = pd.DataFrame(records)
 
-            logger.info(f"Retrieved weather history for {location_str}")
-            return df
+        # Convert time column to datetime
+        df["time"] = pd.to_datetime(df["time"])
 
-        except requests.exceptions.RequestException as e:
-            logger.error(f"Weather history failed: {e}")
-            return pd.DataFrame()
+        logger.info(f"Retrieved weather history for {location_str}")
+        return df
+
+    @staticmethod
+    def _split_date_range(start_date: str, end_date: str, chunk: str) -> List[Tuple[str, str]]:
+        """
+        Split an inclusive date range into consecutive (start, end) chunks.
+
+        Args:
+            start_date (str): Start date (YYYY-MM-DD).
+            end_date (str): End date (YYYY-MM-DD).
+            chunk (str): Pandas frequency for chunk boundaries (e.g. "30D", "MS").
+
+        Returns:
+            List[Tuple[str, str]]: Chunk boundaries as YYYY-MM-DD strings.
+        """
+        start, end = pd.Timestamp(start_date).normalize(), pd.Timestamp(end_date).normalize()
+        if end < start:
+            raise ValueError("end_date must not be before start_date")
+
+        starts = pd.date_range(start, end, freq=chunk)
+        if len(starts) == 0 or starts[0] != start:
+            starts = starts.insert(0, start)
+        ends = list(starts[1:] - pd.Timedelta(days=1)) + [end]
+        return [(s.strftime("%Y-%m-%d"), e.strftime("%Y-%m-%d")) for s, e in zip(starts, ends)]
+
+    def iter_weather_history(self, location: Union[str, Tuple[float, float]],
+                             start_date: str, end_date: str, chunk: str = "30D",
+                             max_workers: int = 1) -> Iterator[pd.DataFrame]:
+        """
+        Stream historical weather data in date-ordered chunks.
+
+        At most `max_workers` chunks are fetched ahead of the consumer, so memory
+        stays bounded no matter how long the range is.
+
+        Args:
+            location: Location identifier or (lat, lon) tuple
+            start_date (str): Start date (YYYY-MM-DD)
+            end_date (str): End date (YYYY-MM-DD)
+            chunk (str): Pandas frequency used to split the range (e.g. "30D", "7D", "MS")
+            max_workers (int): Number of chunks fetched concurrently
+
+        Yields:
+            pd.DataFrame: Historical weather data for each non-empty chunk, in order
+
+        Raises:
+            requests.exceptions.RequestException: If a chunk could not be fetched after retries.
+                Chunks that were fetched but hold no observations are skipped.
+        """
+        chunks = self._split_date_range(start_date, end_date, chunk)
+        fetch = partial(self._fetch_weather_history, raise_on_failure=True)
+
+        if max_workers <= 1:
+            for chunk_start, chunk_end in chunks:
+                df = fetch(location, chunk_start, chunk_end)
+                if not df.empty:
+                    yield df
+            return
+
+        executor = ThreadPoolExecutor(max_workers=max_workers)
+        pending = deque()
+        remaining = iter(chunks)
+        try:
+            for chunk_start, chunk_end in remaining:
+                pending.append(executor.submit(fetch, location, chunk_start, chunk_end))
+                if len(pending) >= max_workers:
+                    break
+
+            while pending:
+                df = pending.popleft().result()
+                next_chunk = next(remaining, None)
+                if next_chunk is not None:
+                    pending.append(executor.submit(fetch, location, *next_chunk))
+                if not df.empty:
+                    yield df
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
 
     def get_usage_stats(self, month: str = None, day: str = None) -> Dict:
         """
@@ -330,65 +642,96 @@ class ForecaWeatherAPI:
         Returns:
             Dict: Usage statistics
         """
-        try:
-            self._rate_limit()
-
-            if day:
-                url = f"{self.base_url}/usage/day/{day}"
-            elif month:
-                url = f"{self.base_url}/usage/month/{month}"
-            else:
-                raise ValueError("Either month or day must be specified")
+        if day:
+            url = f"{self.base_url}/usage/day/{day}"
+        elif month:
+            url = f"{self.base_url}/usage/month/{month}"
+        else:
+            raise ValueError("Either month or day must be specified")
 
-            auth_data = {
-                "user": self.username,
-                "password": self.password
-            }
-
-            response = self.session.post(url, json=auth_data)
-            response.raise_for_status()
-
-            usage_data = response.json()
-            logger.info(f"Retrieved usage stats: {usage_data['hits']} total hits")
-            return usage_data
+        auth_data = {
+            "user": self.username,
+            "password": self.password
+        }
 
-        except requests.exceptions.RequestException as e:
-            logger.error(f"Usage stats failed: {e}")
+        response = self._send(url, method="POST", json=auth_data, authenticated=False)
+        if response is None:
+            logger.error("Usage stats failed")
             return {}
 
-    def save_forecast_to_csv(self, location: Union[str, Tuple[float, float]],
-                           filename: str, forecast_type: str = "hourly") -> bool:
+        usage_data = response.json()
+        logger.info(f"Retrieved usage stats: {usage_data['hits']} total hits")
+        return usage_data
+
+    def save_forecast(self, location: Union[str, Tuple[float, float]], path: str,
+                      format: str = "parquet", forecast_type: str = "hourly",
+                      partition_by: Optional[Union[str, List[str]]] = None,
+                      compression: Optional[str] = "default", append: bool = False,
+                      add_location_column: bool = True, compact: Optional[bool] = None) -> bool:
         """
-        Save forecast data to CSV file.
+        Save forecast data to Parquet, Feather or CSV.
 
         Args:
             location: Location identifier or (lat, lon) tuple
-            filename (str): Output filename
+            path (str): Output file, or dataset directory for partitioned/appended Parquet
+            format (str): "parquet", "feather" or "csv"
             forecast_type (str): "hourly" or "daily"
+            partition_by (str or list, optional): Columns to partition a Parquet dataset by
+                (e.g. "location_id")
+            compression (str, optional): Codec name, "default" for the format's default, or None
+            append (bool): Add to an existing CSV file or Parquet dataset instead of replacing it
+                (not supported for Feather)
+            add_location_column (bool): Prepend a `location_id` column so archives of many
+                locations can be told apart
+            compact (bool, optional): Store measurements as float32. Defaults to True for
+                Parquet and Feather and to False for CSV, which keeps the values as the API sent them
 
         Returns:
             bool: True if successful, False otherwise
         """
+        if compact is None:
+            compact = format != "csv"
         try:
             if forecast_type == "hourly":
-                df = self.get_hourly_forecast(location)
+                df = self.get_hourly_forecast(location, compact=compact)
             elif forecast_type == "daily":
-                df = self.get_daily_forecast(location)
+                df = self.get_daily_forecast(location, compact=compact)
             else:
                 raise ValueError("forecast_type must be 'hourly' or 'daily'")
 
-            if not df.empty:
-                df.to_csv(filename, index=False)
-                logger.info(f"Saved {forecast_type} forecast to {filename}")
-                return True
-            else:
+            if df.empty:
                 logger.warning(f"No data to save for {forecast_type} forecast")
                 return False
 
+            if add_location_column:
+                location_id = f"{location[0]},{location[1]}" if isinstance(location, tuple) else location
+                df.insert(0, "location_id", location_id)
+
+            write_forecast(df, path, format=format, partition_by=partition_by,
+                           compression=compression, append=append)
+            logger.info(f"Saved {forecast_type} forecast to {path}")
+            return True
+
         except Exception as e:
             logger.error(f"Failed to save forecast: {e}")
             return False
 
+    def save_forecast_to_csv(self, location: Union[str, Tuple[float, float]],
+                           filename: str, forecast_type: str = "hourly") -> bool:
+        """
+        Save forecast data to CSV file.
+
+        Args:
+            location: Location identifier or (lat, lon) tuple
+            filename (str): Output filename
+            forecast_type (str): "hourly" or "daily"
+
+        Returns:
+            bool: True if successful, False otherwise
+        """
+        return self.save_forecast(location, filename, format="csv", forecast_type=forecast_type,
+                                  add_location_column=False, compact=False)
+
 
 # Example usage and testing
 if __name__ == "__main__":
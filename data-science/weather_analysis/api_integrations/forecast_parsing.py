@@ -0,0 +1,164 @@
+"""
+Typed Forecast Parsing
+Builds compact, explicitly typed DataFrames from Foreca forecast records.
+"""
+
+from operator import itemgetter
+from typing import Dict, Iterable, List, Optional, Tuple
+import numpy as np
+import pandas as pd
+
+# Explicit dtypes for the fields returned by the forecast endpoints.
+# "float" columns follow the requested float precision (all-integer values stay int64 unless
+# compact, as pandas would infer them); unknown fields are inferred.
+DAILY_DTYPES: Dict[str, str] = {
+    "symbol": "category",
+    "maxTemp": "float", "minTemp": "float",
+    "maxFeelsLikeTemp": "float", "minFeelsLikeTemp": "float",
+    "maxRelHumidity": "int16", "minRelHumidity": "int16",
+    "maxDewPoint": "float", "minDewPoint": "float",
+    "precipAccum": "float", "snowAccum": "float",
+    "maxWindSpeed": "float", "maxWindGust": "float",
+    "windDir": "int16", "precipProb": "int16", "cloudiness": "int16",
+    "uvIndex": "int16", "moonPhase": "int16",
+    "pressure": "float", "minVisibility": "float",
+    "solarRadiationSum": "float", "confidence": "category",
+}
+
+HOURLY_DTYPES: Dict[str, str] = {
+    "symbol": "category",
+    "temperature": "float", "feelsLikeTemp": "float", "dewPoint": "float",
+    "relHumidity": "int16",
+    "windSpeed": "float", "windGust": "float",
+    "windDir": "int16", "windDirString": "category",
+    "precipProb": "int16", "precipRate": "float", "precipAccum": "float", "snowRate": "float",
+    "cloudiness": "int16", "thunderProb": "int16", "uvIndex": "int16",
+    "pressure": "float", "visibility": "float",
+}
+
+# Precompiled timestamp formats: the daily endpoint returns plain dates, the hourly one ISO 8601.
+DAILY_TIME_FORMAT = "%Y-%m-%d"
+HOURLY_TIME_FORMAT = "ISO8601"
+
+
+def _parse_times(values: List, time_format: str) -> pd.DatetimeIndex:
+    """Parse timestamps with a fixed format, falling back to inference for unexpected input."""
+    try:
+        return pd.to_datetime(values, format=time_format)
+    except (ValueError, TypeError):
+        return pd.to_datetime(values)
+
+
+def _typed_column(values: List, dtype: Optional[str], float_dtype: str):
+    """Convert a list of raw values to an array of the declared dtype (unknown fields are left to pandas)."""
+    if dtype == "category":
+        return pd.Categorical(values)
+
+    if dtype in ("float", "int16"):
+        array = np.array(values)
+        if dtype == "float" and float_dtype == "float64" and array.dtype.kind == "i":
+            return array  # integer API values keep printing as integers ("3", not "3.0")
+        try:
+            array = array.astype(np.float64)
+        except (TypeError, ValueError):
+            return values  # unexpected non-numeric values; let pandas infer rather than fail
+        if dtype == "int16" and not np.isnan(array).any():
+            return array.astype(np.int16)
+        return array.astype(float_dtype, copy=False)
+
+    return values
+
+
+def parse_forecast(records: List[Dict], time_column: str, time_format: str,
+                   dtypes: Dict[str, str], compact: bool = False) -> pd.DataFrame:
+    """
+    Build a typed DataFrame column by column from a list of forecast records.
+
+    Args:
+        records (List[Dict]): Raw forecast records as returned by the API.
+        time_column (str): Name of the timestamp column.
+        time_format (str): Format used to parse the timestamp column.
+        dtypes (Dict[str, str]): Declared dtype for each known field.
+        compact (bool): Store measurements as float32 instead of float64.
+
+    Returns:
+        pd.DataFrame: The parsed forecast, or an empty DataFrame if there are no records.
+    """
+    if not records:
+        return pd.DataFrame()
+
+    float_dtype = "float32" if compact else "float64"
+    columns = list(records[0])
+    column_values = None
+    if len(set(map(len, records))) == 1:
+        # Common case: every record has the same fields, so transpose in C-level passes
+        try:
+            getter = itemgetter(*columns)
+            rows = map(getter, records) if len(columns) > 1 else ((value,) for value in map(getter, records))
+            column_values = [list(values) for values in zip(*rows)]
+        except KeyError:
+            pass
+    if column_values is None:
+        columns = list(dict.fromkeys(key for record in records for key in record))
+        column_values = [[record.get(name) for record in records] for name in columns]
+
+    data = {}
+    for name, values in zip(columns, column_values):
+        if name == time_column:
+            data[name] = _parse_times(values, time_format)
+        else:
+            data[name] = _typed_column(values, dtypes.get(name), float_dtype)
+
+    return pd.DataFrame(data, copy=False)
+
+
+def parse_daily_forecast(records: List[Dict], compact: bool = False) -> pd.DataFrame:
+    """Parse records from the daily forecast endpoint."""
+    return parse_forecast(records, "date", DAILY_TIME_FORMAT, DAILY_DTYPES, compact)
+
+
+def parse_hourly_forecast(records: List[Dict], compact: bool = False) -> pd.DataFrame:
+    """Parse records from the hourly forecast endpoint."""
+    return parse_forecast(records, "time", HOURLY_TIME_FORMAT, HOURLY_DTYPES, compact)
+
+
+# Timestamp column and parser for each forecast kind
+FORECAST_KINDS = {
+    "daily": ("date", parse_daily_forecast),
+    "hourly": ("time", parse_hourly_forecast),
+}
+
+
+def build_forecast_panel(records_by_location: Iterable[Tuple[int, List[Dict]]], kind: str = "daily",
+                         compact: bool = False) -> pd.DataFrame:
+    """
+    Build one long-format frame from the raw forecast records of many locations.
+
+    All records are parsed in a single pass, so there are no intermediate
+    per-location frames to concatenate.
+
+    Args:
+        records_by_location: (location_id, records) pairs.
+        kind (str): "daily" or "hourly".
+        compact (bool): Store measurements as float32 instead of float64.
+
+    Returns:
+        pd.DataFrame: The forecasts indexed by (location_id, date) or (location_id, time).
+    """
+    if kind not in FORECAST_KINDS:
+        raise ValueError("kind must be 'daily' or 'hourly'")
+    time_column, parse = FORECAST_KINDS[kind]
+
+    location_ids, counts, all_records = [], [], []
+    for location_id, records in records_by_location:
+        if records:
+            location_ids.append(location_id)
+            counts.append(len(records))
+            all_records.extend(records)
+
+    if not all_records:
+        return pd.DataFrame()
+
+    df = parse(all_records, compact=compact)
+    df.insert(0, "location_id", np.repeat(np.asarray(location_ids), counts))
+    return df.set_index(["location_id", time_column])
@@ -0,0 +1,127 @@
+"""
+Forecast Storage
+Writes forecast DataFrames to Parquet, Feather or CSV and reads them back.
+Parquet and Feather require the optional `pyarrow` dependency.
+"""
+
+import os
+import uuid
+from typing import List, Optional, Sequence, Union
+import pandas as pd
+
+FORMATS = ("parquet", "feather", "csv")
+
+# Compression used when the caller does not choose one
+DEFAULT_COMPRESSION = {"parquet": "zstd", "feather": "zstd", "csv": None}
+
+# Columns restored as datetimes when reading CSV files
+TIME_COLUMNS = ("date", "time")
+
+
+def infer_format(path: str) -> str:
+    """Guess the storage format from a path (directories are Parquet datasets)."""
+    if os.path.isdir(path):
+        return "parquet"
+
+    name = path.lower()
+    for suffix in (".gz", ".bz2", ".zip", ".xz", ".zst"):
+        if name.endswith(suffix):
+            name = name[: -len(suffix)]
+    if name.endswith((".parquet", ".pq")):
+        return "parquet"
+    if name.endswith((".feather", ".arrow")):
+        return "feather"
+    if name.endswith(".csv"):
+        return "csv"
+    raise ValueError(f"Cannot infer the storage format of '{path}'; pass format= explicitly")
+
+
+def write_forecast(df: pd.DataFrame, path: str, format: str = "parquet",
+                   partition_by: Optional[Union[str, Sequence[str]]] = None,
+                   compression: Optional[str] = "default", append: bool = False) -> None:
+    """
+    Write a forecast DataFrame.
+
+    Parquet output is a single file unless `partition_by` or `append` is
+    given, in which case `path` is a dataset directory and every write adds
+    new files to it. CSV files are appended to in place. Feather files
+    cannot be appended to without rewriting them, so append is rejected
+    for Feather; use a Parquet dataset for archives that grow.
+
+    Args:
+        df (pd.DataFrame): The forecast to write.
+        path (str): Output file, or dataset directory for partitioned/appended Parquet.
+        format (str): "parquet", "feather" or "csv".
+        partition_by (str or list, optional): Columns to partition a Parquet dataset by.
+        compression (str, optional): Codec name ("zstd", "snappy", "gzip", "lz4", ...),
+            "default" for the format's default, or None for no compression.
+        append (bool): Add to existing data instead of replacing it.
+
+    Raises:
+        ValueError: For an unknown format, partition_by outside Parquet, append with Feather,
+            or a partitioned/appended Parquet write to a path that is a single Parquet file.
+    """
+    if format not in FORMATS:
+        raise ValueError(f"format must be one of {FORMATS}")
+    if partition_by is not None and format != "parquet":
+        raise ValueError("partition_by is only supported for the parquet format")
+    if append and format == "feather":
+        raise ValueError("append is not supported for the feather format; use a parquet dataset or csv")
+    if format == "parquet" and (append or partition_by) and os.path.isfile(path):
+        raise ValueError(f"'{path}' is a single parquet file; appending and partitioning "
+                         "need a dataset directory")
+    if compression == "default":
+        compression = DEFAULT_COMPRESSION[format]
+    if isinstance(partition_by, str):
+        partition_by = [partition_by]
+
+    if format == "parquet":
+        if partition_by:
+            df.to_parquet(path, index=False, compression=compression, partition_cols=partition_by,
+                          existing_data_behavior="overwrite_or_ignore" if append else "delete_matching")
+        elif append:
+            os.makedirs(path, exist_ok=True)
+            df.to_parquet(os.path.join(path, f"part-{uuid.uuid4().hex}.parquet"),
+                          index=False, compression=compression)
+        else:
+            df.to_parquet(path, index=False, compression=compression)
+
+    elif format == "feather":
+        df.reset_index(drop=True).to_feather(path, compression=compression or "uncompressed")
+
+    else:
+        exists = append and os.path.exists(path)
+        df.to_csv(path, index=False, mode="a" if exists else "w", header=not exists,
+                  compression=compression)
+
+
+def load_forecast(path: str, format: Optional[str] = None, columns: Optional[List[str]] = None,
+                  filters: Optional[List] = None) -> pd.DataFrame:
+    """
+    Load a forecast written by `write_forecast`.
+
+    Args:
+        path (str): File or Parquet dataset directory.
+        format (str, optional): "parquet", "feather" or "csv"; inferred from the path if omitted.
+        columns (list, optional): Only read these columns.
+        filters (list, optional): Parquet row filters, e.g. [("location_id", "==", 100292968)].
+
+    Returns:
+        pd.DataFrame: The stored forecast.
+    """
+    format = format or infer_format(path)
+    if format not in FORMATS:
+        raise ValueError(f"format must be one of {FORMATS}")
+    if filters is not None and format != "parquet":
+        raise ValueError("filters are only supported for the parquet format")
+
+    if format == "parquet":
+        return pd.read_parquet(path, columns=columns, filters=filters)
+    if format == "feather":
+        return pd.read_feather(path, columns=columns)
+
+    df = pd.read_csv(path, usecols=columns)
+    for column in TIME_COLUMNS:
+        if column in df.columns:
+            df[column] = pd.to_datetime(df[column])
+    return df
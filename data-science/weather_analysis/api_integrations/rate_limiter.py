@@ -0,0 +1,134 @@
+"""
+Rate Limiting for the Foreca Weather API
+Token-bucket limiters that can be shared across threads and, optionally, processes.
+"""
+
+import os
+import threading
+import time
+from typing import Dict
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+
+class TokenBucket:
+    """
+    A thread-safe token bucket.
+
+    Tokens refill continuously at `rate` per second up to `burst`. Callers
+    reserve tokens under a lock and sleep outside it, so waiting threads are
+    served in arrival order and never block each other's bookkeeping.
+    """
+
+    def __init__(self, rate: float, burst: float = 1):
+        """
+        Initialize the bucket.
+
+        Args:
+            rate (float): Sustained number of requests allowed per second.
+            burst (float): Maximum number of requests that may be sent back-to-back.
+        """
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        if burst < 1:
+            raise ValueError("burst must be at least 1")
+
+        self.rate = rate
+        self.burst = burst
+        self._lock = threading.Lock()
+        self._tokens = float(burst)
+        self._updated_at = time.monotonic()
+
+        # Waiting statistics
+        self.acquisitions = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+
+    def _reserve(self, tokens: float) -> float:
+        """Take `tokens` from the bucket and return how long the caller must wait for them."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated_at) * self.rate)
+            self._updated_at = now
+            self._tokens -= tokens
+            return max(0.0, -self._tokens / self.rate)
+
+    def acquire(self, tokens: float = 1) -> float:
+        """
+        Block until `tokens` are available.
+
+        Args:
+            tokens (float): Number of tokens to consume.
+
+        Returns:
+            float: Seconds spent waiting.
+        """
+        wait = self._reserve(tokens)
+        if wait > 0:
+            time.sleep(wait)
+        self._record(wait)
+        return wait
+
+    def _record(self, wait: float) -> None:
+        with self._lock:
+            self.acquisitions += 1
+            self.total_wait += wait
+            self.max_wait = max(self.max_wait, wait)
+
+    @property
+    def stats(self) -> Dict[str, float]:
+        """Number of acquisitions and the time callers spent waiting for tokens."""
+        with self._lock:
+            return {
+                "acquisitions": self.acquisitions,
+                "total_wait": self.total_wait,
+                "max_wait": self.max_wait,
+                "avg_wait": self.total_wait / self.acquisitions if self.acquisitions else 0.0,
+            }
+
+
+class FileTokenBucket(TokenBucket):
+    """
+    A token bucket whose state lives in a small file guarded by `fcntl.flock`.
+
+    Every process (and thread) using the same `path` draws from one shared
+    bucket, so several workers can run against the same account without
+    exceeding its quota. Only available on POSIX systems.
+    """
+
+    def __init__(self, path: str, rate: float, burst: float = 1):
+        """
+        Initialize the bucket.
+
+        Args:
+            path (str): State file shared by all participating processes.
+            rate (float): Sustained number of requests allowed per second.
+            burst (float): Maximum number of requests that may be sent back-to-back.
+        """
+        if fcntl is None:
+            raise RuntimeError("FileTokenBucket requires fcntl, which is not available on this platform")
+
+        super().__init__(rate, burst)
+        self.path = path
+
+    def _reserve(self, tokens: float) -> float:
+        fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX)
+            now = time.time()
+            state = os.read(fd, 64).split()
+            if len(state) == 2:
+                available = min(self.burst, float(state[0]) + (now - float(state[1])) * self.rate)
+            else:
+                available = float(self.burst)
+
+            available -= tokens
+            os.lseek(fd, 0, os.SEEK_SET)
+            os.ftruncate(fd, 0)
+            os.write(fd, f"{available!r} {now!r}".encode())
+            return max(0.0, -available / self.rate)
+        finally:
+            os.close(fd)  # also releases the lock
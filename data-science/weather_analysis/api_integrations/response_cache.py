@@ -0,0 +1,226 @@
+"""
+Response Caching for the Foreca Weather API
+Pluggable caches that store decoded JSON responses keyed by URL and parameters.
+"""
+
+import json
+from abc import ABC, abstractmethod
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+
+# Time-to-live (seconds) per endpoint, matched against the request URL in order.
+DEFAULT_TTLS: Dict[str, float] = {
+    "/location/search/": 30 * 24 * 3600,
+    "/forecast/": 10 * 60,
+    "/current/": 10 * 60,
+    "/airquality/": 30 * 60,
+    "/observation/history/": 24 * 3600,
+}
+
+
+class ResponseCache(ABC):
+    """
+    Base class for response caches.
+
+    Subclasses implement `_load`, `_store` and `clear`; key building, TTL
+    lookup and hit/miss counting are shared. Only lookups for cacheable
+    endpoints (TTL above 0) count as hits or misses.
+    """
+
+    def __init__(self, ttls: Optional[Dict[str, float]] = None, default_ttl: float = 0):
+        """
+        Initialize the cache.
+
+        Args:
+            ttls (dict, optional): URL fragment -> TTL in seconds. Defaults to DEFAULT_TTLS.
+            default_ttl (float): TTL for URLs matching no fragment (0 disables caching).
+        """
+        self.ttls = dict(DEFAULT_TTLS if ttls is None else ttls)
+        self.default_ttl = default_ttl
+        self.hits = 0
+        self.misses = 0
+        self._stats_lock = threading.Lock()
+
+    @staticmethod
+    def make_key(url: str, params: Optional[Dict] = None) -> str:
+        """Build a stable cache key from a URL and its query parameters."""
+        return f"{url}?{json.dumps(params or {}, sort_keys=True, default=str)}"
+
+    def ttl_for(self, url: str) -> float:
+        """Return the TTL in seconds that applies to a URL."""
+        for fragment, ttl in self.ttls.items():
+            if fragment in url:
+                return ttl
+        return self.default_ttl
+
+    def get(self, url: str, params: Optional[Dict] = None) -> Optional[Dict]:
+        """
+        Look up a cached response.
+
+        Returns:
+            Dict: The cached JSON response, or None on a miss, an expired entry or an uncached endpoint.
+        """
+        if self.ttl_for(url) <= 0:
+            return None
+        value = self._load(self.make_key(url, params), time.time())
+
+        with self._stats_lock:
+            if value is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return value
+
+    def set(self, url: str, params: Optional[Dict], value: Dict) -> None:
+        """Store a JSON response if its endpoint is cacheable."""
+        ttl = self.ttl_for(url)
+        if ttl > 0 and value:
+            self._store(self.make_key(url, params), value, time.time() + ttl)
+
+    @property
+    def stats(self) -> Dict[str, float]:
+        """Hit/miss counters and the resulting hit ratio."""
+        with self._stats_lock:
+            total = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": self.hits / total if total else 0.0,
+            }
+
+    @abstractmethod
+    def _load(self, key: str, now: float) -> Optional[Dict]:
+        """Return the value stored under `key`, or None if it is missing or expired at `now`."""
+
+    @abstractmethod
+    def _store(self, key: str, value: Dict, expires_at: float) -> None:
+        """Store `value` under `key` until `expires_at` (a time.time() timestamp)."""
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Remove every cached entry."""
+
+
+class MemoryResponseCache(ResponseCache):
+    """An in-process LRU cache, useful for a single notebook kernel or worker."""
+
+    def __init__(self, max_entries: int = 1024, ttls: Optional[Dict[str, float]] = None,
+                 default_ttl: float = 0):
+        """
+        Initialize the cache.
+
+        Args:
+            max_entries (int): Maximum number of responses kept before evicting the least recently used.
+            ttls (dict, optional): URL fragment -> TTL in seconds.
+            default_ttl (float): TTL for URLs matching no fragment.
+        """
+        super().__init__(ttls, default_ttl)
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, Tuple[float, Dict]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _load(self, key: str, now: float) -> Optional[Dict]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at <= now:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def _store(self, key: str, value: Dict, expires_at: float) -> None:
+        with self._lock:
+            self._entries[key] = (expires_at, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class SQLiteResponseCache(ResponseCache):
+    """
+    A persistent cache backed by a SQLite file.
+
+    The file can be shared by several processes (workers, notebook kernels);
+    SQLite handles the locking between them.
+    """
+
+    def __init__(self, path: str = "foreca_cache.sqlite", max_entries: int = 10000,
+                 ttls: Optional[Dict[str, float]] = None, default_ttl: float = 0):
+        """
+        Initialize the cache.
+
+        Args:
+            path (str): Location of the SQLite database file.
+            max_entries (int): Maximum number of responses kept before evicting the least recently used.
+            ttls (dict, optional): URL fragment -> TTL in seconds.
+            default_ttl (float): TTL for URLs matching no fragment.
+        """
+        super().__init__(ttls, default_ttl)
+        self.path = path
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, timeout=30, check_same_thread=False)
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                " key TEXT PRIMARY KEY,"
+                " value TEXT NOT NULL,"
+                " expires_at REAL NOT NULL,"
+                " last_access REAL NOT NULL)"
+            )
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS responses_last_access ON responses (last_access)"
+            )
+
+    def _load(self, key: str, now: float) -> Optional[Dict]:
+        with self._lock, self._conn:
+            row = self._conn.execute(
+                "SELECT value, expires_at FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            if row[1] <= now:
+                self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                return None
+            self._conn.execute("UPDATE responses SET last_access = ? WHERE key = ?", (now, key))
+        return json.loads(row[0])
+
+    def _store(self, key: str, value: Dict, expires_at: float) -> None:
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses (key, value, expires_at, last_access)"
+                " VALUES (?, ?, ?, ?)",
+                (key, json.dumps(value), expires_at, time.time()),
+            )
+            self._conn.execute(
+                "DELETE FROM responses WHERE key IN ("
+                " SELECT key FROM responses ORDER BY last_access DESC LIMIT -1 OFFSET ?)",
+                (self.max_entries,),
+            )
+
+    def clear(self) -> None:
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM responses")
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        with self._lock:
+            self._conn.close()
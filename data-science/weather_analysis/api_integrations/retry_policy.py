@@ -0,0 +1,79 @@
+"""
+Retry Policy for the Foreca Weather API
+Decides which failures are worth retrying and how long to wait between attempts.
+"""
+
+import random
+import time
+from email.utils import parsedate_to_datetime
+from typing import Iterable, Optional
+
+# Status codes that indicate a transient condition on the server side.
+RETRYABLE_STATUS_CODES = frozenset({408, 425, 429, 500, 502, 503, 504})
+
+
+class RetryPolicy:
+    """
+    Exponential backoff with full jitter, bounded by an attempt count and a total deadline.
+
+    A `Retry-After` header sent by the server takes precedence over the
+    computed backoff.
+    """
+
+    def __init__(self, max_attempts: int = 4, backoff_factor: float = 0.5,
+                 max_backoff: float = 30.0, deadline: float = 60.0,
+                 retry_statuses: Iterable[int] = RETRYABLE_STATUS_CODES):
+        """
+        Initialize the policy.
+
+        Args:
+            max_attempts (int): Total attempts per request, including the first one (1 disables retries).
+            backoff_factor (float): Base delay in seconds; attempt n waits up to factor * 2**(n-1).
+            max_backoff (float): Upper bound for a single delay in seconds.
+            deadline (float): Total time budget in seconds for all attempts of one request.
+            retry_statuses (Iterable[int]): HTTP status codes considered transient.
+        """
+        if max_attempts < 1:
+            raise ValueError("max_attempts must be at least 1")
+
+        self.max_attempts = max_attempts
+        self.backoff_factor = backoff_factor
+        self.max_backoff = max_backoff
+        self.deadline = deadline
+        self.retry_statuses = frozenset(retry_statuses)
+
+    def is_retryable_status(self, status_code: int) -> bool:
+        """Return True if a response with this status code should be retried."""
+        return status_code in self.retry_statuses
+
+    def backoff(self, attempt: int) -> float:
+        """Return a jittered delay in seconds after the given (1-based) failed attempt."""
+        return random.uniform(0, min(self.max_backoff, self.backoff_factor * 2 ** (attempt - 1)))
+
+    @staticmethod
+    def parse_retry_after(value: Optional[str]) -> Optional[float]:
+        """
+        Parse a `Retry-After` header.
+
+        Args:
+            value (str, optional): Either a number of seconds or an HTTP date.
+
+        Returns:
+            float: Seconds to wait, or None if the header is missing or invalid.
+        """
+        if not value:
+            return None
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            pass
+        try:
+            return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+        except (TypeError, ValueError):
+            return None
+
+    def delay(self, attempt: int, retry_after: Optional[float] = None) -> float:
+        """Return how long to wait after the given failed attempt."""
+        if retry_after is not None:
+            return retry_after
+        return self.backoff(attempt)
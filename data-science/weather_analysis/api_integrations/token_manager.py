@@ -0,0 +1,121 @@
+"""
+Access Token Management for the Foreca Weather API
+Keeps a bearer token fresh without putting the token request on the hot path.
+"""
+
+import threading
+import time
+from datetime import datetime, timedelta
+from typing import Callable, Dict, Optional, Tuple
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class TokenManager:
+    """
+    A single-flight token cache that refreshes ahead of expiry.
+
+    While the token is fresh, callers get the cached header dict without
+    taking a lock. Inside the `refresh_skew` window (at most half of the
+    token's lifetime, so short-lived tokens are not refreshed on every call)
+    a background thread fetches the next token while every caller keeps
+    using the still-valid one, so no request waits for the token endpoint.
+    Only when the token has actually expired do callers wait, and even then
+    a single refresh is performed for all of them.
+    """
+
+    def __init__(self, fetch_token: Callable[[], Tuple[str, float]], refresh_skew: float = 300,
+                 clock: Callable[[], float] = time.monotonic):
+        """
+        Initialize the token manager.
+
+        Args:
+            fetch_token (callable): Requests a new token, returning (access_token, expires_in_seconds).
+            refresh_skew (float): Seconds before expiry at which the token is refreshed proactively,
+                capped at half of each token's lifetime.
+            clock (callable): Monotonic clock in seconds (injectable for tests).
+        """
+        self.fetch_token = fetch_token
+        self.refresh_skew = refresh_skew
+        self.clock = clock
+        self.refresh_count = 0
+        self._lock = threading.Lock()
+        self._refresh_thread: Optional[threading.Thread] = None
+        # (token, headers, expiry, refresh time) on `clock`, swapped as one tuple
+        # so readers never see a torn state
+        self._state: Tuple[Optional[str], Optional[Dict[str, str]], float, float] = (None, None, 0.0, 0.0)
+
+    @property
+    def access_token(self) -> Optional[str]:
+        """The current access token, if any."""
+        return self._state[0]
+
+    @property
+    def expires_at(self) -> Optional[datetime]:
+        """Wall-clock expiry time of the current token, if any."""
+        token, _, expires_at, _ = self._state
+        if token is None:
+            return None
+        return datetime.now() + timedelta(seconds=expires_at - self.clock())
+
+    def invalidate(self) -> None:
+        """Forget the current token, e.g. after the server rejected it."""
+        with self._lock:
+            self._state = (None, None, 0.0, 0.0)
+
+    def get_headers(self) -> Dict[str, str]:
+        """
+        Get authentication headers with a valid token.
+
+        Returns:
+            Dict[str, str]: The cached header dict; callers must not modify it.
+        """
+        _, headers, expires_at, refresh_at = self._state
+        now = self.clock()
+
+        if headers is not None and now < refresh_at:
+            return headers
+
+        if headers is not None and now < expires_at:
+            # Still valid: refresh in the background unless a refresh is already running
+            if self._lock.acquire(blocking=False):
+                self._refresh_thread = threading.Thread(target=self._refresh_in_background,
+                                                        name="foreca-token-refresh", daemon=True)
+                self._refresh_thread.start()
+            return headers
+
+        with self._lock:
+            if self.clock() >= self._state[2]:
+                self._refresh(required=True)
+            return self._state[1]
+
+    def _refresh_in_background(self) -> None:
+        """Proactive refresh; runs on its own thread, which owns the lock until it is done."""
+        try:
+            if self.clock() >= self._state[3]:
+                self._refresh(required=False)
+        finally:
+            self._lock.release()
+
+    def _refresh(self, required: bool) -> None:
+        """Fetch a new token. Must be called with the lock held."""
+        try:
+            token, expires_in = self.fetch_token()
+        except Exception as e:
+            if required:
+                raise
+            logger.warning(f"Proactive token refresh failed, keeping the current token: {e}")
+            # Try again halfway to expiry rather than on the very next request
+            token, headers, expires_at, _ = self._state
+            now = self.clock()
+            self._state = (token, headers, expires_at, now + (expires_at - now) / 2)
+            return
+
+        headers = {
+            "Authorization": f"Bearer {token}",
+            "Content-Type": "application/json"
+        }
+        expires_at = self.clock() + expires_in
+        self._state = (token, headers, expires_at, expires_at - min(self.refresh_skew, expires_in / 2))
+        self.refresh_count += 1
@@ -0,0 +1,44 @@
+"""
+Foreca Client Benchmarks
+Times the client's request and parsing path against the local fake Foreca server.
+"""
+
+import pytest
+
+from api_integrations.fake_foreca_server import FakeForecaServer, hourly_records
+from api_integrations.foreca_weather_api import ForecaWeatherAPI
+from api_integrations.forecast_parsing import build_forecast_panel, parse_hourly_forecast
+from api_integrations.rate_limiter import TokenBucket
+
+
+@pytest.fixture(scope="module")
+def api():
+    with FakeForecaServer() as server:
+        client = ForecaWeatherAPI("bench", "bench", base_url=server.url,
+                                  rate_limiter=TokenBucket(rate=1e9, burst=1e9))
+        client.get_daily_forecast(0)  # authenticate and open the connection before timing
+        yield client
+
+
+def test_get_daily_forecast(measure, api):
+    measure(api.get_daily_forecast, 1, periods=14, n_rows=14)
+
+
+def test_get_hourly_forecast(measure, api):
+    measure(api.get_hourly_forecast, 1, periods=168, n_rows=168)
+
+
+@pytest.mark.parametrize("locations", [10, 100], ids=lambda n: f"{n}locations")
+def test_get_forecast_panel(measure, api, locations):
+    measure(api.get_forecast_panel, range(locations), kind="hourly", periods=168, n_rows=168 * locations)
+
+
+@pytest.mark.parametrize("compact", [False, True], ids=["float64", "float32"])
+def test_parse_hourly_records(measure, compact):
+    records = [record for location in range(100) for record in hourly_records(str(location), 168)]
+    measure(parse_hourly_forecast, records, compact=compact, n_rows=len(records))
+
+
+def test_build_hourly_panel(measure):
+    records = [(location, hourly_records(str(location), 168)) for location in range(100)]
+    measure(build_forecast_panel, records, "hourly", n_rows=168 * 100)
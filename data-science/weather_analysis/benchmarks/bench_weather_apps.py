@@ -0,0 +1,73 @@
+"""
+Weather Apps Benchmarks
+Times every WeatherApps method, the fused evaluation and run_all_weather_apps on synthetic forecasts and panels.
+"""
+
+import pandas as pd
+import pytest
+
+from forecast_schema import normalize_forecast
+from weather_apps import (WeatherApps, detect_alerts, plan_activities, plan_trips, recommend_outfits,
+                          run_all_weather_apps)
+
+
+class SyntheticForecastAPI:
+    """Serves one synthetic forecast for every location, so runs time the apps and not the network."""
+
+    def __init__(self, forecast_data: pd.DataFrame):
+        self.forecast_data = forecast_data
+
+    def get_daily_forecast(self, location_id, periods=7):
+        return self.forecast_data
+
+
+@pytest.fixture
+def apps():
+    return WeatherApps(None)
+
+
+@pytest.mark.parametrize("method", ["what_to_wear_app", "event_planner_app", "notification_bot_app",
+                                    "trends_visualizer_app"])
+def test_app_method(measure, apps, daily_forecast, n_rows, method):
+    measure(getattr(apps, method), daily_forecast, render=False, n_rows=n_rows)
+
+
+def test_travel_companion_app(measure, apps, daily_forecast, n_rows):
+    measure(apps.travel_companion_app, daily_forecast, render=False, n_rows=n_rows)
+
+
+def test_evaluate_all(measure, apps, daily_forecast, n_rows):
+    measure(apps.evaluate_all, daily_forecast, n_rows=n_rows)
+
+
+def test_evaluate_all_with_warm_row_cache(measure, daily_forecast, n_rows):
+    apps = WeatherApps(None, cache_size=max(n_rows, 1))
+    apps.evaluate_all(daily_forecast)
+    measure(apps.evaluate_all, daily_forecast, n_rows=n_rows)
+
+
+@pytest.mark.parametrize("fused", [False, True], ids=["sequential", "fused"])
+def test_run_all_weather_apps(measure, daily_forecast, n_rows, fused):
+    api = SyntheticForecastAPI(daily_forecast)
+    measure(run_all_weather_apps, api, 0, "Bench City", fused=fused, render=False, n_rows=n_rows)
+
+
+def test_run_all_weather_apps_with_figures(measure, daily_forecast, n_rows):
+    if n_rows > 10_000:
+        pytest.skip("figures are built for short forecasts only")
+    api = SyntheticForecastAPI(daily_forecast)
+    measure(run_all_weather_apps, api, 0, "Bench City", n_rows=n_rows)
+
+
+def test_normalize_hourly_to_daily(measure, hourly_forecast, n_rows):
+    measure(normalize_forecast, hourly_forecast, granularity="daily", n_rows=n_rows)
+
+
+@pytest.mark.parametrize("func", [recommend_outfits, plan_activities, detect_alerts, plan_trips],
+                         ids=lambda func: func.__name__)
+def test_panel_function(measure, forecast_panel, n_locations, func):
+    measure(func, forecast_panel, n_rows=len(forecast_panel))
+
+
+def test_panel_evaluate_all(measure, apps, forecast_panel, n_locations):
+    measure(apps.evaluate_all, forecast_panel, n_rows=len(forecast_panel))
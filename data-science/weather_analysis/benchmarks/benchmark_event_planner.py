@@ -0,0 +1,67 @@
+"""
+Event Planner Scoring Benchmark
+Times the vectorized activity scoring against the row-by-row reference on a synthetic forecast.
+
+Run from the weather_analysis directory:
+    python benchmarks/benchmark_event_planner.py --rows 1000000
+"""
+
+import argparse
+import os
+import sys
+import time
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from weather_apps import WeatherApps, plan_activities, score_activity_days
+
+
+def make_daily_forecast(n_rows: int, seed: int = 0) -> pd.DataFrame:
+    """Create a synthetic daily forecast frame with realistic value ranges."""
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame({
+        'date': pd.Timestamp('2024-01-01') + pd.to_timedelta(np.arange(n_rows) % 3650, unit='D'),
+        'maxTemp': rng.integers(-15, 45, n_rows),
+        'minTemp': rng.integers(-25, 30, n_rows),
+        'precipAccum': np.round(rng.uniform(0, 30, n_rows), 1) * (rng.random(n_rows) > 0.3),
+        'maxWindSpeed': rng.integers(0, 40, n_rows),
+    })
+
+
+def best_of(func, repeat: int) -> float:
+    """Best wall-clock time of `repeat` runs, in seconds."""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--reference-rows", type=int, default=20_000,
+                        help="rows timed with the slow reference loop (extrapolated to --rows)")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    forecast = make_daily_forecast(args.rows)
+    sample = forecast.head(args.reference_rows)
+    apps = WeatherApps(None)
+
+    score_time = best_of(lambda: score_activity_days(forecast), args.repeat)
+    table_time = best_of(lambda: plan_activities(forecast), args.repeat)
+    reference_time = best_of(lambda: apps._event_planner_reference(sample), 1) * args.rows / len(sample)
+
+    print(f"Event planner on {args.rows:,} rows")
+    print(f"  vectorized scores only     {score_time * 1000:10.1f} ms")
+    print(f"  vectorized full table      {table_time * 1000:10.1f} ms")
+    print(f"  iterrows reference (est.)  {reference_time * 1000:10.1f} ms")
+    print(f"  speedup (full table)       {reference_time / table_time:10.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""
+Forecast Parsing Benchmark
+Compares generic DataFrame construction with the typed column parser on synthetic hourly forecasts.
+
+Run from the weather_analysis directory:
+    python benchmarks/benchmark_forecast_parsing.py --locations 1000
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from api_integrations.forecast_parsing import parse_hourly_forecast
+
+
+def make_hourly_records(n_records: int, seed: int = 0):
+    """Create Foreca-style hourly forecast records."""
+    rng = random.Random(seed)
+    symbols = ["d000", "d100", "d200", "d300", "d210", "n000", "n100"]
+    directions = ["N", "NE", "E", "SE", "S", "SW", "W", "NW"]
+    start = pd.Timestamp("2024-01-01T00:00Z")
+    return [
+        {
+            "time": (start + pd.Timedelta(hours=i % 168)).strftime("%Y-%m-%dT%H:%M%z"),
+            "symbol": rng.choice(symbols),
+            "temperature": round(rng.uniform(-20, 40), 1),
+            "feelsLikeTemp": round(rng.uniform(-25, 45), 1),
+            "relHumidity": rng.randint(10, 100),
+            "dewPoint": round(rng.uniform(-25, 25), 1),
+            "windSpeed": rng.randint(0, 30),
+            "windDir": rng.randint(0, 359),
+            "windDirString": rng.choice(directions),
+            "windGust": rng.randint(0, 40),
+            "precipProb": rng.randint(0, 100),
+            "precipRate": round(rng.uniform(0, 10), 2),
+            "cloudiness": rng.randint(0, 100),
+            "thunderProb": rng.randint(0, 100),
+            "uvIndex": rng.randint(0, 11),
+            "pressure": round(rng.uniform(980, 1040), 1),
+            "visibility": rng.randint(1000, 50000),
+        }
+        for i in range(n_records)
+    ]
+
+
+def parse_generic(records):
+    """The previous parsing path: infer everything, then parse timestamps."""
+    df = pd.DataFrame(records)
+    df["time"] = pd.to_datetime(df["time"])
+    return df
+
+
+def measure(label, func, records, repeat):
+    """Time `func(records)` and report its best run and memory footprint."""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        df = func(records)
+        timings.append(time.perf_counter() - start)
+    memory_mb = df.memory_usage(deep=True).sum() / 1e6
+    print(f"{label:<22} {min(timings) * 1000:10.1f} ms {memory_mb:10.2f} MB")
+    return min(timings), memory_mb
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--locations", type=int, default=500, help="number of 168-hour forecasts")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    records = make_hourly_records(args.locations * 168)
+    print(f"Parsing {len(records):,} hourly records ({args.locations} locations x 168 hours)\n")
+    print(f"{'parser':<22} {'time':>13} {'memory':>13}")
+
+    generic_time, generic_mb = measure("generic DataFrame", parse_generic, records, args.repeat)
+    typed_time, typed_mb = measure("typed", parse_hourly_forecast, records, args.repeat)
+    compact_time, compact_mb = measure("typed (compact)", lambda r: parse_hourly_forecast(r, compact=True),
+                                       records, args.repeat)
+
+    print(f"\nTyped (compact) parsing: {generic_time / compact_time:.1f}x faster, "
+          f"{generic_mb / compact_mb:.1f}x less memory")
+
+
+if __name__ == "__main__":
+    main()
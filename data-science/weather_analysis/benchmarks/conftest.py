@@ -0,0 +1,121 @@
+"""
+Benchmark Fixtures
+Synthetic forecasts, forecast panels and timing helpers shared by the pytest-benchmark suite.
+
+Run from the weather_analysis directory:
+    python -m pytest benchmarks --benchmark-autosave
+    python -m pytest benchmarks --benchmark-compare --benchmark-compare-fail=mean:10%
+"""
+
+import os
+import sys
+import tracemalloc
+from functools import lru_cache
+import numpy as np
+import pandas as pd
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmark_event_planner import make_daily_forecast
+
+DEFAULT_ROWS = "7,10000,1000000"
+DEFAULT_LOCATIONS = "100,10000"
+
+
+def pytest_addoption(parser):
+    parser.addoption("--bench-rows", default=DEFAULT_ROWS,
+                     help=f"comma-separated forecast sizes in rows (default: {DEFAULT_ROWS})")
+    parser.addoption("--bench-locations", default=DEFAULT_LOCATIONS,
+                     help=f"comma-separated panel sizes in locations (default: {DEFAULT_LOCATIONS})")
+
+
+def _sizes(config, option: str):
+    return [int(size) for size in config.getoption(option).split(",") if size]
+
+
+def pytest_generate_tests(metafunc):
+    if "n_rows" in metafunc.fixturenames:
+        sizes = _sizes(metafunc.config, "--bench-rows")
+        metafunc.parametrize("n_rows", sizes, ids=[f"{size}rows" for size in sizes])
+    if "n_locations" in metafunc.fixturenames:
+        sizes = _sizes(metafunc.config, "--bench-locations")
+        metafunc.parametrize("n_locations", sizes, ids=[f"{size}locations" for size in sizes])
+
+
+@lru_cache(maxsize=None)
+def _daily_forecast(n_rows: int) -> pd.DataFrame:
+    return make_daily_forecast(n_rows)
+
+
+@lru_cache(maxsize=None)
+def _forecast_panel(n_locations: int, n_days: int) -> pd.DataFrame:
+    panel = make_daily_forecast(n_locations * n_days, seed=1)
+    panel['date'] = np.tile(pd.date_range('2024-01-01', periods=n_days, freq='D'), n_locations)
+    panel.insert(0, 'location_id', np.repeat(np.arange(n_locations), n_days))
+    return panel.set_index(['location_id', 'date'])
+
+
+@lru_cache(maxsize=None)
+def _hourly_forecast(n_rows: int) -> pd.DataFrame:
+    rng = np.random.default_rng(2)
+    return pd.DataFrame({
+        'time': pd.date_range('2024-01-01', periods=n_rows, freq='h', tz='UTC'),
+        'temperature': np.round(10 + 8 * np.sin(np.arange(n_rows) * 2 * np.pi / 24) + rng.normal(0, 3, n_rows), 1),
+        'windSpeed': rng.integers(0, 40, n_rows).astype(float),
+        'precipAccum': np.round(rng.uniform(0, 4, n_rows), 1) * (rng.random(n_rows) > 0.7),
+    })
+
+
+@pytest.fixture
+def daily_forecast(n_rows):
+    """Synthetic daily forecast with `n_rows` rows (generated once per size)."""
+    return _daily_forecast(n_rows)
+
+
+@pytest.fixture
+def hourly_forecast(n_rows):
+    """Synthetic forecast in the hourly endpoint schema with `n_rows` hours."""
+    return _hourly_forecast(n_rows)
+
+
+@pytest.fixture
+def forecast_panel(n_locations):
+    """Synthetic 7-day forecast panel indexed by (location_id, date)."""
+    return _forecast_panel(n_locations, 7)
+
+
+def rounds_for(n_rows: int) -> int:
+    """Fewer timed rounds for larger inputs, so the 1M-row cases stay within a few seconds each."""
+    if n_rows <= 1_000:
+        return 50
+    if n_rows <= 100_000:
+        return 10
+    return 3
+
+
+def peak_memory(func, *args, **kwargs) -> int:
+    """Peak traced allocation, in bytes, of one call to `func`."""
+    tracemalloc.start()
+    try:
+        func(*args, **kwargs)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+@pytest.fixture
+def measure(benchmark):
+    """
+    Time a call with pytest-benchmark and record its memory peak.
+
+    Use as measure(func, *args, n_rows=..., **kwargs). The peak of one extra,
+    untimed call is stored in the benchmark's extra_info (peak_memory_mb),
+    so it is saved with --benchmark-autosave and shown in comparisons.
+    """
+    def run(func, *args, n_rows: int = 1, **kwargs):
+        result = benchmark.pedantic(func, args, kwargs, rounds=rounds_for(n_rows), iterations=1, warmup_rounds=1)
+        benchmark.extra_info['rows'] = n_rows
+        benchmark.extra_info['peak_memory_mb'] = round(peak_memory(func, *args, **kwargs) / 2 ** 20, 3)
+        return result
+    return run
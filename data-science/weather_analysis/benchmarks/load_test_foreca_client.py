@@ -0,0 +1,176 @@
+"""
+Foreca Client Load Test
+Drives ForecaWeatherAPI at increasing concurrency against the local fake Foreca server and reports
+throughput and p50/p99 latency per level.
+
+Run from the weather_analysis directory:
+    python benchmarks/load_test_foreca_client.py --concurrency 1,4,16,64 --latency 0.02
+    python benchmarks/load_test_foreca_client.py --rate-limit 100 --retry-after 0.5 --endpoint hourly
+
+The local server shares the client's process (and GIL) and caps throughput at high concurrency.
+Start it separately to measure the client alone:
+    python -m api_integrations.fake_foreca_server --port 8080 --latency 0.02
+    python benchmarks/load_test_foreca_client.py --url http://127.0.0.1:8080
+"""
+
+import argparse
+import logging
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Optional
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from api_integrations.fake_foreca_server import FakeForecaServer
+from api_integrations.foreca_weather_api import ForecaWeatherAPI
+from api_integrations.rate_limiter import TokenBucket
+from api_integrations.retry_policy import RetryPolicy
+
+# One request per call; returns whether the client got data back
+ENDPOINTS: Dict[str, Callable[[ForecaWeatherAPI, int], bool]] = {
+    "daily": lambda api, i: not api.get_daily_forecast(i % 1000, periods=14).empty,
+    "hourly": lambda api, i: not api.get_hourly_forecast(i % 1000, periods=168).empty,
+    "current": lambda api, i: bool(api.get_current_conditions(i % 1000)),
+    "search": lambda api, i: bool(api.search_location("Paris")),
+    "airquality": lambda api, i: not api.get_air_quality(i % 1000).empty,
+    "history": lambda api, i: not api.get_weather_history(i % 1000, "2024-01-01", "2024-01-07").empty,
+    "map": lambda api, i: bool(api.get_weather_maps("temperature", 51.5, -0.1)),
+}
+
+
+def _timed(call: Callable[[ForecaWeatherAPI, int], bool], api: ForecaWeatherAPI, i: int):
+    start = time.perf_counter()
+    try:
+        ok = call(api, i)
+    except Exception:
+        ok = False
+    return time.perf_counter() - start, ok
+
+
+def run_level(api: ForecaWeatherAPI, call: Callable[[ForecaWeatherAPI, int], bool], concurrency: int,
+              n_requests: int) -> Dict:
+    """
+    Send `n_requests` calls through `concurrency` threads and summarize their latencies.
+
+    Args:
+        api (ForecaWeatherAPI): Client to drive (its pool should hold `concurrency` connections).
+        call (callable): One API call, given the client and the request number.
+        concurrency (int): Number of threads calling at the same time.
+        n_requests (int): Number of calls.
+
+    Returns:
+        Dict: Throughput (successful calls per second), error count and latency percentiles in ms.
+    """
+    wait_before = api.rate_limiter.total_wait
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        results = list(pool.map(lambda i: _timed(call, api, i), range(n_requests)))
+    elapsed = time.perf_counter() - start
+
+    latencies = np.array([latency for latency, _ in results]) * 1000
+    succeeded = sum(ok for _, ok in results)
+    return {
+        "concurrency": concurrency,
+        "requests": n_requests,
+        "errors": n_requests - succeeded,
+        "throughput_rps": succeeded / elapsed,
+        "p50_ms": np.percentile(latencies, 50),
+        "p99_ms": np.percentile(latencies, 99),
+        "max_ms": latencies.max(),
+        "limiter_wait_s": api.rate_limiter.total_wait - wait_before,
+    }
+
+
+def run_load_test(base_url: str, endpoint: str, levels, n_requests: int, client_rate: Optional[float] = None,
+                  retry_policy: Optional[RetryPolicy] = None, server: Optional[FakeForecaServer] = None,
+                  username: str = "load", password: str = "test") -> pd.DataFrame:
+    """
+    Run one load level per concurrency, each with a fresh client whose pool matches the concurrency.
+
+    Args:
+        base_url (str): API (and map) base URL.
+        endpoint (str): Key of ENDPOINTS to call.
+        levels: Concurrency levels, in order.
+        n_requests (int): Calls per level.
+        client_rate (float, optional): Client-side requests per second; unlimited if omitted.
+        retry_policy (RetryPolicy, optional): Client retry policy; the client default if omitted.
+        server (FakeForecaServer, optional): Local server whose response statuses are reported per level.
+        username (str): API username.
+        password (str): API password.
+
+    Returns:
+        pd.DataFrame: One row per level (see run_level), plus 429/5xx counts when `server` is given.
+    """
+    call = ENDPOINTS[endpoint]
+    rows = []
+    for concurrency in levels:
+        limiter = TokenBucket(rate=client_rate, burst=1) if client_rate else TokenBucket(rate=1e9, burst=1e9)
+        api = ForecaWeatherAPI(username, password, base_url=base_url, map_url=base_url, rate_limiter=limiter,
+                               retry_policy=retry_policy, pool_maxsize=concurrency)
+        api._authenticate()  # keep the token request out of the timings
+        if server is not None:
+            server.reset_stats()
+
+        row = run_level(api, call, concurrency, n_requests)
+        if server is not None:
+            statuses = server.stats()["statuses"]
+            row["http_429"] = statuses.get(429, 0)
+            row["http_5xx"] = sum(count for status, count in statuses.items() if status >= 500)
+        rows.append(row)
+        api.session.close()
+    return pd.DataFrame(rows)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--endpoint", choices=sorted(ENDPOINTS), default="daily")
+    parser.add_argument("--concurrency", default="1,2,4,8,16,32", help="comma-separated concurrency levels")
+    parser.add_argument("--requests", type=int, default=500, help="requests per concurrency level")
+    parser.add_argument("--url", help="base URL of an already running server (default: start a local fake)")
+    parser.add_argument("--latency", type=float, default=0.01, help="fake server latency in seconds")
+    parser.add_argument("--jitter", type=float, default=0.0, help="fake server random extra latency in seconds")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="fraction of fake server 503 responses")
+    parser.add_argument("--throttle-rate", type=float, default=0.0, help="fraction of fake server 429 responses")
+    parser.add_argument("--rate-limit", type=float, help="fake server requests per second before 429s")
+    parser.add_argument("--retry-after", type=float, default=1.0, help="Retry-After seconds sent with 429s")
+    parser.add_argument("--client-rate", type=float, help="client-side rate limit in requests per second")
+    parser.add_argument("--max-attempts", type=int, default=4, help="client attempts per request")
+    parser.add_argument("--backoff", type=float, default=0.1, help="client backoff factor in seconds")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--verbose", action="store_true", help="log every client request and retry")
+    args = parser.parse_args()
+
+    if not args.verbose:
+        logging.getLogger("api_integrations.foreca_weather_api").setLevel(logging.ERROR)
+        logging.getLogger("api_integrations.token_manager").setLevel(logging.ERROR)
+
+    levels = [int(level) for level in args.concurrency.split(",") if level]
+    retry_policy = RetryPolicy(max_attempts=args.max_attempts, backoff_factor=args.backoff)
+
+    if args.url:
+        server = None
+        base_url = args.url
+    else:
+        server = FakeForecaServer(latency=args.latency, jitter=args.jitter, error_rate=args.error_rate,
+                                  throttle_rate=args.throttle_rate, rate_limit=args.rate_limit,
+                                  retry_after=args.retry_after, seed=args.seed)
+        server.start()
+        base_url = server.url
+
+    try:
+        report = run_load_test(base_url, args.endpoint, levels, args.requests, args.client_rate,
+                               retry_policy, server)
+    finally:
+        if server is not None:
+            server.stop()
+
+    print(f"Load test: {args.requests} '{args.endpoint}' requests per level against {base_url}")
+    print(report.to_string(index=False, float_format=lambda value: f"{value:.1f}"))
+
+
+if __name__ == "__main__":
+    main()
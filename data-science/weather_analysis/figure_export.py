@@ -0,0 +1,209 @@
+"""
+Figure Export
+Renders the figures of weather app results to static image files (PNG, SVG, ...) in parallel.
+Requires the optional `kaleido` package; kaleido 1.0 and later also needs Chrome (`kaleido_get_chrome`).
+"""
+
+import logging
+import os
+import re
+import time
+from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Iterator, List, Optional, Set, Tuple
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+# Figure keys of a run_all_weather_apps results dict; trend_figs holds a list of figures
+FIGURE_KEYS = ("outfit_fig", "event_fig", "alert_fig", "packing_fig", "trend_figs", "global_fig")
+
+
+def _slug(name: str) -> str:
+    """File-system friendly version of a city name."""
+    return re.sub(r"[^A-Za-z0-9_-]+", "_", name).strip("_") or "city"
+
+
+def _unique_slug(name: str, used: Set[str]) -> str:
+    """Slug of a name, numbered (_2, _3, ...) if an earlier name already took it; records it in `used`."""
+    base = slug = _slug(name)
+    n = 1
+    while slug in used:
+        n += 1
+        slug = f"{base}_{n}"
+    used.add(slug)
+    return slug
+
+
+def iter_figures(results: Mapping) -> Iterator[Tuple[str, object]]:
+    """
+    Yield (name, figure) for every figure in a results dict.
+
+    Trend charts are numbered (trend_1, trend_2, ...) and missing figures,
+    such as alert_fig on a day without alerts, are skipped. Unbuilt figures
+    of a WeatherAppsResult are yielded as LazyFigures, so they are built by
+    whoever renders them rather than here.
+    """
+    lazy = results.lazy_figures() if hasattr(results, "lazy_figures") else {}
+    for key in FIGURE_KEYS:
+        if key not in results:
+            continue
+        figure = lazy[key] if key in lazy else results[key]
+        if key == "trend_figs":
+            for i, trend in enumerate(figure or [], 1):
+                yield f"trend_{i}", trend
+        elif figure is not None:
+            yield key[:-len("_fig")], figure
+
+
+def _write_image(fig, path: str, format: str, scale: float, width: Optional[int], height: Optional[int]) -> None:
+    """Render one figure with kaleido (through the shared server when it is running)."""
+    fig.write_image(path, format=format, scale=scale, width=width, height=height)
+
+
+class FigureExporter:
+    """
+    Exports app figures with a persistent renderer.
+
+    Starting Chrome is most of the cost of a one-off kaleido export, so the
+    exporter starts one kaleido server with `workers` render tabs, keeps it
+    running for every export until `close()`, and feeds it from a thread
+    pool. Use it as a context manager:
+
+        with FigureExporter(format="png", workers=4) as exporter:
+            timings = exporter.export_many(results_by_city, "digest/")
+    """
+
+    def __init__(self, format: str = "png", scale: float = 1, width: Optional[int] = None,
+                 height: Optional[int] = None, workers: int = 4, writer: Optional[Callable] = None):
+        """
+        Initialize the exporter.
+
+        Args:
+            format (str): Image format ("png", "svg", "jpeg", "webp" or "pdf").
+            scale (float): Scale factor for raster images.
+            width (int, optional): Image width in pixels (the figure's own width if omitted).
+            height (int, optional): Image height in pixels (the figure's own height if omitted).
+            workers (int): Number of figures rendered at the same time.
+            writer (callable, optional): Called as writer(fig, path, format, scale, width, height);
+                defaults to kaleido.
+        """
+        self.format = format
+        self.scale = scale
+        self.width = width
+        self.height = height
+        self.workers = workers
+        self.writer = writer or _write_image
+        self._server_started = False
+
+    def start(self) -> None:
+        """Start the persistent kaleido server (only for the default kaleido writer)."""
+        if self._server_started or self.writer is not _write_image:
+            return
+        try:
+            import kaleido
+        except ImportError as e:
+            raise ImportError("Exporting figures requires kaleido: pip install kaleido") from e
+
+        if hasattr(kaleido, "start_sync_server"):
+            kaleido.start_sync_server(n=self.workers, silence_warnings=True)
+            self._server_started = True
+        else:
+            # kaleido < 1.0 keeps its own single renderer process and is not thread-safe
+            logger.info("kaleido has no shared server; rendering figures one at a time")
+            self.workers = 1
+
+    def close(self) -> None:
+        """Stop the kaleido server if this exporter started it."""
+        if self._server_started:
+            import kaleido
+            kaleido.stop_sync_server(silence_warnings=True)
+            self._server_started = False
+
+    def __enter__(self) -> "FigureExporter":
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def _render(self, city_name: str, name: str, figure, path: str) -> Optional[Dict]:
+        """Render one figure and time it (None if a LazyFigure turns out to have no figure)."""
+        start = time.perf_counter()
+        error = None
+        try:
+            figure = getattr(figure, "figure", figure)  # build LazyFigures here, in the worker
+            if figure is None:
+                return None
+            self.writer(figure, path, self.format, self.scale, self.width, self.height)
+        except Exception as e:
+            logger.error(f"Exporting {name} for {city_name} failed: {e}")
+            error = str(e)
+        return {
+            "city_name": city_name,
+            "figure": name,
+            "path": path,
+            "seconds": time.perf_counter() - start,
+            "error": error,
+        }
+
+    def export_many(self, results_by_city: Mapping, directory: str) -> pd.DataFrame:
+        """
+        Export every figure of many results dicts, one sub-directory per city.
+
+        Cities whose names map to the same directory name (e.g. "St. Louis"
+        and "St Louis") get numbered directories (St_Louis, St_Louis_2, ...)
+        instead of overwriting each other's files.
+
+        Args:
+            results_by_city (Mapping): City name -> results dict (e.g. from run_weather_apps_for_cities).
+            directory (str): Output directory.
+
+        Returns:
+            pd.DataFrame: One row per figure with city_name, figure, path, seconds and
+            error (None if the export succeeded).
+        """
+        self.start()
+        jobs = []
+        used: Set[str] = set()
+        for city_name, results in results_by_city.items():
+            city_dir = os.path.join(directory, _unique_slug(city_name, used))
+            os.makedirs(city_dir, exist_ok=True)
+            for name, figure in iter_figures(results):
+                jobs.append((city_name, name, figure, os.path.join(city_dir, f"{name}.{self.format}")))
+
+        with ThreadPoolExecutor(max_workers=self.workers) as pool:
+            timings: List[Dict] = [timing for timing in pool.map(lambda job: self._render(*job), jobs)
+                                   if timing is not None]
+
+        failed = sum(timing["error"] is not None for timing in timings)
+        logger.info(f"Exported {len(timings) - failed} of {len(timings)} figures to {directory}")
+        return pd.DataFrame(timings, columns=["city_name", "figure", "path", "seconds", "error"])
+
+    def export(self, results: Mapping, directory: str) -> pd.DataFrame:
+        """Export every figure of one results dict (see export_many)."""
+        return self.export_many({results.get("city_name", "city"): results}, directory)
+
+
+def export_figures(results: Mapping, directory: str, format: str = "png", workers: int = 4,
+                   **options) -> pd.DataFrame:
+    """
+    Export the figures of one results dict, or of a mapping of city name -> results dict.
+
+    Starts a renderer for this call only; keep a FigureExporter open instead
+    when exporting repeatedly.
+
+    Args:
+        results (Mapping): A results dict, or many of them keyed by city name.
+        directory (str): Output directory (one sub-directory per city).
+        format (str): Image format ("png", "svg", ...).
+        workers (int): Number of figures rendered at the same time.
+        **options: Further FigureExporter options (scale, width, height, writer).
+
+    Returns:
+        pd.DataFrame: Per-figure timings (see FigureExporter.export_many).
+    """
+    with FigureExporter(format=format, workers=workers, **options) as exporter:
+        if any(key in results for key in FIGURE_KEYS):
+            return exporter.export(results, directory)
+        return exporter.export_many(results, directory)
@@ -0,0 +1,102 @@
+"""
+Forecast Schema
+Maps hourly Foreca forecasts onto the app schema (date, maxTemp, minTemp, precipAccum, maxWindSpeed).
+"""
+
+from typing import Dict, Optional
+import pandas as pd
+
+GRANULARITIES = ("daily", "hourly")
+
+# How dates are shown in the app tables and alerts at each granularity
+DATE_FORMATS: Dict[str, str] = {
+    "daily": "%Y-%m-%d",
+    "hourly": "%Y-%m-%d %H:%M",
+}
+
+# Hourly field -> app column. A single hourly temperature is both the high and the low of its hour.
+HOURLY_COLUMNS: Dict[str, str] = {
+    "time": "date",
+    "temperature": "maxTemp",
+    "windSpeed": "maxWindSpeed",
+    "windGust": "maxWindGust",
+}
+
+# How hourly app columns are aggregated to days
+HOURLY_TO_DAILY: Dict[str, str] = {
+    "maxTemp": "max",
+    "minTemp": "min",
+    "precipAccum": "sum",
+    "maxWindSpeed": "max",
+    "maxWindGust": "max",
+    "precipProb": "max",
+    "uvIndex": "max",
+}
+
+
+def forecast_granularity(forecast_data: pd.DataFrame) -> str:
+    """
+    Granularity of a forecast: "hourly" for the hourly endpoint schema or
+    frames normalized at hourly granularity, "daily" otherwise.
+    """
+    granularity = forecast_data.attrs.get("granularity")
+    if granularity in GRANULARITIES:
+        return granularity
+    columns = set(forecast_data.columns) | set(forecast_data.index.names)
+    return "hourly" if "time" in columns and "temperature" in columns else "daily"
+
+
+def _hourly_to_app_schema(hourly: pd.DataFrame) -> pd.DataFrame:
+    """Rename the hourly endpoint fields to app columns, one row per hour."""
+    if "precipAccum" not in hourly.columns and "precipRate" in hourly.columns:
+        # The rate in mm/h is the hour's accumulation
+        hourly = hourly.rename(columns={"precipRate": "precipAccum"})
+    normalized = hourly.rename(columns=HOURLY_COLUMNS)
+    if "maxTemp" in normalized.columns:
+        normalized.insert(normalized.columns.get_loc("maxTemp") + 1, "minTemp", normalized["maxTemp"])
+    return normalized
+
+
+def normalize_forecast(forecast_data: pd.DataFrame, granularity: Optional[str] = None) -> pd.DataFrame:
+    """
+    Bring a daily or hourly forecast into the app schema.
+
+    Daily forecasts pass through unchanged. Hourly forecasts are either kept
+    one row per hour (temperature becomes both maxTemp and minTemp,
+    windSpeed becomes maxWindSpeed) or aggregated to days with a single
+    groupby on the timestamps floored to the day (per location_id for
+    panels). The result records its granularity in `attrs["granularity"]`.
+
+    Args:
+        forecast_data (pd.DataFrame): A forecast from get_daily_forecast or get_hourly_forecast,
+            or a forecast panel of either kind.
+        granularity (str, optional): "daily" or "hourly"; the forecast's own granularity if omitted.
+
+    Returns:
+        pd.DataFrame: The forecast in the app schema, with index levels turned into columns.
+    """
+    if granularity not in (None,) + GRANULARITIES:
+        raise ValueError("granularity must be 'daily' or 'hourly'")
+
+    source = forecast_granularity(forecast_data)
+    if isinstance(forecast_data.index, pd.MultiIndex) or forecast_data.index.name == "time":
+        forecast_data = forecast_data.reset_index()
+    if source == "daily":
+        if granularity == "hourly":
+            raise ValueError("a daily forecast cannot be used at hourly granularity")
+        return forecast_data
+
+    if "time" in forecast_data.columns:
+        forecast_data = _hourly_to_app_schema(forecast_data)
+    if granularity in (None, "hourly"):
+        forecast_data.attrs["granularity"] = "hourly"
+        return forecast_data
+
+    keys = [forecast_data["date"].dt.floor("D")]
+    if "location_id" in forecast_data.columns:
+        keys.insert(0, "location_id")
+    aggregations = {column: (column, how) for column, how in HOURLY_TO_DAILY.items()
+                    if column in forecast_data.columns}
+    daily = forecast_data.groupby(keys, sort=True, observed=True).agg(**aggregations).reset_index()
+    daily.attrs["granularity"] = "daily"
+    return daily
@@ -0,0 +1,138 @@
+"""
+Row Result Cache
+A bounded, array-backed LRU cache of per-row results keyed by 64-bit row hashes.
+"""
+
+import threading
+from typing import Dict, Tuple
+import numpy as np
+import pandas as pd
+
+
+def hash_rows(frame: pd.DataFrame) -> np.ndarray:
+    """
+    One uint64 hash per row of `frame`, from its values, column names and
+    dtypes (not its index), so equal values under different columns or
+    dtypes get different keys.
+    """
+    schema = "|".join(f"{name}:{dtype}" for name, dtype in frame.dtypes.items())
+    salt = pd.util.hash_array(np.array([schema], dtype=object))[0]
+    return pd.util.hash_pandas_object(frame, index=False).to_numpy() ^ salt
+
+
+class RowResultCache:
+    """
+    Cache of per-row results for whole batches of rows at a time.
+
+    Keys are kept in one sorted uint64 array and each cached field in an
+    aligned array, so a batch lookup is a single `searchsorted` and inserting
+    a batch is one concatenate-and-sort. When the cache grows past
+    `max_rows`, the least recently used rows are evicted. All methods are
+    thread-safe.
+    """
+
+    def __init__(self, max_rows: int):
+        """
+        Initialize an empty cache.
+
+        Args:
+            max_rows (int): Maximum number of rows kept.
+        """
+        if max_rows <= 0:
+            raise ValueError("max_rows must be positive")
+        self.max_rows = max_rows
+        self.hits = 0
+        self.misses = 0
+        self._keys = np.empty(0, dtype=np.uint64)
+        self._last_used = np.empty(0, dtype=np.int64)
+        self._values: Dict[str, np.ndarray] = {}
+        self._clock = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def lookup(self, hashes: np.ndarray) -> Tuple[np.ndarray, Dict[str, np.ndarray]]:
+        """
+        Look up a batch of row hashes.
+
+        Args:
+            hashes (np.ndarray): uint64 row hashes.
+
+        Returns:
+            Tuple: (hit mask, cached values of the hit rows by field name).
+        """
+        with self._lock:
+            return self._lookup(hashes)
+
+    def _lookup(self, hashes: np.ndarray) -> Tuple[np.ndarray, Dict[str, np.ndarray]]:
+        self._clock += 1
+        if not len(self._keys):
+            self.misses += len(hashes)
+            return np.zeros(len(hashes), dtype=bool), {}
+
+        # Searching in sorted order keeps the binary searches cache-friendly on large batches
+        order = np.argsort(hashes)
+        positions = np.empty(len(hashes), dtype=np.intp)
+        positions[order] = np.searchsorted(self._keys, hashes[order])
+        positions[positions == len(self._keys)] = 0
+        hit = self._keys[positions] == hashes
+        found = positions[hit]
+        self._last_used[found] = self._clock
+
+        n_hits = int(hit.sum())
+        self.hits += n_hits
+        self.misses += len(hashes) - n_hits
+        return hit, {name: values[found] for name, values in self._values.items()}
+
+    def insert(self, hashes: np.ndarray, values: Dict[str, np.ndarray]) -> None:
+        """
+        Add the results of a batch of rows that were not in the cache.
+
+        Args:
+            hashes (np.ndarray): uint64 row hashes.
+            values (Dict[str, np.ndarray]): One array per field, aligned with `hashes`.
+        """
+        with self._lock:
+            self._insert(hashes, values)
+
+    def _insert(self, hashes: np.ndarray, values: Dict[str, np.ndarray]) -> None:
+        hashes, first = np.unique(hashes, return_index=True)
+        if len(self._keys):
+            new = self._keys[np.minimum(np.searchsorted(self._keys, hashes), len(self._keys) - 1)] != hashes
+            hashes, first = hashes[new], first[new]
+        if not len(hashes):
+            return
+
+        if not self._values:
+            self._values = {name: array[:0] for name, array in values.items()}
+        keys = np.concatenate([self._keys, hashes])
+        last_used = np.concatenate([self._last_used, np.full(len(hashes), self._clock, dtype=np.int64)])
+        columns = {name: np.concatenate([self._values[name], values[name][first]]) for name in self._values}
+
+        if len(keys) > self.max_rows:
+            keep = np.argpartition(last_used, len(keys) - self.max_rows)[len(keys) - self.max_rows:]
+        else:
+            keep = np.arange(len(keys))
+        keep = keep[np.argsort(keys[keep])]
+
+        self._keys = keys[keep]
+        self._last_used = last_used[keep]
+        self._values = {name: array[keep] for name, array in columns.items()}
+
+    def clear(self) -> None:
+        """Remove every cached row."""
+        with self._lock:
+            self._keys = np.empty(0, dtype=np.uint64)
+            self._last_used = np.empty(0, dtype=np.int64)
+            self._values = {}
+
+    def stats(self) -> Dict[str, float]:
+        """Hit/miss counters (in rows), the resulting hit ratio and the current size."""
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": self.hits / total if total else 0.0,
+            "rows": len(self._keys),
+        }
@@ -0,0 +1,618 @@
+"""
+Test script for the Foreca Weather API client
+These tests replace the HTTP session with a fake one, or talk to a local fake server,
+so no credentials or network are needed.
+"""
+
+import asyncio
+import logging
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+import pandas as pd
+import pytest
+import requests
+from api_integrations.fake_foreca_server import FakeForecaServer
+from api_integrations.foreca_weather_api import ForecaWeatherAPI, create_session
+from api_integrations.foreca_async import AsyncForecaWeatherAPI
+from api_integrations.forecast_parsing import parse_daily_forecast, parse_hourly_forecast
+from api_integrations.forecast_storage import load_forecast, write_forecast
+from api_integrations.rate_limiter import FileTokenBucket, TokenBucket
+from api_integrations.response_cache import MemoryResponseCache, ResponseCache, SQLiteResponseCache
+from api_integrations.retry_policy import RetryPolicy
+from api_integrations.token_manager import TokenManager
+from weather_apps import recommend_outfits
+
+
+class FakeResponse:
+    """Minimal stand-in for requests.Response."""
+
+    def __init__(self, payload, status_code=200, headers=None):
+        self.payload = payload
+        self.status_code = status_code
+        self.headers = headers or {}
+        self.content = b""
+
+    def json(self):
+        return self.payload
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise requests.exceptions.HTTPError(f"{self.status_code} error", response=self)
+
+
+class FakeSession:
+    """Records requests and serves canned Foreca-style payloads."""
+
+    def __init__(self, failures=None):
+        self.lock = threading.Lock()
+        self.gets = []
+        self.posts = []
+        self.timeouts = []
+        self.failures = list(failures or [])  # responses/exceptions served before the real payloads
+
+    def request(self, method, url, **kwargs):
+        with self.lock:
+            failure = self.failures.pop(0) if self.failures else None
+        if isinstance(failure, Exception):
+            with self.lock:
+                self.gets.append((url, kwargs.get("params")))
+            raise failure
+        if failure is not None:
+            with self.lock:
+                self.gets.append((url, kwargs.get("params")))
+            return failure
+        with self.lock:
+            self.timeouts.append(kwargs.get("timeout"))
+        if method == "POST":
+            return self.post(url, **kwargs)
+        return self.get(url, **kwargs)
+
+    def post(self, url, json=None, **kwargs):
+        with self.lock:
+            self.posts.append(url)
+        return FakeResponse({"access_token": "token", "expires_in": 7200})
+
+    def get(self, url, headers=None, params=None, **kwargs):
+        with self.lock:
+            self.gets.append((url, params))
+        if "/airquality/" in url:
+            return FakeResponse({"airquality": [{"time": "2024-01-01T00:00Z", "AQI": 20}]})
+        if "/current/" in url:
+            return FakeResponse({"current": {"time": "2024-01-01T12:00Z", "temperature": 21.5, "symbol": "d100"}})
+        if "/observation/history/" in url:
+            start = (params or {}).get("start", "2024-01-01")
+            return FakeResponse({"observations": [{"time": f"{start}T00:00Z", "temperature": 4}]})
+        location_id = int(re.search(r"/(\d+)$", url).group(1))
+        periods = (params or {}).get("periods", 1)
+        if "/forecast/daily/" in url:
+            forecast = [
+                {"date": f"2024-01-0{i + 1}", "maxTemp": location_id % 30 + i, "minTemp": i,
+                 "precipAccum": 0.5 * i, "maxWindSpeed": 3 + i}
+                for i in range(periods)
+            ]
+        else:
+            forecast = [
+                {"time": f"2024-01-01T{i:02d}:00Z", "temperature": location_id % 30 + i,
+                 "precipRate": 0.1 * i, "windSpeed": 2 + i}
+                for i in range(periods)
+            ]
+        return FakeResponse({"forecast": forecast})
+
+
+def make_client(**kwargs):
+    """Create an API client wired to a fake session."""
+    kwargs.setdefault("rate_limiter", TokenBucket(rate=10000, burst=10000))
+    api = ForecaWeatherAPI("user", "password", **kwargs)
+    api.session = FakeSession()
+    return api
+
+
+def test_async_daily_forecast_many_combines_locations():
+    api = make_client()
+    async_api = AsyncForecaWeatherAPI(api, max_concurrency=4)
+
+    df = asyncio.run(async_api.get_daily_forecast_many([101, 102, 103], periods=3))
+
+    assert list(df.columns[:2]) == ["location_id", "date"]
+    assert len(df) == 9
+    assert sorted(df["location_id"].unique()) == [101, 102, 103]
+    assert len(api.session.posts) == 1  # one shared token for all requests
+    assert len(api.session.gets) == 3
+
+
+def test_async_hourly_forecast_many_handles_empty_input():
+    api = make_client()
+    async_api = AsyncForecaWeatherAPI(api)
+
+    assert asyncio.run(async_api.get_hourly_forecast_many([])).empty
+
+    df = asyncio.run(async_api.get_hourly_forecast_many([7, 8], periods=5, tz="UTC"))
+    assert len(df) == 10
+    assert pd.api.types.is_datetime64_any_dtype(df["time"])
+
+
+class SlowSession(FakeSession):
+    """Fake session whose forecast requests take `delay` seconds and record how many overlap."""
+
+    def __init__(self, delay):
+        super().__init__()
+        self.delay = delay
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    def get(self, url, **kwargs):
+        with self.lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        time.sleep(self.delay)
+        with self.lock:
+            self.in_flight -= 1
+        return super().get(url, **kwargs)
+
+
+def test_async_fan_out_is_not_capped_by_the_default_executor():
+    api = make_client(pool_maxsize=40)
+    api.session = SlowSession(delay=0.2)
+    async_api = AsyncForecaWeatherAPI(api, max_concurrency=40)
+
+    start = time.perf_counter()
+    df = asyncio.run(async_api.get_daily_forecast_many(range(80), periods=2))
+    elapsed = time.perf_counter() - start
+
+    assert len(df) == 160
+    assert api.session.max_in_flight == 40  # above the default executor's min(32, cpus + 4)
+    assert elapsed < 2.0  # two waves of 0.2 s, not 80 / (cpus + 4) waves
+
+
+def test_cache_serves_repeated_forecasts_without_network(tmp_path):
+    cache = SQLiteResponseCache(str(tmp_path / "cache.sqlite"))
+    api = make_client(cache=cache)
+
+    first = api.get_daily_forecast(101, periods=3)
+    second = api.get_daily_forecast(101, periods=3)
+    api.get_daily_forecast(101, periods=5)
+
+    assert first.equals(second)
+    assert len(api.session.gets) == 2  # different params are a different key
+    assert cache.stats["hits"] == 1 and cache.stats["misses"] == 2
+
+    # A second client (e.g. another worker) sees the same persisted entries
+    other = make_client(cache=SQLiteResponseCache(str(tmp_path / "cache.sqlite")))
+    other.get_daily_forecast(101, periods=3)
+    assert other.session.gets == []
+
+
+def test_cache_expires_entries_and_evicts_least_recently_used():
+    cache = MemoryResponseCache(max_entries=2, ttls={"/forecast/": 60})
+    cache.set("https://x/forecast/1", None, {"a": 1})
+    cache.set("https://x/forecast/2", None, {"a": 2})
+    assert cache.get("https://x/forecast/1") == {"a": 1}
+
+    cache.set("https://x/forecast/3", None, {"a": 3})  # evicts /2, the least recently used
+    assert cache.get("https://x/forecast/2") is None
+    assert len(cache) == 2
+
+    cache.set("https://x/usage/1", None, {"a": 4})  # no TTL configured -> not cached
+    assert cache.get("https://x/usage/1") is None
+    assert cache.stats["hits"] == 1 and cache.stats["misses"] == 1  # uncached endpoints are not counted
+
+    with pytest.raises(TypeError):
+        ResponseCache()  # abstract
+
+    expired = MemoryResponseCache(ttls={"/forecast/": 60})
+    expired._store(expired.make_key("https://x/forecast/1"), {"a": 1}, 0)
+    assert expired.get("https://x/forecast/1") is None
+
+
+def test_sqlite_cache_bounds_size(tmp_path):
+    cache = SQLiteResponseCache(str(tmp_path / "cache.sqlite"), max_entries=3)
+    for i in range(5):
+        cache.set(f"https://x/forecast/daily/{i}", {"periods": 7}, {"forecast": [i]})
+    assert len(cache) == 3
+    assert cache.get("https://x/forecast/daily/4", {"periods": 7}) == {"forecast": [4]}
+    assert cache.get("https://x/forecast/daily/0", {"periods": 7}) is None
+
+
+def test_token_bucket_allows_burst_then_sustained_rate():
+    bucket = TokenBucket(rate=50, burst=5)
+    start = time.monotonic()
+    waits = [bucket.acquire() for _ in range(10)]
+    elapsed = time.monotonic() - start
+
+    assert waits[:5] == [0.0] * 5
+    assert elapsed >= 5 / 50 * 0.9
+    assert bucket.stats["acquisitions"] == 10
+    assert bucket.stats["total_wait"] > 0
+
+
+def test_token_bucket_is_shared_across_threads():
+    bucket = TokenBucket(rate=100, burst=1)
+    start = time.monotonic()
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        list(pool.map(lambda _: bucket.acquire(), range(20)))
+    assert time.monotonic() - start >= 19 / 100 * 0.9
+
+
+def test_file_token_bucket_shares_state_between_instances(tmp_path):
+    path = str(tmp_path / "bucket.state")
+    first = FileTokenBucket(path, rate=20, burst=2)
+    second = FileTokenBucket(path, rate=20, burst=2)
+
+    assert first.acquire() == 0.0
+    assert second.acquire() == 0.0
+    assert first.acquire() > 0  # the burst was used up by both instances together
+
+
+def test_client_requests_go_through_rate_limiter():
+    limiter = TokenBucket(rate=10000, burst=10000)
+    api = make_client(rate_limiter=limiter)
+    api.get_daily_forecast(1)
+    api.get_hourly_forecast(1)
+    assert limiter.stats["acquisitions"] == 3  # token request + two forecasts
+
+
+def test_default_limiter_leaves_forecast_lookups_unthrottled(caplog):
+    api = ForecaWeatherAPI("user", "password")
+    api.session = FakeSession()
+    api.get_daily_forecast(1)
+    api.get_current_conditions(1)
+    api.get_air_quality((60.1, 24.9))
+    assert api.rate_limiter.stats["acquisitions"] == 2  # token request + air quality
+
+    with caplog.at_level(logging.WARNING):
+        AsyncForecaWeatherAPI(api, max_concurrency=20)
+    assert "rate limiter" not in caplog.text
+    with caplog.at_level(logging.WARNING):
+        AsyncForecaWeatherAPI(make_client(rate_limiter=TokenBucket(rate=5)), max_concurrency=20)
+    assert "rate limiter (5 requests/s) is slower than max_concurrency" in caplog.text
+
+
+def test_retry_recovers_from_transient_errors_on_all_endpoints():
+    api = make_client(retry_policy=RetryPolicy(max_attempts=3, backoff_factor=0.001))
+    api._authenticate()
+    api.session.failures = [FakeResponse({}, 503), requests.exceptions.ConnectionError("reset")]
+    assert len(api.get_daily_forecast(1, periods=2)) == 2
+
+    api.session.failures = [FakeResponse({}, 502)]
+    assert not api.get_air_quality((60.1, 24.9)).empty
+
+    api.session.failures = [FakeResponse({}, 504)]
+    assert not api.get_weather_history("Helsinki", "2024-01-01", "2024-01-02").empty
+
+
+def test_retry_honors_retry_after_and_gives_up_on_fatal_errors():
+    api = make_client(retry_policy=RetryPolicy(max_attempts=3, backoff_factor=0.001))
+    api._authenticate()
+
+    api.session.failures = [FakeResponse({}, 429, headers={"Retry-After": "0.2"})]
+    start = time.monotonic()
+    assert len(api.get_daily_forecast(1, periods=1)) == 1
+    assert time.monotonic() - start >= 0.2
+
+    api.session.failures = [FakeResponse({}, 404)]
+    calls = len(api.session.gets)
+    assert api.get_daily_forecast(1).empty
+    assert len(api.session.gets) == calls + 1  # not retried
+
+    api.session.failures = [FakeResponse({}, 503)] * 3
+    assert api.get_daily_forecast(1).empty  # retries exhausted
+
+
+def test_retry_policy_respects_deadline_and_parses_retry_after():
+    policy = RetryPolicy(max_attempts=10, deadline=0.05)
+    api = make_client(retry_policy=policy)
+    api._authenticate()
+    api.session.failures = [FakeResponse({}, 503, headers={"Retry-After": "5"})]
+    start = time.monotonic()
+    assert api.get_daily_forecast(1).empty
+    assert time.monotonic() - start < 1
+
+    assert RetryPolicy.parse_retry_after("3") == 3.0
+    assert RetryPolicy.parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+    assert RetryPolicy.parse_retry_after("soon") is None
+    assert all(0 <= RetryPolicy(backoff_factor=1).backoff(n) <= 2 ** (n - 1) for n in range(1, 6))
+
+
+def test_session_pool_and_timeouts_are_configurable():
+    session = create_session(pool_maxsize=32, compress=False)
+    adapter = session.get_adapter("https://pfa.foreca.com")
+    assert adapter._pool_maxsize == 32
+    assert session.headers["Accept-Encoding"] == "identity"
+
+    shared = FakeSession()
+    first = ForecaWeatherAPI("user", "password", session=shared, timeout=(1, 5),
+                             rate_limiter=TokenBucket(rate=10000, burst=10000))
+    second = ForecaWeatherAPI("user", "password", session=shared,
+                              rate_limiter=TokenBucket(rate=10000, burst=10000))
+    first.get_daily_forecast(1)
+    second.get_daily_forecast(2)
+
+    assert first.session is second.session
+    assert shared.timeouts[:2] == [(1, 5), (1, 5)]
+    assert shared.timeouts[-1] == (3.05, 30)
+
+
+def test_token_manager_refreshes_once_for_concurrent_callers():
+    calls = []
+
+    def fetch_token():
+        calls.append(1)
+        time.sleep(0.05)
+        return f"token-{len(calls)}", 3600
+
+    manager = TokenManager(fetch_token, refresh_skew=60)
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        headers = list(pool.map(lambda _: manager.get_headers(), range(16)))
+
+    assert len(calls) == 1
+    assert all(h is headers[0] for h in headers)  # the cached dict is reused
+    assert headers[0]["Authorization"] == "Bearer token-1"
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_token_manager_refreshes_ahead_of_expiry_without_blocking():
+    clock = FakeClock()
+    release = threading.Event()
+    tokens = iter(["first", "second"])
+
+    def fetch_token():
+        token = next(tokens)
+        if token == "second":
+            release.wait(5)  # a slow token endpoint
+        return token, 100
+
+    manager = TokenManager(fetch_token, refresh_skew=60, clock=clock)
+    manager.get_headers()  # the 60s skew is capped at half the 100s lifetime
+    clock.now += 49
+    manager.get_headers()
+    assert manager.refresh_count == 1 and manager._refresh_thread is None
+
+    clock.now += 2  # inside the refresh window, token still valid
+    start = time.perf_counter()
+    assert manager.get_headers()["Authorization"] == "Bearer first"
+    assert manager.get_headers()["Authorization"] == "Bearer first"  # no second refresh thread
+    assert time.perf_counter() - start < 1  # callers did not wait for the token endpoint
+
+    release.set()
+    manager._refresh_thread.join(5)
+    assert manager.refresh_count == 2
+    assert manager.get_headers()["Authorization"] == "Bearer second"
+    assert manager.expires_at is not None
+
+
+def test_token_manager_keeps_valid_token_when_proactive_refresh_fails():
+    clock = FakeClock()
+    responses = iter([("old", 100)])
+
+    def fetch_token():
+        try:
+            return next(responses)
+        except StopIteration:
+            raise RuntimeError("token endpoint down")
+
+    manager = TokenManager(fetch_token, refresh_skew=60, clock=clock)
+    manager.get_headers()
+    clock.now += 60
+    assert manager.get_headers()["Authorization"] == "Bearer old"
+    manager._refresh_thread.join(5)
+    assert manager.get_headers()["Authorization"] == "Bearer old"
+    assert manager._state[3] == clock.now + 20  # retried halfway to expiry, not on every call
+
+    clock.now += 40  # expired: the refresh blocks and its error reaches the caller
+    with pytest.raises(RuntimeError):
+        manager.get_headers()
+
+
+def test_token_manager_does_not_refresh_short_lived_tokens_on_every_call():
+    manager = TokenManager(lambda: ("token", 120), refresh_skew=300)
+    for _ in range(10):
+        manager.get_headers()
+    assert manager.refresh_count == 1
+
+
+def test_client_authenticates_once_across_requests():
+    api = make_client()
+    for location_id in range(5):
+        api.get_daily_forecast(location_id)
+    assert len(api.session.posts) == 1
+    assert api.access_token == "token"
+
+
+def test_typed_parser_builds_compact_columns():
+    records = [
+        {"time": "2024-01-01T00:00+02:00", "symbol": "d000", "temperature": 3.5, "relHumidity": 80,
+         "windDirString": "N", "precipRate": 0.1},
+        {"time": "2024-01-01T01:00+02:00", "symbol": "d100", "temperature": 2.5, "relHumidity": 85,
+         "windDirString": "NE", "precipRate": 0},
+    ]
+    df = parse_hourly_forecast(records, compact=True)
+
+    assert str(df["temperature"].dtype) == "float32"
+    assert str(df["relHumidity"].dtype) == "int16"
+    assert isinstance(df["symbol"].dtype, pd.CategoricalDtype)
+    assert isinstance(df["windDirString"].dtype, pd.CategoricalDtype)
+    assert pd.api.types.is_datetime64_any_dtype(df["time"])
+    assert str(parse_hourly_forecast(records)["temperature"].dtype) == "float64"
+
+
+def test_typed_parser_handles_missing_and_unknown_fields():
+    records = [
+        {"date": "2024-01-01", "maxTemp": 5, "precipProb": 10, "newField": "x"},
+        {"date": "2024-01-02", "maxTemp": None},
+    ]
+    df = parse_daily_forecast(records)
+
+    assert list(df.columns) == ["date", "maxTemp", "precipProb", "newField"]
+    assert df["maxTemp"].isna().tolist() == [False, True]
+    assert df["precipProb"].dtype == "float64"  # a missing value cannot be stored as int16
+    assert df["date"].dt.day.tolist() == [1, 2]
+    assert parse_daily_forecast([]).empty
+
+
+def test_typed_parser_keeps_integer_payloads_as_integers():
+    records = [
+        {"date": "2024-01-01", "maxTemp": 3, "minTemp": -2, "precipAccum": 0, "maxWindSpeed": 4},
+        {"date": "2024-01-02", "maxTemp": 5, "minTemp": 1, "precipAccum": 1.5, "maxWindSpeed": 6},
+    ]
+    df = parse_daily_forecast(records)
+
+    assert df["maxTemp"].dtype == "int64"  # as pd.DataFrame(records) infers it
+    assert df["precipAccum"].dtype == "float64"
+    assert str(parse_daily_forecast(records, compact=True)["maxTemp"].dtype) == "float32"
+    assert recommend_outfits(df)["weather_summary"].tolist() == ["3°C, 0.0mm rain", "5°C, 1.5mm rain"]
+
+
+def test_forecast_panel_is_long_format_with_multiindex():
+    api = make_client()
+    panel = api.get_forecast_panel([11, 12], kind="daily", periods=3)
+
+    assert panel.index.names == ["location_id", "date"]
+    assert len(panel) == 6
+    assert panel.loc[12]["maxTemp"].tolist() == [12, 13, 14]
+
+    hourly = asyncio.run(AsyncForecaWeatherAPI(api).get_forecast_panel([11, 12, 13], kind="hourly",
+                                                                       periods=4, compact=True))
+    assert hourly.index.names == ["location_id", "time"]
+    assert len(hourly) == 12
+    assert str(hourly["temperature"].dtype) == "float32"
+
+    with pytest.raises(ValueError):
+        api.get_forecast_panel([1], kind="weekly")
+
+
+def test_iter_weather_history_yields_ordered_chunks():
+    assert ForecaWeatherAPI._split_date_range("2024-01-01", "2024-03-15", "30D") == [
+        ("2024-01-01", "2024-01-30"), ("2024-01-31", "2024-02-29"), ("2024-03-01", "2024-03-15")]
+    assert ForecaWeatherAPI._split_date_range("2024-01-15", "2024-03-01", "MS") == [
+        ("2024-01-15", "2024-01-31"), ("2024-02-01", "2024-02-29"), ("2024-03-01", "2024-03-01")]
+
+    api = make_client()
+    sequential = list(api.iter_weather_history("Helsinki", "2023-01-01", "2023-12-31", chunk="30D"))
+    concurrent = list(api.iter_weather_history("Helsinki", "2023-01-01", "2023-12-31", chunk="30D",
+                                               max_workers=4))
+
+    assert len(sequential) == len(concurrent) == 13
+    starts = [df["time"].iloc[0] for df in concurrent]
+    assert starts == sorted(starts)
+    assert [df["time"].iloc[0] for df in sequential] == starts
+
+
+def test_iter_weather_history_raises_on_failed_chunk():
+    api = make_client()
+    api._authenticate()
+    for max_workers in (1, 4):
+        api.session.failures = [FakeResponse({}, 404)]
+        with pytest.raises(requests.exceptions.RequestException, match="Helsinki"):
+            list(api.iter_weather_history("Helsinki", "2023-01-01", "2023-06-30", max_workers=max_workers))
+
+    api.session.failures = [FakeResponse({}, 404)]
+    assert api.get_weather_history("Helsinki", "2023-01-01", "2023-01-30").empty  # unchanged
+
+
+def test_save_forecast_round_trips_csv_and_feather(tmp_path):
+    api = make_client()
+    csv_path = str(tmp_path / "forecast.csv")
+    assert api.save_forecast_to_csv(5, csv_path, forecast_type="daily")
+    df = load_forecast(csv_path)
+    assert "location_id" not in df.columns
+    assert pd.api.types.is_datetime64_any_dtype(df["date"])
+
+    feather_path = str(tmp_path / "forecast.feather")
+    pytest.importorskip("pyarrow")
+    assert api.save_forecast(5, feather_path, format="feather", forecast_type="hourly")
+    assert not api.save_forecast(6, feather_path, format="feather", forecast_type="hourly", append=True)
+    df = load_forecast(feather_path)
+    assert df["location_id"].tolist() == [5] * 24  # rejected appends leave the file untouched
+    assert str(df["temperature"].dtype) == "float32"
+
+    assert api.save_forecast_to_csv(6, csv_path, forecast_type="daily")
+    assert api.save_forecast(7, csv_path, format="csv", forecast_type="daily", append=True,
+                             add_location_column=False)
+    assert len(load_forecast(csv_path)) == 14
+
+
+def test_save_forecast_to_csv_matches_untyped_output(tmp_path):
+    api = make_client()
+    for forecast_type, time_column, params in (("hourly", "time", {"periods": 24, "tz": "UTC"}),
+                                               ("daily", "date", {"periods": 7})):
+        path = tmp_path / f"{forecast_type}.csv"
+        assert api.save_forecast_to_csv(5, str(path), forecast_type=forecast_type)
+
+        records = FakeSession().get(f"/api/v1/forecast/{forecast_type}/5", params=params).json()["forecast"]
+        expected = pd.DataFrame(records)
+        expected[time_column] = pd.to_datetime(expected[time_column])
+        assert path.read_text() == expected.to_csv(index=False)  # e.g. "5,0,..." rather than "5.0,0.0,..."
+
+
+def test_save_forecast_appends_to_partitioned_parquet_dataset(tmp_path):
+    pytest.importorskip("pyarrow")
+    api = make_client()
+    dataset = str(tmp_path / "archive")
+    for location_id in (1, 2, 3):
+        assert api.save_forecast(location_id, dataset, partition_by="location_id", append=True)
+    assert api.save_forecast(1, dataset, partition_by="location_id", append=True)
+
+    df = load_forecast(dataset)
+    assert len(df) == 4 * 24
+    only_two = load_forecast(dataset, filters=[("location_id", "==", 2)], columns=["time", "temperature"])
+    assert len(only_two) == 24
+
+    single = str(tmp_path / "forecast.parquet")
+    assert api.save_forecast(1, single, forecast_type="daily", compression="snappy")
+    assert len(load_forecast(single)) == 7
+    assert not api.save_forecast(1, single, format="csv", partition_by="location_id")
+    with pytest.raises(ValueError, match="single parquet file"):
+        write_forecast(load_forecast(single), single, append=True)
+    assert len(load_forecast(single)) == 7
+
+
+def test_current_conditions_are_cached():
+    api = make_client(cache=MemoryResponseCache())
+    assert api.get_current_conditions(100292968)["temperature"] == 21.5
+    assert api.get_current_conditions(100292968)["symbol"] == "d100"
+    assert api.get_current_conditions((51.5, -0.12))["temperature"] == 21.5
+    assert [url.rsplit("/", 1)[1] for url, _ in api.session.gets] == ["100292968", "51.5,-0.12"]
+
+
+def test_client_against_fake_server_retries_and_reauthenticates():
+    with FakeForecaServer(throttle_rate=0.2, error_rate=0.2, retry_after=0.01, seed=3) as server:
+        api = ForecaWeatherAPI("user", "password", base_url=server.url, map_url=server.url,
+                               rate_limiter=TokenBucket(rate=10000, burst=10000),
+                               retry_policy=RetryPolicy(max_attempts=10, backoff_factor=0.001))
+
+        assert len(api.get_daily_forecast(101, periods=10)) == 10
+        assert len(api.get_hourly_forecast(101, periods=48)) == 48
+        assert api.search_location("paris")[0]["name"] == "Paris"
+        assert api.get_location_by_coordinates(51.5, -0.1)["name"] == "London"
+        assert not api.get_air_quality(101).empty
+        assert len(api.get_weather_history(101, "2024-01-01", "2024-01-02")) == 48
+        assert api.get_weather_maps("temperature", 51.5, -0.1).startswith(b"\x89PNG")
+
+        server.expire_tokens()
+        assert "temperature" in api.get_current_conditions(101)
+        assert server.tokens_issued == 2
+
+        statuses = server.stats()["statuses"]
+        assert statuses[429] > 0 and statuses[503] > 0 and statuses[401] == 1
+
+
+def test_fake_server_rate_limit_sends_retry_after():
+    with FakeForecaServer(rate_limit=5, burst=2, retry_after=7) as server:
+        session = create_session()
+        token = session.post(f"{server.url}/authorize/token", json={"user": "u", "password": "p"}).json()
+        headers = {"Authorization": f"Bearer {token['access_token']}"}
+        responses = [session.get(f"{server.url}/api/v1/current/1", headers=headers) for _ in range(3)]
+
+        assert [response.status_code for response in responses] == [200, 429, 429]
+        assert responses[-1].headers["Retry-After"] == "7"
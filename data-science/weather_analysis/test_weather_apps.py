@@ -3,10 +3,20 @@ Test script for Weather Applications
 This script tests the weather applications with sample data to ensure they work correctly.
 """
 
+import json
+import pickle
+import threading
 import pandas as pd
 import numpy as np
+import pytest
 from datetime import datetime, timedelta
-from weather_apps import WeatherApps
+from weather_apps import (ALERT_FREEZE, ALERT_HEAVY_RAIN, ALERT_WIND, WeatherApps, describe_alerts,
+                          detect_alerts, LazyFigure, outfit_changes, plan_trips, run_all_weather_apps,
+                          run_weather_apps_for_cities)
+from figure_export import export_figures, iter_figures
+from forecast_schema import normalize_forecast
+from trend_analysis import lttb_indices, resample_forecast
+from weather_rules import compile_rules, load_rules
 
 def create_sample_forecast_data():
     """Create sample forecast data for testing."""
@@ -95,5 +105,470 @@ def test_weather_applications():
     print("✅ Weather applications are working correctly!")
     print("=" * 50)
 
+def create_random_forecast_data(n_days=500, seed=0):
+    """Create a larger random forecast covering every threshold band."""
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame({
+        'date': pd.date_range('2024-01-01', periods=n_days, freq='D'),
+        'maxTemp': rng.integers(-15, 45, n_days),
+        'minTemp': rng.integers(-25, 30, n_days),
+        'precipAccum': np.round(rng.uniform(0, 30, n_days), 1) * (rng.random(n_days) > 0.3),
+        'maxWindSpeed': rng.integers(0, 40, n_days),
+    })
+
+
+def test_vectorized_outfits_match_reference():
+    apps = WeatherApps(None)
+    for forecast in (create_sample_forecast_data(), create_random_forecast_data(),
+                     create_random_forecast_data().astype({'maxTemp': float}),
+                     create_random_forecast_data().drop(columns=['precipAccum', 'maxWindSpeed'])):
+        _, rec_df = apps.what_to_wear_app(forecast)
+        pd.testing.assert_frame_equal(rec_df, apps._what_to_wear_reference(forecast))
+
+
+def test_outfits_keep_location_for_panels():
+    forecast = create_random_forecast_data(6)
+    forecast['location_id'] = [1, 1, 1, 2, 2, 2]
+    panel = forecast.set_index(['location_id', 'date'])
+
+    rec_df = WeatherApps(None).what_to_wear_app(panel)[1]
+    assert rec_df['location_id'].tolist() == [1, 1, 1, 2, 2, 2]
+    assert rec_df.columns[1] == 'date'
+
+
+def test_vectorized_activity_scores_match_reference():
+    apps = WeatherApps(None)
+    for forecast in (create_sample_forecast_data(), create_random_forecast_data(),
+                     create_random_forecast_data(seed=1).astype({'maxTemp': float}),
+                     create_random_forecast_data().drop(columns=['maxWindSpeed'])):
+        _, rec_df = apps.event_planner_app(forecast)
+        pd.testing.assert_frame_equal(rec_df, apps._event_planner_reference(forecast))
+
+
+def test_vectorized_alerts_match_reference():
+    apps = WeatherApps(None)
+    for forecast in (create_sample_forecast_data(), create_random_forecast_data(),
+                     create_random_forecast_data(seed=2).drop(columns=['precipAccum'])):
+        _, alerts = apps.notification_bot_app(forecast)
+        assert alerts == apps._notification_bot_reference(forecast)
+
+    calm = create_sample_forecast_data().assign(maxTemp=20, precipAccum=0, maxWindSpeed=5)
+    assert apps.notification_bot_app(calm) == (None, [])
+
+
+def test_alert_bitmask_encoding():
+    alert_df = detect_alerts(create_sample_forecast_data())
+    assert alert_df['alert_flags'].dtype == np.uint8
+    assert alert_df['alert_flags'].tolist() == [0, 0, 8, 4 | 16, 0, 0, 0]
+    assert alert_df['severity'].tolist() == [0, 0, 1, 2, 0, 0, 0]
+
+    assert describe_alerts(ALERT_HEAVY_RAIN | ALERT_WIND) == [
+        "🌧️ HEAVY RAIN ALERT: Flooding possible, stay indoors",
+        "💨 HIGH WIND ALERT: Secure loose objects",
+    ]
+    assert describe_alerts(ALERT_FREEZE)[0].startswith("❄️ FREEZING")
+    assert describe_alerts(0) == []
+
+
+def test_travel_packing_rules():
+    apps = WeatherApps(None)
+    _, packing = apps.travel_companion_app(create_sample_forecast_data())
+    assert packing == {
+        'clothing': {'T-shirts', 'Light pants', 'Light sweater'},
+        'accessories': {'Umbrella', 'Rain jacket', 'Waterproof shoes', 'Sunglasses', 'Sunscreen', 'Hat',
+                        'Windbreaker'},
+        'gear': {'Phone charger', 'Weather app', 'Power bank'},
+    }
+
+    cold = create_sample_forecast_data().assign(maxTemp=3, precipAccum=1, maxWindSpeed=5)
+    _, packing = apps.travel_companion_app(cold, trip_duration_days=2)
+    assert packing == {
+        'clothing': {'Heavy sweater', 'Warm pants', 'Winter coat', 'Thermal underwear',
+                     'Winter hat', 'Gloves', 'Scarf'},
+        'accessories': {'Light rain jacket'},
+        'gear': {'Phone charger', 'Weather app'},
+    }
+
+
+def test_rule_overrides_and_compiled_plan_cache(tmp_path):
+    assert compile_rules() is compile_rules(None)
+
+    overrides = {"alerts": [{"name": "heat", "when": [["maxTemp", ">", 25]], "message": "Hot"}]}
+    path = tmp_path / "rules.json"
+    path.write_text(json.dumps(overrides))
+    rules = compile_rules(load_rules(str(path)))
+    assert rules is compile_rules(overrides)
+    assert rules.base_outfits == compile_rules().base_outfits
+
+    apps = WeatherApps(None, rules=overrides)
+    _, alerts = apps.notification_bot_app(create_sample_forecast_data())
+    assert [alert['alerts'] for alert in alerts] == [['Hot']]
+
+
+def test_single_pass_evaluation_matches_apps():
+    forecast = create_random_forecast_data()
+    apps = WeatherApps(None)
+    result = apps.rules.evaluate(forecast, trip_duration_days=7)
+
+    assert result['outfit'].tolist() == apps.what_to_wear_app(forecast)[1]['outfit'].tolist()
+    np.testing.assert_array_equal(result['score'], apps.event_planner_app(forecast)[1]['score'])
+    np.testing.assert_array_equal(result['alert_flags'], detect_alerts(forecast)['alert_flags'])
+    packing = {category: apps.rules.decode_packing(category, bits) for category, bits in result['packing'].items()}
+    assert packing == apps.travel_companion_app(forecast, 7)[1]
+
+
+class StaticForecastAPI:
+    """Stands in for ForecaWeatherAPI, always returning the same daily forecast."""
+
+    def __init__(self, forecast):
+        self.forecast = forecast
+
+    def get_daily_forecast(self, location_id, periods=7):
+        return self.forecast
+
+
+def test_fused_evaluation_matches_sequential_apps():
+    api = StaticForecastAPI(create_sample_forecast_data())
+    sequential = run_all_weather_apps(api, 100, "Test City")
+    fused = run_all_weather_apps(api, 100, "Test City", fused=True)
+
+    assert set(fused) == set(sequential)
+    pd.testing.assert_frame_equal(fused['outfit_recs'], sequential['outfit_recs'])
+    pd.testing.assert_frame_equal(fused.event_recs, sequential['event_recs'])
+    assert fused['alerts'] == sequential['alerts']
+    assert fused['packing_list'] == sequential['packing_list']
+    assert fused['trend_stats'] == sequential['trend_stats']
+
+    # Figures are built on first access and then reused
+    assert not any(lazy.built for lazy in fused.lazy_figures().values() if isinstance(lazy, LazyFigure))
+    assert fused['event_fig'].to_json() == sequential['event_fig'].to_json()
+    assert fused['event_fig'] is fused['event_fig']
+    assert len(fused['trend_figs']) == len(sequential['trend_figs'])
+
+
+def test_lazy_figures_build_on_first_use():
+    apps = WeatherApps(None)
+    forecast = create_sample_forecast_data()
+    fig, rec_df = apps.event_planner_app(forecast, render=False)
+    assert isinstance(fig, LazyFigure) and not fig.built
+    pd.testing.assert_frame_equal(rec_df, apps.event_planner_app(forecast)[1])
+
+    # The recipe pickles without the built figure
+    clone = pickle.loads(pickle.dumps(fig))
+    assert fig.layout.title.text.startswith('📅')
+    assert fig.built and not clone.built
+    assert clone.to_json() == apps.event_planner_app(forecast)[0].to_json()
+
+    results = run_all_weather_apps(StaticForecastAPI(forecast), 100, render=False)
+    assert all(isinstance(fig, LazyFigure) for fig in results['trend_figs'])
+    assert not results['global_fig'].built
+
+
+class CityForecastAPI:
+    """Serves a different random forecast per location; location 0 fails and 1 has no data."""
+
+    def get_daily_forecast(self, location_id, periods=7):
+        if location_id == 0:
+            raise ConnectionError("unreachable")
+        if location_id == 1:
+            return pd.DataFrame()
+        return create_random_forecast_data(periods, seed=location_id)
+
+
+def test_batch_driver_runs_many_cities():
+    cities = [(location_id, f"City {location_id}") for location_id in range(12)]
+    for executor in ("thread", "process"):
+        events = []
+        results = run_weather_apps_for_cities(CityForecastAPI(), cities, workers=4, executor=executor,
+                                              progress=lambda *event: events.append(event))
+
+        assert list(results) == [f"City {i}" for i in range(2, 12)]
+        assert sorted(done for done, *_ in events) == list(range(1, 13))
+        assert {(city, status) for _, _, city, status in events if status != "ok"} == {
+            ("City 0", "failed"), ("City 1", "no data")}
+
+        expected = WeatherApps(None).evaluate_all(create_random_forecast_data(7, seed=5), city_name="City 5")
+        pd.testing.assert_frame_equal(results["City 5"]['event_recs'], expected['event_recs'])
+        assert results["City 5"]['packing_list'] == expected['packing_list']
+
+    events = []
+    with pytest.raises(ValueError, match="Paris"):
+        run_weather_apps_for_cities(CityForecastAPI(), [(2, "Paris"), (3, "Paris"), (4, "Lyon")],
+                                    progress=lambda *event: events.append(event))
+    assert events == []  # rejected before anything is fetched
+
+
+def test_row_cache_reuses_unchanged_rows():
+    cached_apps, apps = WeatherApps(None, cache_size=1000), WeatherApps(None)
+    forecast = create_random_forecast_data(200)
+    cached_apps.evaluate_all(forecast)
+    assert cached_apps.row_cache.stats()['misses'] == 200
+
+    # A refresh where only a few days changed
+    refreshed = forecast.copy()
+    refreshed.loc[[3, 50, 120], 'maxTemp'] += 7
+    fused = cached_apps.evaluate_all(refreshed)
+    stats = cached_apps.row_cache.stats()
+    assert (stats['hits'], stats['misses']) == (197, 203)
+
+    expected = apps.evaluate_all(refreshed)
+    pd.testing.assert_frame_equal(fused['outfit_recs'], expected['outfit_recs'])
+    pd.testing.assert_frame_equal(fused['event_recs'], expected['event_recs'])
+    assert fused['alerts'] == expected['alerts']
+    pd.testing.assert_frame_equal(cached_apps.what_to_wear_app(refreshed)[1], apps.what_to_wear_app(refreshed)[1])
+    assert cached_apps.notification_bot_app(refreshed)[1] == apps.notification_bot_app(refreshed)[1]
+
+
+def test_row_cache_keys_include_column_set_and_dtypes():
+    dates = pd.date_range('2024-01-01', periods=1)
+    windy = pd.DataFrame({'date': dates, 'maxTemp': [20], 'minTemp': [10], 'maxWindSpeed': [35]})
+    rainy = pd.DataFrame({'date': dates, 'maxTemp': [20], 'minTemp': [10], 'precipAccum': [35]})
+    rainy_float = rainy.astype({'maxTemp': float})
+    cached_apps, apps = WeatherApps(None, cache_size=100), WeatherApps(None)
+
+    for forecast in (windy, rainy, rainy_float):
+        _, cached_alerts = cached_apps.notification_bot_app(forecast, render=False)
+        _, alerts = apps.notification_bot_app(forecast, render=False)
+        assert cached_alerts == alerts
+        _, cached_outfits = cached_apps.what_to_wear_app(forecast, render=False)
+        pd.testing.assert_frame_equal(cached_outfits, apps.what_to_wear_app(forecast, render=False)[1])
+    assert 'HEAVY RAIN' in alerts[0]['alerts'][0]
+    assert cached_outfits['weather_summary'].iloc[0] == '20.0°C, 35mm rain'
+
+
+def test_row_cache_is_bounded():
+    apps = WeatherApps(None, cache_size=50)
+    for seed in range(5):
+        forecast = create_random_forecast_data(40, seed=seed)
+        pd.testing.assert_frame_equal(apps.event_planner_app(forecast)[1],
+                                      WeatherApps(None).event_planner_app(forecast)[1])
+        assert len(apps.row_cache) <= 50
+
+
+class CurrentConditionsAPI:
+    """Serves a latitude-dependent current temperature and counts requests."""
+
+    def __init__(self):
+        self.calls = 0
+
+    def get_current_conditions(self, location):
+        self.calls += 1
+        if location == 'broken':
+            raise ConnectionError("unreachable")
+        lat = location[0] if isinstance(location, tuple) else 0.0
+        return {'temperature': round(30 - abs(lat) / 3, 1)}
+
+
+def test_global_heatmap_fetches_and_caches_locations():
+    api = CurrentConditionsAPI()
+    apps = WeatherApps(api, conditions_ttl=600)
+    locations = [{'name': 'A', 'lat': 0.0, 'lon': 0.0}, {'name': 'B', 'lat': 60.0, 'lon': 10.0},
+                 {'name': 'C', 'lat': 0.0, 'lon': 0.0, 'id': 'broken'}]
+
+    fig = apps.global_heatmap_app(locations)
+    assert list(fig.data[0].text) == ['A<br>30.0°C', 'B<br>10.0°C']
+    apps.global_heatmap_app(locations)
+    assert api.calls == 4  # the second render only retries the failed lookup
+
+    rng = np.random.default_rng(0)
+    many = pd.DataFrame({'name': [f"L{i}" for i in range(3000)],
+                         'lat': rng.uniform(-60, 60, 3000), 'lon': rng.uniform(-180, 180, 3000)})
+    fig = apps.global_heatmap_app(many, max_workers=8)
+    assert len(fig.data[0].lat) < 3000  # binned into grid cells
+    cells = apps.current_temperatures(many)
+    assert len(cells) == 3000 and api.calls == 3004
+
+
+class FlakyConditionsAPI(CurrentConditionsAPI):
+    """Returns no data for the first request, like a client whose request failed."""
+
+    def get_current_conditions(self, location):
+        if self.calls == 0:
+            self.calls += 1
+            return {}
+        return super().get_current_conditions(location)
+
+
+def test_current_conditions_cache_skips_failures_and_is_bounded():
+    apps = WeatherApps(FlakyConditionsAPI(), max_conditions=3)
+    flaky = [{'name': 'F', 'lat': 1.0, 'lon': 1.0}]
+    assert apps.current_temperatures(flaky).empty  # a brief outage...
+    assert len(apps.current_temperatures(flaky)) == 1  # ...does not hide the city for the whole TTL
+
+    many = [{'name': f"L{i}", 'lat': float(i), 'lon': 0.0} for i in range(10)]
+    assert len(apps.current_temperatures(many)) == 10
+    assert list(apps._conditions) == [(7.0, 0.0), (8.0, 0.0), (9.0, 0.0)]
+
+
+def test_current_temperatures_mixes_ids_and_coordinates():
+    api = CurrentConditionsAPI()
+    requested = []
+    fetch = api.get_current_conditions
+    api.get_current_conditions = lambda location: requested.append(location) or fetch(location)
+    locations = [{'name': 'Helsinki', 'lat': 60.2, 'lon': 24.9, 'id': 100658225},
+                 {'name': 'A', 'lat': 0.0, 'lon': 0.0}]
+
+    temps = WeatherApps(api).current_temperatures(locations)
+    assert temps['temp'].tolist() == [30.0, 30.0]
+    assert sorted(map(str, requested)) == ['(0.0, 0.0)', '100658225']  # not '100658225.0'
+
+
+def test_figure_export_renders_every_figure(tmp_path):
+    def fake_writer(fig, path, format, scale, width, height):
+        with open(path, "w") as f:
+            f.write(fig.to_json())
+
+    api = StaticForecastAPI(create_sample_forecast_data())
+    results = {
+        "Test City": run_all_weather_apps(api, 100, "Test City", fused=True),
+        "Other City": run_all_weather_apps(api, 100, "Other City", render=False),
+    }
+    timings = export_figures(results, str(tmp_path), format="svg", workers=3, writer=fake_writer)
+
+    assert len(timings) == 2 * 8  # outfit, event, alert, packing, 3 trends, global
+    assert timings["error"].isna().all() and (timings["seconds"] >= 0).all()
+    assert sorted(p.name for p in (tmp_path / "Test_City").iterdir())[:3] == ["alert.svg", "event.svg", "global.svg"]
+    assert (tmp_path / "Other_City" / "trend_3.svg").exists()
+
+    single = export_figures(results["Test City"], str(tmp_path / "single"), writer=fake_writer)
+    assert single["path"].str.endswith(".png").all()
+
+    clashing = {"St. Louis": results["Test City"], "St Louis": results["Other City"],
+                "St_Louis_2": results["Test City"]}
+    timings = export_figures(clashing, str(tmp_path / "clash"), writer=fake_writer)
+    assert timings["path"].nunique() == len(timings) == 3 * 8  # nothing overwritten
+    assert sorted(p.name for p in (tmp_path / "clash").iterdir()) == ["St_Louis", "St_Louis_2", "St_Louis_2_2"]
+
+
+def test_figure_export_builds_lazy_figures_in_workers(tmp_path):
+    written = []
+
+    def fake_writer(fig, path, format, scale, width, height):
+        written.append(threading.current_thread() is threading.main_thread())
+
+    results = run_all_weather_apps(StaticForecastAPI(create_sample_forecast_data()), 100, "Lazy City", fused=True)
+    names = [name for name, figure in iter_figures(results)]
+    assert len(names) == 8 and not any(lazy.built for lazy in results.lazy_figures()['trend_figs'])
+
+    export_figures(results, str(tmp_path), workers=2, writer=fake_writer)
+    assert len(written) == 8 and not any(written)
+    assert all(lazy.built for lazy in results.lazy_figures()['trend_figs'])
+
+
+def test_grouped_trip_packing_matches_single_trips():
+    apps = WeatherApps(None)
+    trips = pd.concat([create_random_forecast_data(n_days, seed=trip_id).assign(trip_id=trip_id)
+                       for trip_id, n_days in enumerate([2, 5, 7, 10, 3, 14])], ignore_index=True)
+
+    planned = apps.travel_companion_trips(trips)
+    assert planned.index.tolist() == [0, 1, 2, 3, 4, 5]
+    assert planned['clothing'].dtype == np.uint64
+    assert planned['trip_duration_days'].tolist() == [2, 5, 7, 10, 3, 14]
+
+    for trip_id, trip in trips.groupby('trip_id'):
+        _, expected = apps.travel_companion_app(trip.reset_index(drop=True), trip_duration_days=len(trip))
+        decoded = {category: apps.rules.decode_packing(category, planned.loc[trip_id, category])
+                   for category in expected}
+        assert decoded == expected
+
+    matrix = apps.rules.packing_matrix('gear', planned['gear'].to_numpy())
+    assert matrix['Phone charger'].all()
+    assert matrix['Power bank'].tolist() == [False, True, True, True, False, True]
+
+
+def test_trip_packing_skips_missing_values_on_both_paths():
+    apps = WeatherApps(None)
+    trip = pd.DataFrame({'date': pd.date_range('2024-07-01', periods=3), 'maxTemp': [35.0, np.nan, 28.0],
+                         'minTemp': [20.0, 18.0, np.nan], 'precipAccum': [np.nan, 30.0, 0.0],
+                         'maxWindSpeed': [5.0, np.nan, 25.0]})
+
+    _, single = apps.travel_companion_app(trip, trip_duration_days=3)
+    planned = apps.travel_companion_trips(pd.concat([trip.assign(trip_id=1), trip.assign(trip_id=2)]))
+    for trip_id in (1, 2):
+        assert {category: apps.rules.decode_packing(category, planned.loc[trip_id, category])
+                for category in single} == single
+    assert {'Swimwear', 'Umbrella', 'Windbreaker'} <= single['clothing'] | single['accessories']
+    assert planned.loc[1, 'max_temp'] == 35.0 and planned.loc[1, 'total_precip'] == 30.0
+
+
+def test_trend_resampling_anomalies_and_downsampling():
+    apps = WeatherApps(None)
+    history = create_random_forecast_data(364, seed=3)
+    history.loc[200, 'maxTemp'] = 60
+
+    weekly = resample_forecast(history, 'W-SUN')  # 2024-01-01 is a Monday
+    assert len(weekly) == 52
+    assert weekly['maxTemp'].iloc[0] == history['maxTemp'].iloc[:7].max()
+    assert weekly['minTemp'].iloc[0] == history['minTemp'].iloc[:7].min()
+    assert np.isclose(weekly['precipAccum'].iloc[0], history['precipAccum'].iloc[:7].sum())
+
+    figs, stats = apps.trends_visualizer_app(history, rolling='14D', zscore_window=30, max_points=100)
+    assert stats['anomalies']['date'].tolist() == [history['date'][200]]
+    assert len(stats['rolling']) == len(history)
+    assert len(figs[0].data) == 4
+    assert all(len(trace.x) == 100 for fig in figs for trace in fig.data)
+
+    default_figs, default_stats = apps.trends_visualizer_app(history)
+    assert set(default_stats) == {'temperature', 'precipitation'}
+    assert len(default_figs[0].data[0].x) == len(history)
+
+    y = np.sin(np.linspace(0, 20, 5000))
+    y[1234] = 10
+    y[10] = np.nan
+    kept = lttb_indices(np.arange(5000), y, 50)
+    assert len(kept) == 50 and kept[0] == 0 and kept[-1] == 4999
+    assert 1234 in kept and 10 not in kept
+
+
+def create_hourly_forecast_data(n_hours=72):
+    """Create an hourly forecast in the schema returned by get_hourly_forecast."""
+    return pd.DataFrame({
+        'time': pd.date_range('2024-01-01', periods=n_hours, freq='h', tz='UTC'),
+        'temperature': np.linspace(-5, 38, n_hours),
+        'windSpeed': np.linspace(0, 40, n_hours),
+        'precipRate': np.r_[np.zeros(n_hours // 2), np.full(n_hours - n_hours // 2, 1.5)],
+    })
+
+
+def test_hourly_forecasts_are_normalized_for_apps():
+    hourly = create_hourly_forecast_data()
+
+    daily = normalize_forecast(hourly, granularity='daily')
+    assert daily.attrs['granularity'] == 'daily'
+    assert len(daily) == 3
+    assert daily['maxTemp'].tolist() == hourly.groupby(hourly['time'].dt.floor('D'))['temperature'].max().tolist()
+    assert daily['minTemp'].iloc[0] == -5
+    assert daily['precipAccum'].tolist() == [0, 1.5 * 12, 1.5 * 24]
+    assert daily['maxWindSpeed'].iloc[-1] == 40
+
+    apps = WeatherApps(None)
+    _, outfits = apps.what_to_wear_app(hourly)
+    assert len(outfits) == 72
+    assert outfits['date'].iloc[1] == '2024-01-01 01:00'
+
+    changes = outfit_changes(hourly)
+    assert changes['date'].iloc[0] == '2024-01-01 00:00'
+    assert (changes['outfit'].to_numpy()[1:] != changes['outfit'].to_numpy()[:-1]).all()
+    assert set(changes['outfit']) == set(outfits['outfit'])
+
+    _, alerts = apps.notification_bot_app(hourly)
+    assert alerts[0]['date'] == '2024-01-01 00:00'
+    _, stats = apps.trends_visualizer_app(hourly)
+    assert stats['temperature']['hottest_day'] == '2024-01-03'
+    assert stats['temperature']['hottest_hour'] == '2024-01-03 23:00'
+    assert stats['precipitation']['rainy_days'] == 2 and stats['precipitation']['rainy_hours'] == 36
+    # Day statistics come from daily highs, lows and totals, not single hours
+    assert stats['precipitation']['heaviest_rain'] == 1.5 * 24
+    assert stats['temperature']['avg_high'] == daily['maxTemp'].mean()
+    assert stats['temperature']['coldest_day'] == '2024-01-01'
+    _, stats = apps.trends_visualizer_app(hourly, zscore_window=2, rolling=3)
+    assert len(stats['anomalies']) <= 3 and len(stats['rolling']) == 72
+
+    trips = plan_trips(hourly.assign(trip_id=np.repeat([1, 2], 36)))
+    assert trips['trip_duration_days'].tolist() == [2, 2]
+
+    _, daily_outfits = apps.what_to_wear_app(daily)
+    assert daily_outfits['date'].tolist() == ['2024-01-01', '2024-01-02', '2024-01-03']
+
 if __name__ == "__main__":
-    test_weather_applications()
\ No newline at end of file
+    test_weather_applications()
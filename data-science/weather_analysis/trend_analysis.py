@@ -0,0 +1,165 @@
+"""
+Trend Analysis
+Vectorized resampling, rolling windows, anomaly z-scores and LTTB downsampling for long weather histories.
+"""
+
+from typing import Dict, Optional, Union
+import numpy as np
+import pandas as pd
+
+# How each app-schema measurement is combined when resampling to a coarser period
+RESAMPLE_AGGREGATIONS: Dict[str, str] = {
+    "maxTemp": "max",
+    "minTemp": "min",
+    "precipAccum": "sum",
+    "maxWindSpeed": "max",
+}
+
+Window = Union[int, str]
+
+
+def resample_forecast(forecast_data: pd.DataFrame, freq: str, time_column: str = "date") -> pd.DataFrame:
+    """
+    Resample a forecast to a coarser period, e.g. hourly to daily ("D") or daily to weekly ("W").
+
+    Highs take the maximum, lows the minimum, precipitation the sum and any
+    other numeric column the mean. Multi-location panels are resampled per
+    location_id.
+
+    Args:
+        forecast_data (pd.DataFrame): Forecast in the app schema.
+        freq (str): Target pandas frequency ("D", "W", "MS", ...).
+        time_column (str): Timestamp column.
+
+    Returns:
+        pd.DataFrame: One row per non-empty period (and location), timestamped at the period start.
+    """
+    keys = [pd.Grouper(key=time_column, freq=freq)]
+    if "location_id" in forecast_data.columns:
+        keys.insert(0, "location_id")
+
+    aggregations = {}
+    for column in forecast_data.columns:
+        if column in (time_column, "location_id"):
+            continue
+        if column in RESAMPLE_AGGREGATIONS:
+            aggregations[column] = (column, RESAMPLE_AGGREGATIONS[column])
+        elif pd.api.types.is_numeric_dtype(forecast_data[column]):
+            aggregations[column] = (column, "mean")
+    aggregations["_rows"] = (time_column, "size")
+
+    resampled = forecast_data.groupby(keys, observed=True).agg(**aggregations)
+    return resampled[resampled["_rows"] > 0].drop(columns="_rows").reset_index()
+
+
+def rolling_trends(forecast_data: pd.DataFrame, window: Window, time_column: str = "date") -> pd.DataFrame:
+    """
+    Rolling means of the highs and lows and rolling precipitation totals.
+
+    Args:
+        forecast_data (pd.DataFrame): Forecast in the app schema, in time order.
+        window (int or str): Number of rows, or a time span such as "7D".
+        time_column (str): Timestamp column.
+
+    Returns:
+        pd.DataFrame: date plus high_mean, low_mean and precip_total (where available) per row.
+    """
+    rolling = forecast_data.rolling(window, on=time_column, min_periods=1)
+    trends = pd.DataFrame({time_column: forecast_data[time_column].to_numpy()})
+    if "maxTemp" in forecast_data.columns:
+        trends["high_mean"] = rolling["maxTemp"].mean().to_numpy()
+    if "minTemp" in forecast_data.columns:
+        trends["low_mean"] = rolling["minTemp"].mean().to_numpy()
+    if "precipAccum" in forecast_data.columns:
+        trends["precip_total"] = rolling["precipAccum"].sum().to_numpy()
+    return trends
+
+
+def anomaly_zscores(forecast_data: pd.DataFrame, column: str, window: Window,
+                    time_column: str = "date") -> np.ndarray:
+    """
+    How unusual each value is compared to its trailing window, in standard deviations.
+
+    Args:
+        forecast_data (pd.DataFrame): Forecast in the app schema, in time order.
+        column (str): Measurement to score.
+        window (int or str): Number of rows, or a time span such as "30D".
+        time_column (str): Timestamp column.
+
+    Returns:
+        np.ndarray: One z-score per row (NaN where the window has no spread yet).
+    """
+    rolling = forecast_data.rolling(window, on=time_column, min_periods=2)[column]
+    mean = rolling.mean().to_numpy()
+    std = rolling.std().to_numpy()
+    values = forecast_data[column].to_numpy(dtype=float)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(std > 0, (values - mean) / std, np.nan)
+
+
+def lttb_indices(x: np.ndarray, y: np.ndarray, n_out: int) -> np.ndarray:
+    """
+    Pick `n_out` points that preserve the visual shape of a series (Largest-Triangle-Three-Buckets).
+
+    The first and last points are always kept. Every bucket in between
+    contributes the point forming the largest triangle with the previously
+    selected point and the average of the next bucket. NaN values are never selected.
+
+    Args:
+        x (np.ndarray): Numeric, increasing x values (e.g. timestamps as int64).
+        y (np.ndarray): Values to plot.
+        n_out (int): Number of points to keep.
+
+    Returns:
+        np.ndarray: Sorted indices of the selected points.
+    """
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    valid = np.flatnonzero(~np.isnan(y))
+    if len(valid) < len(y):
+        return valid[lttb_indices(x[valid], y[valid], n_out)]
+
+    n = len(x)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+
+    # n_out - 2 buckets over the points between the first and the last
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.intp)
+    counts = np.diff(edges)
+    avg_x = np.add.reduceat(x[1:n - 1], edges[:-1] - 1) / counts
+    avg_y = np.add.reduceat(y[1:n - 1], edges[:-1] - 1) / counts
+
+    selected = np.empty(n_out, dtype=np.intp)
+    selected[0], selected[-1] = 0, n - 1
+    a = 0
+    for i in range(n_out - 2):
+        start, end = edges[i], edges[i + 1]
+        if i + 1 < n_out - 2:
+            next_x, next_y = avg_x[i + 1], avg_y[i + 1]
+        else:
+            next_x, next_y = x[n - 1], y[n - 1]
+        area = np.abs((x[a] - next_x) * (y[start:end] - y[a]) - (x[a] - x[start:end]) * (next_y - y[a]))
+        a = start + int(np.argmax(area))
+        selected[i + 1] = a
+    return selected
+
+
+def downsample_series(times: pd.Series, values, max_points: Optional[int]):
+    """
+    Downsample a time series with LTTB for plotting.
+
+    Args:
+        times (pd.Series): Timestamps.
+        values: Values aligned with `times`.
+        max_points (int, optional): Maximum number of points; None keeps every point.
+
+    Returns:
+        Tuple: (times, values) with at most `max_points` points.
+    """
+    times = pd.Series(times).reset_index(drop=True)
+    values = pd.Series(values).reset_index(drop=True)
+    if max_points is None or len(values) <= max_points:
+        return times, values
+    x = times.astype("int64").to_numpy() if pd.api.types.is_datetime64_any_dtype(times) else np.arange(len(times))
+    index = lttb_indices(x, values.to_numpy(dtype=float), max_points)
+    return times.iloc[index], values.iloc[index]
@@ -3,23 +3,793 @@ Weather Applications Collection
 A comprehensive set of 6 weather-based applications using the Foreca API.
 """
 
+import logging
+import threading
+import time
 import pandas as pd
 import plotly.graph_objects as go
 import plotly.express as px
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from contextlib import nullcontext
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Tuple
+from itertools import islice
+from collections import Counter
+from collections.abc import Mapping
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
 import numpy as np
 
+from forecast_schema import DATE_FORMATS, forecast_granularity, normalize_forecast
+from row_cache import RowResultCache, hash_rows
+from trend_analysis import anomaly_zscores, downsample_series, resample_forecast, rolling_trends
+from weather_rules import CompiledRules, compile_rules
+
+logger = logging.getLogger(__name__)
+
+# Alert flags of the default rules (see weather_rules.DEFAULT_RULES["alerts"])
+ALERT_HEAT = 1
+ALERT_FREEZE = 2
+ALERT_HEAVY_RAIN = 4
+ALERT_RAIN = 8
+ALERT_WIND = 16
+
+
+def _prepare_forecast(forecast_data: pd.DataFrame) -> pd.DataFrame:
+    """Bring a daily or hourly forecast (or forecast panel) into the app schema, with index levels as columns."""
+    return normalize_forecast(forecast_data)
+
+
+def _format_dates(forecast_data: pd.DataFrame, dates: pd.Series) -> pd.Series:
+    """Format dates for display, with the hour for hourly forecasts."""
+    return dates.dt.strftime(DATE_FORMATS[forecast_granularity(forecast_data)])
+
+
+def _measure(forecast_data: pd.DataFrame, column: str) -> np.ndarray:
+    """Column values as an array, or zeros if the column is missing (like `day.get(column, 0)`)."""
+    if column in forecast_data.columns:
+        return forecast_data[column].to_numpy()
+    return np.zeros(len(forecast_data), dtype=np.int64)
+
+
+def _to_str(values: np.ndarray) -> pd.Series:
+    """Format values like str(), formatting each distinct value only once."""
+    codes, uniques = pd.factorize(values, use_na_sentinel=False)
+    return pd.Series(pd.Series(uniques).astype(str).to_numpy(dtype=object)[codes])
+
+
+def _weather_summary(temp: np.ndarray, precip: np.ndarray) -> pd.Series:
+    """Vectorized version of f"{temp}°C, {precip}mm rain"."""
+    return _to_str(temp) + "°C, " + _to_str(precip) + "mm rain"
+
+
+def _location_key(location_id):
+    """A location id as requested from the API; ids upcast to float by missing values become ints again."""
+    if isinstance(location_id, (float, np.floating)) and float(location_id).is_integer():
+        return int(location_id)
+    return location_id
+
+
+def _with_location(rec_df: pd.DataFrame, forecast_data: pd.DataFrame) -> pd.DataFrame:
+    """Carry the location_id of panel rows over to a recommendations table."""
+    if 'location_id' in forecast_data.columns:
+        rec_df.insert(0, 'location_id', forecast_data['location_id'].to_numpy())
+    return rec_df
+
+
+def _shared_columns(forecast_data: pd.DataFrame,
+                    weather_summary: Optional[np.ndarray] = None) -> Dict[str, np.ndarray]:
+    """Columns shared by the outfit and activity tables, computed once per forecast."""
+    temp = forecast_data['maxTemp'].to_numpy()
+    precip = _measure(forecast_data, 'precipAccum')
+    if weather_summary is None:
+        weather_summary = _weather_summary(temp, precip).to_numpy()
+    return {
+        'date': _format_dates(forecast_data, forecast_data['date']).to_numpy(),
+        'temperature': temp,
+        'precipitation': precip,
+        'weather_summary': weather_summary,
+    }
+
+
+def _outfit_table(forecast_data: pd.DataFrame, shared: Dict[str, np.ndarray], outfit: np.ndarray) -> pd.DataFrame:
+    """Assemble the what_to_wear_app recommendations table."""
+    rec_df = pd.DataFrame({
+        'date': shared['date'],
+        'temperature': shared['temperature'],
+        'precipitation': shared['precipitation'],
+        'outfit': outfit,
+        'weather_summary': shared['weather_summary'],
+    })
+    return _with_location(rec_df, forecast_data)
+
+
+def _activity_table(forecast_data: pd.DataFrame, shared: Dict[str, np.ndarray], score: np.ndarray,
+                    activities: np.ndarray) -> pd.DataFrame:
+    """Assemble the event_planner_app recommendations table."""
+    rec_df = pd.DataFrame({
+        'date': shared['date'],
+        'score': score,
+        'temperature': shared['temperature'],
+        'precipitation': shared['precipitation'],
+        'activities': activities,
+        'weather_summary': shared['weather_summary'],
+    })
+    return _with_location(rec_df, forecast_data)
+
+
+def recommend_outfits(forecast_data: pd.DataFrame, rules: Optional[CompiledRules] = None) -> pd.DataFrame:
+    """
+    Compute outfit recommendations for every row at once.
+
+    Args:
+        forecast_data: Daily or hourly forecast (or a multi-location forecast panel).
+        rules: Compiled rules; the defaults if omitted.
+
+    Returns:
+        DataFrame with date, temperature, precipitation, outfit and weather_summary columns.
+    """
+    rules = compile_rules(rules)
+    forecast_data = _prepare_forecast(forecast_data)
+    outfit = rules.outfit_labels(*rules.outfit_codes(rules.inputs(forecast_data)))
+    return _outfit_table(forecast_data, _shared_columns(forecast_data), outfit)
+
+
+def outfit_changes(forecast_data: pd.DataFrame, rules: Optional[CompiledRules] = None) -> pd.DataFrame:
+    """
+    Outfit recommendations at the rows where the outfit changes, e.g. hour by hour over an hourly forecast.
+
+    Args:
+        forecast_data: Daily or hourly forecast (or a forecast panel).
+        rules: Compiled rules; the defaults if omitted.
+
+    Returns:
+        The recommend_outfits table restricted to each location's first row and the rows whose outfit differs
+        from the previous row.
+    """
+    rec_df = recommend_outfits(forecast_data, rules)
+    outfit = rec_df['outfit'].to_numpy()
+    changed = np.ones(len(rec_df), dtype=bool)
+    changed[1:] = outfit[1:] != outfit[:-1]
+    if 'location_id' in rec_df.columns:
+        locations = rec_df['location_id'].to_numpy()
+        changed[1:] |= locations[1:] != locations[:-1]
+    return rec_df[changed].reset_index(drop=True)
+
+
+def score_activity_days(forecast_data: pd.DataFrame, rules: Optional[CompiledRules] = None) -> np.ndarray:
+    """
+    Score every row for outdoor activities (0-100) at once.
+
+    Args:
+        forecast_data: Daily or hourly forecast (or a multi-location forecast panel).
+        rules: Compiled rules; the defaults if omitted.
+
+    Returns:
+        Integer scores, one per row.
+    """
+    rules = compile_rules(rules)
+    return rules.activity_scores(rules.inputs(_prepare_forecast(forecast_data)))
+
+
+def plan_activities(forecast_data: pd.DataFrame, rules: Optional[CompiledRules] = None) -> pd.DataFrame:
+    """
+    Compute activity scores and suggestions for every row at once.
+
+    Rows in the same score bucket share one activities list object, so treat
+    the lists as read-only.
+
+    Args:
+        forecast_data: Daily or hourly forecast (or a multi-location forecast panel).
+        rules: Compiled rules; the defaults if omitted.
+
+    Returns:
+        DataFrame with date, score, temperature, precipitation, activities and weather_summary columns.
+    """
+    rules = compile_rules(rules)
+    forecast_data = _prepare_forecast(forecast_data)
+    score = score_activity_days(forecast_data, rules)
+    activities = rules.activity_buckets[rules.activity_bucket(score)]
+    return _activity_table(forecast_data, _shared_columns(forecast_data), score, activities)
+
+
+def compute_alert_flags(forecast_data: pd.DataFrame, rules: Optional[CompiledRules] = None) -> np.ndarray:
+    """
+    Evaluate the alert thresholds for every row at once.
+
+    Args:
+        forecast_data: Daily or hourly forecast (or a multi-location forecast panel).
+        rules: Compiled rules; the defaults if omitted.
+
+    Returns:
+        One bitmask per row (uint8 for up to 8 alerts) combining the ALERT_* flags.
+    """
+    rules = compile_rules(rules)
+    return rules.alert_flags(rules.inputs(_prepare_forecast(forecast_data)))
+
+
+def describe_alerts(flags: int, rules: Optional[CompiledRules] = None) -> List[str]:
+    """Turn an alert bitmask into its human-readable messages."""
+    return compile_rules(rules).describe_alerts(flags)
+
+
+def detect_alerts(forecast_data: pd.DataFrame, rules: Optional[CompiledRules] = None) -> pd.DataFrame:
+    """
+    Compact alert table: one row per forecast row with its alert bitmask.
+
+    Args:
+        forecast_data: Daily or hourly forecast (or a multi-location forecast panel).
+        rules: Compiled rules; the defaults if omitted.
+
+    Returns:
+        DataFrame with date, alert_flags and severity columns.
+    """
+    rules = compile_rules(rules)
+    forecast_data = _prepare_forecast(forecast_data)
+    flags = compute_alert_flags(forecast_data, rules)
+    alert_df = pd.DataFrame({
+        'date': forecast_data['date'].to_numpy(),
+        'alert_flags': flags,
+        'severity': rules.alert_severity(flags),
+    })
+    return _with_location(alert_df, forecast_data)
+
+
+def plan_trips(trips_panel: pd.DataFrame, by=None, trip_duration_days: Optional[int] = None,
+               rules: Optional[CompiledRules] = None) -> pd.DataFrame:
+    """
+    Compute packing lists for many trips at once.
+
+    Every trip's forecast rows are aggregated with a single groupby().agg(),
+    and the packing rules are evaluated on all trips together. Packing lists
+    come back as compact uint64 bitsets, one column per category; decode them
+    with rules.decode_packing (one trip) or rules.packing_matrix (many trips).
+
+    Args:
+        trips_panel: Forecast rows of all trips (or a multi-location forecast panel)
+        by: Column(s) identifying a trip; 'trip_id' if present, otherwise 'location_id'
+        trip_duration_days: Trip length for every trip; each trip's number of forecast days if omitted
+        rules: Compiled rules; the defaults if omitted.
+
+    Returns:
+        DataFrame indexed by trip with the aggregates, trip_duration_days and one bitset column per category.
+    """
+    rules = compile_rules(rules)
+    trips_panel = _prepare_forecast(trips_panel)
+    if by is None:
+        by = 'trip_id' if 'trip_id' in trips_panel.columns else 'location_id'
+
+    trips = rules.trip_summaries(trips_panel, by)
+    forecast_days = trips.pop('forecast_days').to_numpy()
+    if forecast_granularity(trips_panel) == 'hourly':
+        calendar_days = trips_panel['date'].dt.floor('D')
+        forecast_days = calendar_days.groupby([trips_panel[key] for key in np.atleast_1d(by)],
+                                              sort=False, observed=True).nunique().to_numpy()
+    days = forecast_days if trip_duration_days is None else np.full(len(trips), trip_duration_days)
+    packed = rules.packing_bits({name: trips[name].to_numpy() for name in rules.packing_aggregates}, len(trips), days)
+
+    trips['trip_duration_days'] = days
+    for category, bits in packed.items():
+        trips[category] = bits
+    return trips
+
+
+def _alert_records(forecast_data: pd.DataFrame, flags: np.ndarray, rules: CompiledRules) -> List[Dict]:
+    """Build the notification_bot_app alert dicts for the rows that have alerts."""
+    rows = np.flatnonzero(flags)
+    dates = _format_dates(forecast_data, forecast_data['date'].iloc[rows]).tolist()
+    locations = forecast_data['location_id'].to_numpy()[rows] if 'location_id' in forecast_data.columns else None
+    severity = rules.alert_severity(flags[rows])
+
+    alerts = []
+    for i, (row, date) in enumerate(zip(rows, dates)):
+        alert = {
+            'date': date,
+            'alerts': rules.describe_alerts(flags[row]),
+            'severity': int(severity[i])
+        }
+        if locations is not None:
+            alert['location_id'] = locations[i]
+        alerts.append(alert)
+    return alerts
+
+
+def summarize_trends(forecast_data: pd.DataFrame, rolling=None, zscore_window=None,
+                     zscore_threshold: float = 2.0) -> Dict:
+    """
+    Temperature and precipitation statistics shown by trends_visualizer_app.
+
+    Args:
+        forecast_data: Daily forecast (or any app-schema history, in time order).
+        rolling: Also compute rolling trends over this window (rows, or a span like "7D").
+        zscore_window: Also flag temperature anomalies against this trailing window.
+        zscore_threshold: Absolute z-score from which a high is reported as an anomaly.
+
+    Returns:
+        Dict with 'temperature' and (if available) 'precipitation' statistics, plus a
+        'rolling' DataFrame and an 'anomalies' DataFrame when requested. Hourly forecasts
+        are aggregated to daily highs, lows and totals before the day statistics and
+        anomalies are computed, and add hottest_hour, coldest_hour and rainy_hours.
+    """
+    hourly = forecast_granularity(forecast_data) == 'hourly'
+    # Day statistics and thresholds apply to daily highs, lows and totals, not to single hours
+    daily = resample_forecast(forecast_data, 'D') if hourly else forecast_data
+    stats = {
+        'temperature': {
+            'avg_high': daily['maxTemp'].mean(),
+            'avg_low': daily['minTemp'].mean(),
+            'temp_range': daily['maxTemp'].max() - daily['minTemp'].min(),
+            'hottest_day': daily.loc[daily['maxTemp'].idxmax(), 'date'].strftime(DATE_FORMATS['daily']),
+            'coldest_day': daily.loc[daily['minTemp'].idxmin(), 'date'].strftime(DATE_FORMATS['daily'])
+        }
+    }
+    if hourly:
+        hottest = forecast_data.loc[forecast_data['maxTemp'].idxmax(), 'date']
+        coldest = forecast_data.loc[forecast_data['minTemp'].idxmin(), 'date']
+        stats['temperature']['hottest_hour'] = hottest.strftime(DATE_FORMATS['hourly'])
+        stats['temperature']['coldest_hour'] = coldest.strftime(DATE_FORMATS['hourly'])
+
+    if 'precipAccum' in forecast_data.columns:
+        stats['precipitation'] = {
+            'total_precip': daily['precipAccum'].sum(),
+            'rainy_days': (daily['precipAccum'] > 0).sum(),
+            'heaviest_rain': daily['precipAccum'].max()
+        }
+        if hourly:
+            stats['precipitation']['rainy_hours'] = (forecast_data['precipAccum'] > 0).sum()
+
+    if rolling is not None:
+        stats['rolling'] = rolling_trends(forecast_data, rolling)
+
+    if zscore_window is not None:
+        zscores = anomaly_zscores(daily, 'maxTemp', zscore_window)
+        unusual = np.abs(np.nan_to_num(zscores)) >= zscore_threshold
+        stats['anomalies'] = pd.DataFrame({
+            'date': daily['date'].to_numpy()[unusual],
+            'maxTemp': daily['maxTemp'].to_numpy()[unusual],
+            'zscore': zscores[unusual],
+        })
+
+    return stats
+
+
+# Figure builders: module-level so results can defer building figures until they are needed
+
+def build_outfit_figure(rec_df: pd.DataFrame) -> go.Figure:
+    """Chart for the what_to_wear_app recommendations."""
+    fig = go.Figure()
+    fig.add_trace(go.Scatter(
+        x=rec_df['date'],
+        y=rec_df['temperature'],
+        mode='markers+text',
+        text=rec_df['outfit'],
+        textposition='top center',
+        marker=dict(size=15, color='lightblue'),
+        name='Temperature & Outfit'
+    ))
+
+    fig.update_layout(
+        title='👕 What Should I Wear This Week?',
+        xaxis_title='Date',
+        yaxis_title='Temperature (°C)',
+        height=600,
+        showlegend=False
+    )
+    return fig
+
+
+def build_event_figure(rec_df: pd.DataFrame) -> go.Figure:
+    """Chart for the event_planner_app scores."""
+    fig = go.Figure()
+    fig.add_trace(go.Bar(
+        x=rec_df['date'],
+        y=rec_df['score'],
+        text=rec_df['score'].round(0),
+        textposition='auto',
+        marker_color='lightgreen',
+        name='Activity Score'
+    ))
+
+    fig.update_layout(
+        title='📅 Best Days for Outdoor Activities (Score: 0-100)',
+        xaxis_title='Date',
+        yaxis_title='Activity Score',
+        height=500
+    )
+    return fig
+
+
+def build_alert_figure(alerts: List[Dict]) -> Optional[go.Figure]:
+    """Chart for the notification_bot_app alerts, or None if there are no alerts."""
+    if not alerts:
+        return None
+
+    fig = go.Figure()
+    fig.add_trace(go.Bar(
+        x=[alert['date'] for alert in alerts],
+        y=[alert['severity'] for alert in alerts],
+        marker_color='red',
+        name='Alert Severity'
+    ))
+
+    fig.update_layout(
+        title='🚨 Weather Alerts This Week',
+        xaxis_title='Date',
+        yaxis_title='Number of Alerts',
+        height=400
+    )
+    return fig
+
+
+def build_packing_figure(packing_list: Dict) -> go.Figure:
+    """Chart summarizing the travel_companion_app packing list."""
+    categories = list(packing_list.keys())
+    item_counts = [len(items) for items in packing_list.values()]
+
+    fig = go.Figure()
+    fig.add_trace(go.Bar(
+        x=categories,
+        y=item_counts,
+        text=item_counts,
+        textposition='auto',
+        marker_color=['lightblue', 'lightgreen', 'lightcoral']
+    ))
+
+    fig.update_layout(
+        title='🎒 Packing List Summary',
+        xaxis_title='Category',
+        yaxis_title='Number of Items',
+        height=400
+    )
+    return fig
+
+
+def build_temperature_trend(forecast_data: pd.DataFrame, rolling=None, max_points: Optional[int] = None) -> go.Figure:
+    """High/low temperature chart for trends_visualizer_app, optionally with rolling means."""
+    fig_temp = go.Figure()
+    dates, highs = downsample_series(forecast_data['date'], forecast_data['maxTemp'], max_points)
+    fig_temp.add_trace(go.Scatter(
+        x=dates,
+        y=highs,
+        mode='lines+markers',
+        name='High Temp',
+        line=dict(color='red', width=3)
+    ))
+    dates, lows = downsample_series(forecast_data['date'], forecast_data['minTemp'], max_points)
+    fig_temp.add_trace(go.Scatter(
+        x=dates,
+        y=lows,
+        mode='lines+markers',
+        name='Low Temp',
+        line=dict(color='blue', width=3),
+        fill='tonexty'
+    ))
+    if rolling is not None:
+        trends = rolling_trends(forecast_data, rolling)
+        for column, name, color in (('high_mean', 'High (rolling mean)', 'darkred'),
+                                    ('low_mean', 'Low (rolling mean)', 'darkblue')):
+            dates, values = downsample_series(trends['date'], trends[column], max_points)
+            fig_temp.add_trace(go.Scatter(x=dates, y=values, mode='lines', name=name,
+                                          line=dict(color=color, width=2, dash='dash')))
+    fig_temp.update_layout(
+        title='🌡️ Temperature Trends',
+        xaxis_title='Date',
+        yaxis_title='Temperature (°C)',
+        height=400
+    )
+    return fig_temp
+
+
+def build_precipitation_trend(forecast_data: pd.DataFrame, rolling=None, max_points: Optional[int] = None) -> go.Figure:
+    """Precipitation chart for trends_visualizer_app, optionally with rolling totals."""
+    fig_precip = go.Figure()
+    dates, precip = downsample_series(forecast_data['date'],
+                                      forecast_data.get('precipAccum', [0] * len(forecast_data)), max_points)
+    fig_precip.add_trace(go.Bar(
+        x=dates,
+        y=precip,
+        name='Precipitation',
+        marker_color='lightblue'
+    ))
+    if rolling is not None and 'precipAccum' in forecast_data.columns:
+        trends = rolling_trends(forecast_data, rolling)
+        dates, totals = downsample_series(trends['date'], trends['precip_total'], max_points)
+        fig_precip.add_trace(go.Scatter(x=dates, y=totals, mode='lines', name='Rolling total',
+                                        line=dict(color='navy', width=2)))
+    fig_precip.update_layout(
+        title='🌧️ Precipitation Trends',
+        xaxis_title='Date',
+        yaxis_title='Precipitation (mm)',
+        height=400
+    )
+    return fig_precip
+
+
+def build_wind_trend(forecast_data: pd.DataFrame, rolling=None, max_points: Optional[int] = None) -> go.Figure:
+    """Wind speed chart for trends_visualizer_app."""
+    fig_wind = go.Figure()
+    dates, wind = downsample_series(forecast_data['date'], forecast_data['maxWindSpeed'], max_points)
+    fig_wind.add_trace(go.Scatter(
+        x=dates,
+        y=wind,
+        mode='lines+markers',
+        name='Wind Speed',
+        line=dict(color='gray', width=2)
+    ))
+    fig_wind.update_layout(
+        title='💨 Wind Speed Trends',
+        xaxis_title='Date',
+        yaxis_title='Wind Speed (m/s)',
+        height=400
+    )
+    return fig_wind
+
+
+def trend_figure_builders(forecast_data: pd.DataFrame) -> List[Callable]:
+    """Builders of the trend charts available for a forecast (wind only if present)."""
+    builders = [build_temperature_trend, build_precipitation_trend]
+    if 'maxWindSpeed' in forecast_data.columns:
+        builders.append(build_wind_trend)
+    return builders
+
+
+# Sample cities shown on the global heatmap
+SAMPLE_CITIES = [
+    {'name': 'New York', 'lat': 40.7128, 'lon': -74.0060, 'temp': 22},
+    {'name': 'London', 'lat': 51.5074, 'lon': -0.1278, 'temp': 18},
+    {'name': 'Tokyo', 'lat': 35.6762, 'lon': 139.6503, 'temp': 25},
+    {'name': 'Sydney', 'lat': -33.8688, 'lon': 151.2093, 'temp': 20},
+    {'name': 'Dubai', 'lat': 25.2048, 'lon': 55.2708, 'temp': 35},
+    {'name': 'Moscow', 'lat': 55.7558, 'lon': 37.6176, 'temp': 12},
+    {'name': 'Rio de Janeiro', 'lat': -22.9068, 'lon': -43.1729, 'temp': 28},
+    {'name': 'Cape Town', 'lat': -33.9249, 'lon': 18.4241, 'temp': 16}
+]
+
+
+# Above this many locations the heatmap bins them into a lat/lon grid (cell size in degrees)
+HEATMAP_MAX_POINTS = 2000
+HEATMAP_GRID_SIZE = 2.0
+
+
+def bin_locations(locations_df: pd.DataFrame, grid_size: float) -> pd.DataFrame:
+    """
+    Aggregate located temperatures into a regular lat/lon grid.
+
+    Args:
+        locations_df: One row per location with lat, lon and temp columns
+        grid_size: Cell size in degrees
+
+    Returns:
+        One row per non-empty cell: name, lat and lon of the cell center, mean temp and location count
+    """
+    lat_cell = np.floor(locations_df['lat'].to_numpy() / grid_size)
+    lon_cell = np.floor(locations_df['lon'].to_numpy() / grid_size)
+    cells = (pd.DataFrame({'lat_cell': lat_cell, 'lon_cell': lon_cell, 'temp': locations_df['temp'].to_numpy()})
+             .groupby(['lat_cell', 'lon_cell'], sort=False)
+             .agg(temp=('temp', 'mean'), locations=('temp', 'size'))
+             .reset_index())
+    return pd.DataFrame({
+        'name': cells['locations'].astype(str) + ' locations',
+        'lat': (cells['lat_cell'] + 0.5) * grid_size,
+        'lon': (cells['lon_cell'] + 0.5) * grid_size,
+        'temp': cells['temp'].round(1),
+        'locations': cells['locations'],
+    })
+
+
+def build_global_heatmap(cities_df: pd.DataFrame, marker_size: int = 15) -> go.Figure:
+    """World map of city temperatures (name, lat, lon and temp columns)."""
+    fig = go.Figure()
+    fig.add_trace(go.Scattergeo(
+        lon=cities_df['lon'],
+        lat=cities_df['lat'],
+        text=cities_df['name'] + '<br>' + cities_df['temp'].astype(str) + '°C',
+        mode='markers',
+        marker=dict(
+            size=marker_size,
+            color=cities_df['temp'],
+            colorscale='RdYlBu_r',
+            showscale=True,
+            colorbar=dict(title="Temperature (°C)")
+        ),
+        name='Global Weather'
+    ))
+
+    fig.update_layout(
+        title='🌎 Global Weather Heatmap',
+        geo=dict(
+            scope='world',
+            projection_type='equirectangular',
+            showland=True,
+            landcolor='lightgray',
+            showocean=True,
+            oceancolor='lightblue'
+        ),
+        height=600
+    )
+    return fig
+
+
+class LazyFigure:
+    """
+    A figure that is only built when it is first used.
+
+    Holds a module-level builder function and its arguments, so it stays
+    cheap to create and can be pickled (e.g. sent to a process pool). Any
+    figure attribute or method (`show`, `to_json`, `write_image`, ...) is
+    forwarded to the figure, building it on first use.
+    """
+
+    def __init__(self, builder: Callable, *args):
+        self.builder = builder
+        self.args = args
+        self._figure = None
+
+    @property
+    def figure(self) -> go.Figure:
+        """The built figure."""
+        if self._figure is None:
+            self._figure = self.builder(*self.args)
+        return self._figure
+
+    @property
+    def built(self) -> bool:
+        """Whether the figure has been built yet."""
+        return self._figure is not None
+
+    def __getattr__(self, name):
+        if name.startswith('__') or name in ('builder', 'args', '_figure'):
+            raise AttributeError(name)
+        return getattr(self.figure, name)
+
+    def __getstate__(self):
+        # Ship the recipe, not the (much larger) built figure
+        return {'builder': self.builder, 'args': self.args, '_figure': None}
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+
+    def __repr__(self):
+        return f"LazyFigure({self.builder.__name__}, built={self.built})"
+
+
+def _figure(builder: Callable, *args, render: bool = True):
+    """Build a figure now, or return a LazyFigure that builds it on first use."""
+    return builder(*args) if render else LazyFigure(builder, *args)
+
+
+class WeatherAppsResult(Mapping):
+    """
+    Results of all weather apps for one forecast.
+
+    Behaves like the dict returned by run_all_weather_apps (same keys, so
+    display_results and show_all_plots work unchanged) and also exposes the
+    keys as attributes. Figures are only built the first time they are read.
+    """
+
+    def __init__(self, data: Dict, figures: Dict):
+        """
+        Args:
+            data: Computed results (tables, alerts, packing list, stats, ...)
+            figures: Figure key -> LazyFigure, list of LazyFigures, or None
+        """
+        self._data = data
+        self._figures = figures
+
+    def __getitem__(self, key):
+        if key in self._data:
+            return self._data[key]
+        if key in self._figures:
+            figure = self._figures[key]
+            if isinstance(figure, list):
+                return [lazy.figure for lazy in figure]
+            return figure.figure if figure is not None else None
+        raise KeyError(key)
+
+    def __contains__(self, key):
+        # Mapping's default reads the value, which would build the figure
+        return key in self._data or key in self._figures
+
+    def __iter__(self):
+        yield from self._data
+        yield from self._figures
+
+    def __len__(self):
+        return len(self._data) + len(self._figures)
+
+    def lazy_figures(self) -> Dict:
+        """The unbuilt figures (LazyFigure objects), e.g. to hand to another process."""
+        return dict(self._figures)
+
+    def __getattr__(self, name):
+        if name.startswith('_'):
+            raise AttributeError(name)
+        try:
+            return self[name]
+        except KeyError:
+            raise AttributeError(name) from None
+
+    def to_dict(self) -> Dict:
+        """Plain dict with every figure built."""
+        return {key: self[key] for key in self}
+
 
 class WeatherApps:
     """Collection of weather-based applications using Foreca API data."""
 
-    def __init__(self, api_client):
-        """Initialize with a Foreca API client."""
+    def __init__(self, api_client, rules=None, cache_size: int = 0, conditions_ttl: float = 600,
+                 max_conditions: int = 10000):
+        """
+        Initialize with a Foreca API client.
+
+        Args:
+            api_client: ForecaWeatherAPI instance
+            rules: Rule overrides (dict, see weather_rules.DEFAULT_RULES) or compiled rules
+            cache_size: Number of forecast rows whose outfit, score and alert results are
+                kept and reused when the same inputs come back (0 disables the cache)
+            conditions_ttl: Seconds that fetched current conditions are reused by global_heatmap_app
+            max_conditions: Maximum number of locations whose current conditions are kept;
+                the oldest entries are evicted first
+        """
         self.api = api_client
-
-    def what_to_wear_app(self, forecast_data: pd.DataFrame) -> Tuple[go.Figure, pd.DataFrame]:
+        self.rules = compile_rules(rules)
+        self.row_cache = RowResultCache(cache_size) if cache_size else None
+        self.conditions_ttl = conditions_ttl
+        self.max_conditions = max_conditions
+        # location key -> (monotonic expiry, temperature), in expiry order since every entry shares the TTL
+        self._conditions: Dict = {}
+        self._conditions_lock = threading.Lock()
+
+    def _row_outputs(self, forecast_data: pd.DataFrame) -> Dict[str, np.ndarray]:
+        """
+        Per-row rule results, recomputing only rows whose inputs are not in the row cache.
+
+        With the cache enabled the results also include the formatted weather summaries.
+        """
+        rules = self.rules
+        if self.row_cache is None or forecast_data.empty:
+            return rules.row_outputs(rules.inputs(forecast_data))
+
+        # Key on every rule input plus the summary's columns, with absent ones filled by the rule
+        # defaults, so frames with different column sets only share keys when they share results
+        columns = list(dict.fromkeys(rules.row_columns + ['maxTemp', 'precipAccum']))
+        missing = {column: rules.defaults[column] for column in columns
+                   if column not in forecast_data.columns and column in rules.defaults}
+        columns = [column for column in columns if column in forecast_data.columns or column in missing]
+        hashes = hash_rows(forecast_data.assign(**missing)[columns] if missing else forecast_data[columns])
+        hit, cached = self.row_cache.lookup(hashes)
+        if hit.all():
+            return cached
+
+        miss = ~hit
+        changed = forecast_data.iloc[np.flatnonzero(miss)]
+        computed = rules.row_outputs(rules.inputs(changed))
+        computed['weather_summary'] = _weather_summary(changed['maxTemp'].to_numpy(),
+                                                       _measure(changed, 'precipAccum')).to_numpy()
+        self.row_cache.insert(hashes[miss], computed)
+        if not hit.any():
+            return computed
+
+        outputs = {}
+        for name, values in computed.items():
+            merged = np.empty(len(hashes), dtype=np.result_type(values, cached[name]))
+            merged[miss] = values
+            merged[hit] = cached[name]
+            outputs[name] = merged
+        return outputs
+
+    def what_to_wear_app(self, forecast_data: pd.DataFrame, render: bool = True) -> Tuple[go.Figure, pd.DataFrame]:
         """🔮 What Should I Wear Today? App - Suggests outfits based on weather."""
+        if self.row_cache is None:
+            rec_df = recommend_outfits(forecast_data, self.rules)
+        else:
+            forecast_data = _prepare_forecast(forecast_data)
+            outputs = self._row_outputs(forecast_data)
+            outfit = self.rules.outfit_labels(outputs['outfit_base'], outputs['outfit_accessories'])
+            shared = _shared_columns(forecast_data, outputs['weather_summary'])
+            rec_df = _outfit_table(forecast_data, shared, outfit)
+        return _figure(build_outfit_figure, rec_df, render=render), rec_df
+
+    def _what_to_wear_reference(self, forecast_data: pd.DataFrame) -> pd.DataFrame:
+        """Row-by-row reference implementation of the outfit rules, kept for equivalence tests."""
         recommendations = []
 
         for _, day in forecast_data.iterrows():
@@ -64,32 +834,23 @@ class WeatherApps:
                 'weather_summary': f"{temp}°C, {precip}mm rain"
             })
 
-        rec_df = pd.DataFrame(recommendations)
-
-        # Create interactive chart
-        fig = go.Figure()
-        fig.add_trace(go.Scatter(
-            x=rec_df['date'],
-            y=rec_df['temperature'],
-            mode='markers+text',
-            text=rec_df['outfit'],
-            textposition='top center',
-            marker=dict(size=15, color='lightblue'),
-            name='Temperature & Outfit'
-        ))
-
-        fig.update_layout(
-            title='👕 What Should I Wear This Week?',
-            xaxis_title='Date',
-            yaxis_title='Temperature (°C)',
-            height=600,
-            showlegend=False
-        )
-
-        return fig, rec_df
-
-    def event_planner_app(self, forecast_data: pd.DataFrame) -> Tuple[go.Figure, pd.DataFrame]:
+        return pd.DataFrame(recommendations)
+
+    def event_planner_app(self, forecast_data: pd.DataFrame, render: bool = True) -> Tuple[go.Figure, pd.DataFrame]:
         """📍 Weather-Based Event Planner - Find best days for outdoor activities."""
+        if self.row_cache is None:
+            rec_df = plan_activities(forecast_data, self.rules)
+        else:
+            forecast_data = _prepare_forecast(forecast_data)
+            outputs = self._row_outputs(forecast_data)
+            score = outputs['score']
+            activities = self.rules.activity_buckets[self.rules.activity_bucket(score)]
+            rec_df = _activity_table(forecast_data, _shared_columns(forecast_data, outputs['weather_summary']),
+                                     score, activities)
+        return _figure(build_event_figure, rec_df, render=render), rec_df
+
+    def _event_planner_reference(self, forecast_data: pd.DataFrame) -> pd.DataFrame:
+        """Row-by-row reference implementation of the activity scoring, kept for equivalence tests."""
         def calculate_day_score(day_data):
             """Calculate a score for outdoor activities (0-100)."""
             score = 50  # Base score
@@ -146,30 +907,23 @@ class WeatherApps:
                 'weather_summary': f"{day['maxTemp']}°C, {day.get('precipAccum', 0)}mm rain"
             })
 
-        rec_df = pd.DataFrame(recommendations)
-
-        # Create visualization
-        fig = go.Figure()
-        fig.add_trace(go.Bar(
-            x=rec_df['date'],
-            y=rec_df['score'],
-            text=rec_df['score'].round(0),
-            textposition='auto',
-            marker_color='lightgreen',
-            name='Activity Score'
-        ))
-
-        fig.update_layout(
-            title='📅 Best Days for Outdoor Activities (Score: 0-100)',
-            xaxis_title='Date',
-            yaxis_title='Activity Score',
-            height=500
-        )
-
-        return fig, rec_df
-
-    def notification_bot_app(self, forecast_data: pd.DataFrame) -> Tuple[Optional[go.Figure], List[Dict]]:
+        return pd.DataFrame(recommendations)
+
+    def notification_bot_app(self, forecast_data: pd.DataFrame,
+                             render: bool = True) -> Tuple[Optional[go.Figure], List[Dict]]:
         """💡 Smart Notification Bot - Generate weather alerts and notifications."""
+        forecast_data = _prepare_forecast(forecast_data)
+        if self.row_cache is None:
+            flags = compute_alert_flags(forecast_data, self.rules)
+        else:
+            flags = self._row_outputs(forecast_data)['alert_flags']
+        alerts = _alert_records(forecast_data, flags, self.rules)
+        if not alerts:
+            return None, []
+        return _figure(build_alert_figure, alerts, render=render), alerts
+
+    def _notification_bot_reference(self, forecast_data: pd.DataFrame) -> List[Dict]:
+        """Row-by-row reference implementation of the alert rules, kept for equivalence tests."""
         alerts = []
 
         for _, day in forecast_data.iterrows():
@@ -203,236 +957,169 @@ class WeatherApps:
                     'severity': len(day_alerts)
                 })
 
-        # Create alert visualization if there are alerts
-        if alerts:
-            alert_dates = [alert['date'] for alert in alerts]
-            alert_severity = [alert['severity'] for alert in alerts]
-
-            fig = go.Figure()
-            fig.add_trace(go.Bar(
-                x=alert_dates,
-                y=alert_severity,
-                marker_color='red',
-                name='Alert Severity'
-            ))
-
-            fig.update_layout(
-                title='🚨 Weather Alerts This Week',
-                xaxis_title='Date',
-                yaxis_title='Number of Alerts',
-                height=400
-            )
-
-            return fig, alerts
-        else:
-            return None, []
+        return alerts
 
-    def travel_companion_app(self, forecast_data: pd.DataFrame, trip_duration_days: int = 7) -> Tuple[go.Figure, Dict]:
+    def travel_companion_app(self, forecast_data: pd.DataFrame, trip_duration_days: int = 7,
+                             render: bool = True) -> Tuple[go.Figure, Dict]:
         """🎒 Travel Companion App - Generate packing list based on destination weather."""
-        packing_list = {
-            'clothing': set(),
-            'accessories': set(),
-            'gear': set()
+        packing_list = self.rules.packing_list(_prepare_forecast(forecast_data), trip_duration_days)
+        return _figure(build_packing_figure, packing_list, render=render), packing_list
+
+    def travel_companion_trips(self, trips_panel: pd.DataFrame, by=None,
+                               trip_duration_days: Optional[int] = None) -> pd.DataFrame:
+        """🎒 Travel Companion for many trips - Packing list bitsets per trip (see plan_trips)."""
+        return plan_trips(trips_panel, by, trip_duration_days, self.rules)
+
+    def trends_visualizer_app(self, forecast_data: pd.DataFrame, render: bool = True, resample: Optional[str] = None,
+                              rolling=None, zscore_window=None,
+                              max_points: Optional[int] = None) -> Tuple[List[go.Figure], Dict]:
+        """
+        📈 Weather Trends Visualizer - Create comprehensive trend visualizations.
+
+        The options are meant for long histories; without them the app charts
+        and summarizes the forecast as it is.
+
+        Args:
+            forecast_data: Daily or hourly forecast, or a longer history
+            render: Build the figures now (otherwise LazyFigures)
+            resample: Aggregate to a coarser period first, e.g. "D" (hourly to daily) or "W"
+            rolling: Add rolling means/totals over this window (rows, or a span like "7D")
+            zscore_window: Report temperature anomalies against this trailing window
+            max_points: Downsample each plotted series to at most this many points (LTTB)
+        """
+        forecast_data = _prepare_forecast(forecast_data)
+        if resample is not None:
+            forecast_data = resample_forecast(forecast_data, resample)
+        figures = [_figure(builder, forecast_data, rolling, max_points, render=render)
+                   for builder in trend_figure_builders(forecast_data)]
+        return figures, summarize_trends(forecast_data, rolling, zscore_window)
+
+    def current_temperatures(self, locations, max_workers: int = 16) -> pd.DataFrame:
+        """
+        Fetch the current temperature of many locations concurrently.
+
+        Temperatures are reused for `conditions_ttl` seconds, so repeated
+        renders only fetch the locations whose entry has expired. Failed
+        lookups are not cached and are retried on the next call, and at most
+        `max_conditions` locations are kept.
+
+        Args:
+            locations: DataFrame or list of dicts with name, lat and lon (and optionally a
+                Foreca location id, used instead of the coordinates when present)
+            max_workers: Number of concurrent requests
+
+        Returns:
+            The locations with a temp column; locations without data are dropped
+        """
+        locations_df = pd.DataFrame(locations).reset_index(drop=True)
+        ids = locations_df['id'] if 'id' in locations_df.columns else pd.Series(np.nan, index=locations_df.index)
+        keys = [_location_key(location_id) if pd.notna(location_id) else (lat, lon)
+                for location_id, lat, lon in zip(ids, locations_df['lat'], locations_df['lon'])]
+
+        now = time.monotonic()
+        with self._conditions_lock:
+            self._conditions = {key: entry for key, entry in self._conditions.items() if entry[0] > now}
+            stale = list(dict.fromkeys(key for key in keys if key not in self._conditions))
+
+        def fetch(key):
+            try:
+                return self.api.get_current_conditions(key).get('temperature', np.nan)
+            except Exception as e:
+                logger.warning(f"Fetching current conditions for {key} failed: {e}")
+                return np.nan
+
+        fetched = {}
+        if stale:
+            with ThreadPoolExecutor(max_workers=max_workers) as pool:
+                fetched = dict(zip(stale, pool.map(fetch, stale)))
+            expires = time.monotonic() + self.conditions_ttl
+            with self._conditions_lock:
+                self._conditions.update((key, (expires, temp)) for key, temp in fetched.items() if pd.notna(temp))
+                overflow = len(self._conditions) - self.max_conditions
+                if overflow > 0:
+                    self._conditions = dict(islice(self._conditions.items(), overflow, None))
+
+        with self._conditions_lock:
+            temps = [fetched[key] if key in fetched else self._conditions.get(key, (0, np.nan))[1] for key in keys]
+        locations_df['temp'] = pd.to_numeric(pd.Series(temps, dtype=object), errors='coerce').to_numpy()
+        return locations_df.dropna(subset=['temp']).reset_index(drop=True)
+
+    def global_heatmap_app(self, locations=None, grid_size: Optional[float] = None, max_workers: int = 16,
+                           render: bool = True) -> go.Figure:
+        """
+        🌎 Global Weather Heatmap - Map current temperatures around the world.
+
+        Args:
+            locations: Locations to map (see current_temperatures); a built-in sample
+                of eight cities with typical temperatures if omitted
+            grid_size: Aggregate locations into lat/lon cells of this many degrees; applied
+                automatically above HEATMAP_MAX_POINTS locations
+            max_workers: Number of concurrent current-conditions requests
+            render: Build the figure now (otherwise a LazyFigure)
+        """
+        if locations is None:
+            return _figure(build_global_heatmap, pd.DataFrame(SAMPLE_CITIES), render=render)
+
+        cities_df = self.current_temperatures(locations, max_workers)
+        if grid_size is None and len(cities_df) > HEATMAP_MAX_POINTS:
+            grid_size = HEATMAP_GRID_SIZE
+        if grid_size:
+            cities_df = bin_locations(cities_df, grid_size)
+        marker_size = 15 if len(cities_df) <= 50 else 6
+        return _figure(build_global_heatmap, cities_df, marker_size, render=render)
+
+    def evaluate_all(self, forecast_data: pd.DataFrame, trip_duration_days: int = 7,
+                     city_name: str = "Your City") -> WeatherAppsResult:
+        """
+        ⚡ Fused evaluation - Run all apps in a single pass over the forecast.
+
+        Produces the same outputs as calling every app method in turn, but
+        reads each column and evaluates each shared threshold only once and
+        defers building the figures until they are accessed.
+
+        Args:
+            forecast_data: Daily or hourly forecast (or a multi-location forecast panel)
+            trip_duration_days: Trip length for the packing list
+            city_name: Name of the city for display
+
+        Returns:
+            WeatherAppsResult with the same keys as run_all_weather_apps
+        """
+        rules = self.rules
+        prepared = _prepare_forecast(forecast_data)
+        row_outputs = self._row_outputs(prepared) if self.row_cache is not None else None
+        evaluation = rules.evaluate(prepared, trip_duration_days, row_outputs)
+        shared = _shared_columns(prepared, row_outputs['weather_summary'] if row_outputs else None)
+
+        outfit_recs = _outfit_table(prepared, shared, evaluation['outfit'])
+        event_recs = _activity_table(prepared, shared, evaluation['score'],
+                                     rules.activity_buckets[evaluation['activity_bucket']])
+        alerts = _alert_records(prepared, evaluation['alert_flags'], rules)
+        packing_list = {category: rules.decode_packing(category, bits)
+                        for category, bits in evaluation['packing'].items()}
+
+        data = {
+            'forecast_data': forecast_data,
+            'city_name': city_name,
+            'outfit_recs': outfit_recs,
+            'event_recs': event_recs,
+            'alerts': alerts,
+            'packing_list': packing_list,
+            'trend_stats': summarize_trends(prepared),
         }
-
-        # Analyze weather patterns
-        temps = forecast_data['maxTemp'].tolist()
-        precip = forecast_data.get('precipAccum', [0] * len(forecast_data)).tolist()
-        wind = forecast_data.get('maxWindSpeed', [0] * len(forecast_data)).tolist()
-
-        min_temp = min(temps)
-        max_temp = max(temps)
-        total_precip = sum(precip)
-        max_wind = max(wind)
-
-        # Clothing recommendations
-        if max_temp > 30:
-            packing_list['clothing'].update(['T-shirts', 'Shorts', 'Light dresses', 'Swimwear'])
-        elif max_temp > 20:
-            packing_list['clothing'].update(['T-shirts', 'Light pants', 'Light sweater'])
-        elif max_temp > 10:
-            packing_list['clothing'].update(['Long-sleeve shirts', 'Jeans', 'Sweater', 'Light jacket'])
-        else:
-            packing_list['clothing'].update(['Heavy sweater', 'Warm pants', 'Winter coat', 'Thermal underwear'])
-
-        if min_temp < 5:
-            packing_list['clothing'].add('Winter hat')
-            packing_list['clothing'].add('Gloves')
-            packing_list['clothing'].add('Scarf')
-
-        # Accessories
-        if total_precip > 20:
-            packing_list['accessories'].update(['Umbrella', 'Rain jacket', 'Waterproof shoes'])
-        elif total_precip > 5:
-            packing_list['accessories'].add('Light rain jacket')
-
-        if max_temp > 25:
-            packing_list['accessories'].update(['Sunglasses', 'Sunscreen', 'Hat'])
-
-        if max_wind > 20:
-            packing_list['accessories'].add('Windbreaker')
-
-        # Gear
-        packing_list['gear'].add('Phone charger')
-        packing_list['gear'].add('Weather app')
-
-        if trip_duration_days > 3:
-            packing_list['gear'].add('Power bank')
-
-        # Create visualization
-        categories = list(packing_list.keys())
-        item_counts = [len(items) for items in packing_list.values()]
-
-        fig = go.Figure()
-        fig.add_trace(go.Bar(
-            x=categories,
-            y=item_counts,
-            text=item_counts,
-            textposition='auto',
-            marker_color=['lightblue', 'lightgreen', 'lightcoral']
-        ))
-
-        fig.update_layout(
-            title='🎒 Packing List Summary',
-            xaxis_title='Category',
-            yaxis_title='Number of Items',
-            height=400
-        )
-
-        return fig, packing_list
-
-    def trends_visualizer_app(self, forecast_data: pd.DataFrame) -> Tuple[List[go.Figure], Dict]:
-        """📈 Weather Trends Visualizer - Create comprehensive trend visualizations."""
-        figures = []
-
-        # Temperature trend
-        fig_temp = go.Figure()
-        fig_temp.add_trace(go.Scatter(
-            x=forecast_data['date'],
-            y=forecast_data['maxTemp'],
-            mode='lines+markers',
-            name='High Temp',
-            line=dict(color='red', width=3)
-        ))
-        fig_temp.add_trace(go.Scatter(
-            x=forecast_data['date'],
-            y=forecast_data['minTemp'],
-            mode='lines+markers',
-            name='Low Temp',
-            line=dict(color='blue', width=3),
-            fill='tonexty'
-        ))
-        fig_temp.update_layout(
-            title='🌡️ Temperature Trends',
-            xaxis_title='Date',
-            yaxis_title='Temperature (°C)',
-            height=400
-        )
-        figures.append(fig_temp)
-
-        # Precipitation trend
-        fig_precip = go.Figure()
-        fig_precip.add_trace(go.Bar(
-            x=forecast_data['date'],
-            y=forecast_data.get('precipAccum', [0] * len(forecast_data)),
-            name='Precipitation',
-            marker_color='lightblue'
-        ))
-        fig_precip.update_layout(
-            title='🌧️ Precipitation Trends',
-            xaxis_title='Date',
-            yaxis_title='Precipitation (mm)',
-            height=400
-        )
-        figures.append(fig_precip)
-
-        # Wind trend (if available)
-        if 'maxWindSpeed' in forecast_data.columns:
-            fig_wind = go.Figure()
-            fig_wind.add_trace(go.Scatter(
-                x=forecast_data['date'],
-                y=forecast_data['maxWindSpeed'],
-                mode='lines+markers',
-                name='Wind Speed',
-                line=dict(color='gray', width=2)
-            ))
-            fig_wind.update_layout(
-                title='💨 Wind Speed Trends',
-                xaxis_title='Date',
-                yaxis_title='Wind Speed (m/s)',
-                height=400
-            )
-            figures.append(fig_wind)
-
-        # Calculate statistics
-        stats = {
-            'temperature': {
-                'avg_high': forecast_data['maxTemp'].mean(),
-                'avg_low': forecast_data['minTemp'].mean(),
-                'temp_range': forecast_data['maxTemp'].max() - forecast_data['minTemp'].min(),
-                'hottest_day': forecast_data.loc[forecast_data['maxTemp'].idxmax(), 'date'].strftime('%Y-%m-%d'),
-                'coldest_day': forecast_data.loc[forecast_data['minTemp'].idxmin(), 'date'].strftime('%Y-%m-%d')
-            }
+        figures = {
+            'outfit_fig': LazyFigure(build_outfit_figure, outfit_recs),
+            'event_fig': LazyFigure(build_event_figure, event_recs),
+            'alert_fig': LazyFigure(build_alert_figure, alerts) if alerts else None,
+            'packing_fig': LazyFigure(build_packing_figure, packing_list),
+            'trend_figs': [LazyFigure(builder, prepared) for builder in trend_figure_builders(prepared)],
+            'global_fig': LazyFigure(build_global_heatmap, pd.DataFrame(SAMPLE_CITIES)),
         }
+        return WeatherAppsResult(data, figures)
 
-        if 'precipAccum' in forecast_data.columns:
-            stats['precipitation'] = {
-                'total_precip': forecast_data['precipAccum'].sum(),
-                'rainy_days': (forecast_data['precipAccum'] > 0).sum(),
-                'heaviest_rain': forecast_data['precipAccum'].max()
-            }
-
-        return figures, stats
-
-    def global_heatmap_app(self) -> go.Figure:
-        """🌎 Global Weather Heatmap - Create a simulated global weather visualization."""
-        # Sample cities with their coordinates
-        cities = [
-            {'name': 'New York', 'lat': 40.7128, 'lon': -74.0060, 'temp': 22},
-            {'name': 'London', 'lat': 51.5074, 'lon': -0.1278, 'temp': 18},
-            {'name': 'Tokyo', 'lat': 35.6762, 'lon': 139.6503, 'temp': 25},
-            {'name': 'Sydney', 'lat': -33.8688, 'lon': 151.2093, 'temp': 20},
-            {'name': 'Dubai', 'lat': 25.2048, 'lon': 55.2708, 'temp': 35},
-            {'name': 'Moscow', 'lat': 55.7558, 'lon': 37.6176, 'temp': 12},
-            {'name': 'Rio de Janeiro', 'lat': -22.9068, 'lon': -43.1729, 'temp': 28},
-            {'name': 'Cape Town', 'lat': -33.9249, 'lon': 18.4241, 'temp': 16}
-        ]
-
-        cities_df = pd.DataFrame(cities)
-
-        fig = go.Figure()
-        fig.add_trace(go.Scattergeo(
-            lon=cities_df['lon'],
-            lat=cities_df['lat'],
-            text=cities_df['name'] + '<br>' + cities_df['temp'].astype(str) + '°C',
-            mode='markers',
-            marker=dict(
-                size=15,
-                color=cities_df['temp'],
-                colorscale='RdYlBu_r',
-                showscale=True,
-                colorbar=dict(title="Temperature (°C)")
-            ),
-            name='Global Weather'
-        ))
-
-        fig.update_layout(
-            title='🌎 Global Weather Heatmap',
-            geo=dict(
-                scope='world',
-                projection_type='equirectangular',
-                showland=True,
-                landcolor='lightgray',
-                showocean=True,
-                oceancolor='lightblue'
-            ),
-            height=600
-        )
-
-        return fig
-
-
-def run_all_weather_apps(api_client, location_id: int, city_name: str = "Your City"):
+
+def run_all_weather_apps(api_client, location_id: int, city_name: str = "Your City", fused: bool = False,
+                         render: bool = True):
     """
     Run all 6 weather applications for a given location.
 
@@ -440,9 +1127,13 @@ def run_all_weather_apps(api_client, location_id: int, city_name: str = "Your Ci
         api_client: ForecaWeatherAPI instance
         location_id: Foreca location ID
         city_name: Name of the city for display
+        fused: Evaluate all apps in one pass and build figures only when accessed
+            (see WeatherApps.evaluate_all); best for batch jobs
+        render: Build figures right away; if False, figures are LazyFigure objects
+            built on first use (fused results are always lazy)
 
     Returns:
-        Dictionary containing all application results
+        Dictionary containing all application results (a WeatherAppsResult when fused)
     """
     print(f"🌤️ Running all weather applications for {city_name}...")
 
@@ -455,6 +1146,11 @@ def run_all_weather_apps(api_client, location_id: int, city_name: str = "Your Ci
         print("❌ No forecast data available!")
         return {}
 
+    if fused:
+        results = apps.evaluate_all(daily_forecast, city_name=city_name)
+        print("✅ All applications completed successfully!")
+        return results
+
     results = {
         'forecast_data': daily_forecast,
         'city_name': city_name
@@ -462,27 +1158,122 @@ def run_all_weather_apps(api_client, location_id: int, city_name: str = "Your Ci
 
     # Run each application
     print("🔮 1. What Should I Wear Today? App")
-    results['outfit_fig'], results['outfit_recs'] = apps.what_to_wear_app(daily_forecast)
+    results['outfit_fig'], results['outfit_recs'] = apps.what_to_wear_app(daily_forecast, render=render)
 
     print("📍 2. Weather-Based Event Planner")
-    results['event_fig'], results['event_recs'] = apps.event_planner_app(daily_forecast)
+    results['event_fig'], results['event_recs'] = apps.event_planner_app(daily_forecast, render=render)
 
     print("💡 3. Smart Notification Bot")
-    results['alert_fig'], results['alerts'] = apps.notification_bot_app(daily_forecast)
+    results['alert_fig'], results['alerts'] = apps.notification_bot_app(daily_forecast, render=render)
 
     print("🎒 4. Travel Companion App")
-    results['packing_fig'], results['packing_list'] = apps.travel_companion_app(daily_forecast)
+    results['packing_fig'], results['packing_list'] = apps.travel_companion_app(daily_forecast, render=render)
 
     print("📈 5. Weather Trends Visualizer")
-    results['trend_figs'], results['trend_stats'] = apps.trends_visualizer_app(daily_forecast)
+    results['trend_figs'], results['trend_stats'] = apps.trends_visualizer_app(daily_forecast, render=render)
 
     print("🌎 6. Global Weather Heatmap")
-    results['global_fig'] = apps.global_heatmap_app()
+    results['global_fig'] = apps.global_heatmap_app(render=render)
 
     print("✅ All applications completed successfully!")
     return results
 
 
+def _evaluate_city(forecast_data: pd.DataFrame, city_name: str, rules: Dict,
+                   trip_duration_days: int) -> WeatherAppsResult:
+    """Evaluate all apps for one city (module-level so process pools can run it)."""
+    return WeatherApps(None, rules=rules).evaluate_all(forecast_data, trip_duration_days, city_name)
+
+
+def _log_progress(done: int, total: int, city_name: str, status: str):
+    """Default progress reporter for run_weather_apps_for_cities."""
+    logger.info(f"[{done}/{total}] {city_name}: {status}")
+
+
+def run_weather_apps_for_cities(api_client, cities: Iterable[Tuple[int, str]], workers: int = 8,
+                                executor: str = "thread", trip_duration_days: int = 7, rules=None,
+                                progress: Optional[Callable[[int, int, str, str], None]] = None,
+                                render: bool = False) -> Dict[str, WeatherAppsResult]:
+    """
+    Run all weather applications for many cities concurrently.
+
+    Forecasts are fetched on a thread pool; each city is evaluated with
+    WeatherApps.evaluate_all as soon as its forecast arrives, either on the
+    same threads or on a process pool. Cities without forecast data, or whose
+    fetch or evaluation failed, are reported and left out of the results.
+
+    Args:
+        api_client: ForecaWeatherAPI instance (shared by the fetch threads)
+        cities: (location_id, city_name) pairs
+        workers: Number of fetch threads, and of evaluation workers
+        executor: "thread" or "process" for the evaluation pool
+        trip_duration_days: Trip length for the packing lists
+        rules: Rule overrides or compiled rules (see WeatherApps)
+        progress: Called as progress(done, total, city_name, status) after each city,
+            with status "ok", "no data" or "failed"; defaults to logging
+        render: Build every figure before returning (otherwise on first access)
+
+    Returns:
+        Results keyed by city name, in input order
+
+    Raises:
+        ValueError: If two cities share a name (give them distinct names, e.g. "Paris, TX")
+    """
+    if executor not in ("thread", "process"):
+        raise ValueError("executor must be 'thread' or 'process'")
+
+    cities = list(cities)
+    duplicates = sorted({name for name, count in Counter(name for _, name in cities).items() if count > 1})
+    if duplicates:
+        raise ValueError(f"City names must be unique, since results are keyed by name: {duplicates}")
+    # Plain rule data pickles cheaply; workers recompile it from their own cache
+    rules = compile_rules(rules).rules
+    report = progress or _log_progress
+    total = len(cities)
+    completed = {}
+    done = 0
+
+    def finish(city_name: str, result: Optional[WeatherAppsResult], status: str):
+        nonlocal done
+        done += 1
+        if result is not None:
+            completed[city_name] = result
+        report(done, total, city_name, status)
+
+    with ThreadPoolExecutor(max_workers=workers) as fetch_pool, \
+            (ProcessPoolExecutor(max_workers=workers) if executor == "process" else nullcontext(fetch_pool)) as eval_pool:
+        fetches = {fetch_pool.submit(api_client.get_daily_forecast, location_id, periods=7): city_name
+                   for location_id, city_name in cities}
+        evaluations = {}
+
+        for future in as_completed(fetches):
+            city_name = fetches[future]
+            try:
+                forecast = future.result()
+            except Exception as e:
+                logger.error(f"Fetching the forecast for {city_name} failed: {e}")
+                finish(city_name, None, "failed")
+                continue
+            if forecast.empty:
+                finish(city_name, None, "no data")
+                continue
+            evaluations[eval_pool.submit(_evaluate_city, forecast, city_name, rules, trip_duration_days)] = city_name
+
+        for future in as_completed(evaluations):
+            city_name = evaluations[future]
+            try:
+                finish(city_name, future.result(), "ok")
+            except Exception as e:
+                logger.error(f"Evaluating the weather apps for {city_name} failed: {e}")
+                finish(city_name, None, "failed")
+
+    results = {city_name: completed[city_name] for _, city_name in cities if city_name in completed}
+    if render:
+        for result in results.values():
+            result.to_dict()
+    return results
+
+
 def display_results(results: Dict):
     """Display all application results in a formatted way."""
     city_name = results.get('city_name', 'Unknown City')
@@ -577,7 +1368,7 @@ def show_all_plots(results: Dict):
         results['event_fig'].show()
 
     # Weather alerts
-    if 'alert_fig' in results:
+    if results.get('alert_fig') is not None:
         print("💡 Weather Alerts Chart:")
         results['alert_fig'].show()
 
@@ -0,0 +1,569 @@
+"""
+Weather Rules
+Declarative thresholds for the weather apps, compiled once into vectorized evaluators.
+
+Rules are plain data (a dict, or a JSON/YAML file) so they can be tuned per
+region without code changes. A condition is a list of [column, op, value]
+comparisons that must all hold; three primitives build on conditions:
+
+* select: the value of the first matching case, or a default
+  ({"cases": [{"when": [...], "value": ...}], "default": ...})
+* flag: a bit that is set where the condition holds ({"when": [...], ...})
+* score: a base score plus one select per factor, clipped to a range
+"""
+
+import copy
+import json
+import operator
+from functools import lru_cache
+from typing import Dict, List, Mapping, Optional, Sequence, Set, Union
+import numpy as np
+import pandas as pd
+
+OPERATORS = {
+    "<": operator.lt,
+    "<=": operator.le,
+    ">": operator.gt,
+    ">=": operator.ge,
+    "==": operator.eq,
+    "!=": operator.ne,
+}
+
+# Aggregations allowed when summarizing a trip for the packing rules
+AGGREGATIONS = ("min", "max", "sum", "mean")
+
+DEFAULT_RULES: Dict = {
+    # Value used for a measurement column that is missing from the forecast
+    "defaults": {"precipAccum": 0, "maxWindSpeed": 0},
+
+    "outfit": {
+        "base": {
+            "cases": [
+                {"when": [["maxTemp", "<", 10]], "value": "Heavy coat, scarf, gloves, warm hat"},
+                {"when": [["maxTemp", "<", 20]], "value": "Light jacket or sweater"},
+                {"when": [["maxTemp", "<", 25]], "value": "T-shirt or light shirt"},
+            ],
+            "default": "Tank top or short sleeves",
+        },
+        "accessories": [
+            {"when": [["precipAccum", ">", 5]], "label": "🌂 Umbrella"},
+            {"when": [["precipAccum", ">", 10]], "label": "🥾 Waterproof shoes"},
+            {"when": [["maxWindSpeed", ">", 20]], "label": "🧥 Windbreaker"},
+            {"when": [["maxTemp", ">", 30]], "label": "🕶️ Sunglasses"},
+            {"when": [["maxTemp", "<", 5]], "label": "🧤 Winter gloves"},
+        ],
+    },
+
+    "activity": {
+        "base_score": 50,
+        "factors": [
+            {   # Temperature (ideal: 15-25°C)
+                "cases": [
+                    {"when": [["maxTemp", ">=", 15], ["maxTemp", "<=", 25]], "value": 30},
+                    {"when": [["maxTemp", ">=", 10], ["maxTemp", "<=", 30]], "value": 20},
+                    {"when": [["maxTemp", ">=", 5], ["maxTemp", "<=", 35]], "value": 10},
+                ],
+                "default": 0,
+            },
+            {   # Precipitation bonus/penalty
+                "cases": [
+                    {"when": [["precipAccum", "==", 0]], "value": 20},
+                    {"when": [["precipAccum", "<", 5]], "value": 10},
+                    {"when": [["precipAccum", ">", 10]], "value": -20},
+                ],
+                "default": 0,
+            },
+            {   # Wind bonus/penalty
+                "cases": [
+                    {"when": [["maxWindSpeed", "<", 15]], "value": 10},
+                    {"when": [["maxWindSpeed", ">", 25]], "value": -15},
+                ],
+                "default": 0,
+            },
+        ],
+        "clip": [0, 100],
+        # Suggestions for scores from `min_score` up to the next bucket, lowest first
+        "buckets": [
+            {"activities": ["🏠 Stay indoors", "📚 Reading", "🎬 Movie day"]},
+            {"min_score": 40, "activities": ["🏠 Indoor activities recommended"]},
+            {"min_score": 60, "activities": ["🚶‍♂️ Walking", "📸 Photography", "☕ Outdoor coffee"]},
+            {"min_score": 80, "activities": ["🏃‍♂️ Running", "🚴‍♂️ Cycling", "🏕️ Picnic", "🎾 Tennis"]},
+        ],
+    },
+
+    # One flag bit per alert, in the order messages are reported
+    "alerts": [
+        {"name": "heat", "when": [["maxTemp", ">", 35]],
+         "message": "🔥 HEATWAVE ALERT: Stay hydrated, avoid outdoor activities"},
+        {"name": "freeze", "when": [["maxTemp", "<", 0]],
+         "message": "❄️ FREEZING ALERT: Bundle up, risk of frostbite"},
+        {"name": "heavy_rain", "when": [["precipAccum", ">", 20]],
+         "message": "🌧️ HEAVY RAIN ALERT: Flooding possible, stay indoors"},
+        {"name": "rain", "when": [["precipAccum", ">", 10], ["precipAccum", "<=", 20]],
+         "message": "☔ RAIN ALERT: Bring umbrella, wet conditions"},
+        {"name": "wind", "when": [["maxWindSpeed", ">", 30]],
+         "message": "💨 HIGH WIND ALERT: Secure loose objects"},
+    ],
+
+    "packing": {
+        # Trip summary columns: name -> [forecast column, aggregation].
+        # `trip_duration_days` is always available as well.
+        "aggregates": {
+            "min_temp": ["maxTemp", "min"],
+            "max_temp": ["maxTemp", "max"],
+            "total_precip": ["precipAccum", "sum"],
+            "max_wind": ["maxWindSpeed", "max"],
+        },
+        "categories": {
+            "clothing": [
+                {
+                    "cases": [
+                        {"when": [["max_temp", ">", 30]], "items": ["T-shirts", "Shorts", "Light dresses", "Swimwear"]},
+                        {"when": [["max_temp", ">", 20]], "items": ["T-shirts", "Light pants", "Light sweater"]},
+                        {"when": [["max_temp", ">", 10]],
+                         "items": ["Long-sleeve shirts", "Jeans", "Sweater", "Light jacket"]},
+                    ],
+                    "default": ["Heavy sweater", "Warm pants", "Winter coat", "Thermal underwear"],
+                },
+                {"when": [["min_temp", "<", 5]], "items": ["Winter hat", "Gloves", "Scarf"]},
+            ],
+            "accessories": [
+                {
+                    "cases": [
+                        {"when": [["total_precip", ">", 20]], "items": ["Umbrella", "Rain jacket", "Waterproof shoes"]},
+                        {"when": [["total_precip", ">", 5]], "items": ["Light rain jacket"]},
+                    ],
+                    "default": [],
+                },
+                {"when": [["max_temp", ">", 25]], "items": ["Sunglasses", "Sunscreen", "Hat"]},
+                {"when": [["max_wind", ">", 20]], "items": ["Windbreaker"]},
+            ],
+            "gear": [
+                {"items": ["Phone charger", "Weather app"]},
+                {"when": [["trip_duration_days", ">", 3]], "items": ["Power bank"]},
+            ],
+        },
+    },
+}
+
+
+def merge_rules(overrides: Optional[Mapping], base: Optional[Mapping] = None) -> Dict:
+    """
+    Merge rule overrides into a base rule set (the defaults unless given).
+
+    Nested dicts are merged key by key; any other value, including lists of
+    cases or alerts, replaces the base value as a whole.
+
+    Args:
+        overrides (Mapping, optional): Partial rules, e.g. {"alerts": [...]}.
+        base (Mapping, optional): Rules to merge into; defaults to DEFAULT_RULES.
+
+    Returns:
+        Dict: A new, complete rule set.
+    """
+    merged = copy.deepcopy(dict(DEFAULT_RULES if base is None else base))
+    for key, value in (overrides or {}).items():
+        if isinstance(value, Mapping) and isinstance(merged.get(key), Mapping):
+            merged[key] = merge_rules(value, merged[key])
+        else:
+            merged[key] = copy.deepcopy(value)
+    return merged
+
+
+def load_rules(path: str) -> Dict:
+    """
+    Read rule overrides from a JSON or YAML file.
+
+    YAML files (.yaml/.yml) need the optional `PyYAML` package.
+
+    Args:
+        path (str): Path to the rules file.
+
+    Returns:
+        Dict: The rules as written in the file, ready for `compile_rules`.
+    """
+    with open(path, encoding="utf-8") as f:
+        if path.lower().endswith((".yaml", ".yml")):
+            try:
+                import yaml
+            except ImportError as e:
+                raise ImportError("Loading YAML rules requires PyYAML: pip install pyyaml") from e
+            return yaml.safe_load(f) or {}
+        return json.load(f)
+
+
+def _condition(when: Optional[Sequence]) -> tuple:
+    """Compile a list of [column, op, value] comparisons into hashable atoms."""
+    atoms = []
+    for comparison in when or ():
+        try:
+            column, op, value = comparison
+        except (TypeError, ValueError):
+            raise ValueError(f"Conditions must be [column, op, value] lists, got {comparison!r}") from None
+        if op not in OPERATORS:
+            raise ValueError(f"Unknown operator {op!r}; expected one of {sorted(OPERATORS)}")
+        atoms.append((column, op, value))
+    return tuple(atoms)
+
+
+def _cases(spec: Mapping, value_key: str) -> tuple:
+    """Compile a select spec into (conditions, values, default)."""
+    cases = spec.get("cases", [])
+    return (
+        [_condition(case.get("when")) for case in cases],
+        [case[value_key] for case in cases],
+        spec.get("default"),
+    )
+
+
+def _flag_dtype(n_bits: int):
+    """Smallest unsigned integer dtype holding `n_bits` flags."""
+    for dtype in (np.uint8, np.uint16, np.uint32, np.uint64):
+        if n_bits <= np.iinfo(dtype).bits:
+            return dtype
+    raise ValueError(f"At most 64 flags are supported, got {n_bits}")
+
+
+class _Inputs:
+    """
+    Column arrays for one evaluation pass.
+
+    Columns are converted to numpy once and every distinct comparison is
+    computed once, however many rules share it.
+    """
+
+    def __init__(self, columns: Mapping, n_rows: int, defaults: Mapping):
+        self.columns = columns
+        self.n_rows = n_rows
+        self.defaults = defaults
+        self._arrays: Dict[str, np.ndarray] = {}
+        self._masks: Dict[tuple, np.ndarray] = {}
+
+    def array(self, column: str) -> np.ndarray:
+        """Values of a column, or its default value if the column is missing."""
+        if column not in self._arrays:
+            if column in self.columns:
+                self._arrays[column] = np.asarray(self.columns[column])
+            elif column in self.defaults:
+                self._arrays[column] = np.full(self.n_rows, self.defaults[column])
+            else:
+                raise KeyError(column)
+        return self._arrays[column]
+
+    def mask(self, condition: tuple) -> np.ndarray:
+        """Rows where every comparison of a compiled condition holds."""
+        result = np.ones(self.n_rows, dtype=bool)
+        for atom in condition:
+            if atom not in self._masks:
+                column, op, value = atom
+                self._masks[atom] = np.asarray(OPERATORS[op](self.array(column), value), dtype=bool)
+            result &= self._masks[atom]
+        return result
+
+    def select(self, conditions: List[tuple], choices: np.ndarray) -> np.ndarray:
+        """Index of the first matching case for every row (len(conditions) if none match)."""
+        index = np.full(self.n_rows, len(conditions), dtype=np.intp)
+        # Walk the cases backwards so earlier cases win
+        for i in range(len(conditions) - 1, -1, -1):
+            index[self.mask(conditions[i])] = i
+        return choices[index]
+
+    @classmethod
+    def from_frame(cls, forecast_data: pd.DataFrame, defaults: Mapping) -> "_Inputs":
+        return cls(forecast_data, len(forecast_data), defaults)
+
+
+class CompiledRules:
+    """
+    A rule set compiled into vectorized evaluators.
+
+    Build instances with `compile_rules`, which caches the compiled plan for
+    each distinct rule set.
+    """
+
+    def __init__(self, rules: Mapping):
+        """
+        Compile a complete rule set.
+
+        Args:
+            rules (Mapping): Rules in the DEFAULT_RULES layout.
+        """
+        self.rules = rules
+        self.defaults = dict(rules.get("defaults", {}))
+
+        outfit = rules["outfit"]
+        base_conditions, base_values, base_default = _cases(outfit["base"], "value")
+        self._outfit_conditions = base_conditions
+        self.base_outfits = base_values + [base_default]
+        self._base_choices = np.arange(len(self.base_outfits))
+        self.outfit_accessories = [accessory["label"] for accessory in outfit["accessories"]]
+        self._accessory_conditions = [_condition(accessory.get("when")) for accessory in outfit["accessories"]]
+        self._accessory_dtype = _flag_dtype(len(self.outfit_accessories))
+
+        activity = rules["activity"]
+        self.base_score = activity.get("base_score", 0)
+        self._score_factors = []
+        for factor in activity["factors"]:
+            conditions, values, default = _cases(factor, "value")
+            self._score_factors.append((conditions, np.array(values + [default or 0])))
+        self.score_range = tuple(activity.get("clip", (None, None)))
+        buckets = activity["buckets"]
+        self.activity_thresholds = np.array([bucket["min_score"] for bucket in buckets[1:]])
+        if np.any(np.diff(self.activity_thresholds) <= 0):
+            raise ValueError("Activity buckets must be listed in increasing min_score order")
+        self.activity_buckets = np.empty(len(buckets), dtype=object)
+        self.activity_buckets[:] = [bucket["activities"] for bucket in buckets]
+
+        alerts = rules["alerts"]
+        self.alert_names = [alert.get("name", f"alert_{i}") for i, alert in enumerate(alerts)]
+        self.alert_messages = [alert["message"] for alert in alerts]
+        self._alert_conditions = [_condition(alert.get("when")) for alert in alerts]
+        self.alert_dtype = _flag_dtype(len(alerts))
+
+        # Forecast columns the per-row rules read (the packing rules read trip aggregates)
+        row_conditions = (self._outfit_conditions + self._accessory_conditions + self._alert_conditions
+                          + [condition for conditions, _ in self._score_factors for condition in conditions])
+        self.row_columns = sorted({column for condition in row_conditions for column, _, _ in condition})
+
+        packing = rules["packing"]
+        self.packing_aggregates = {}
+        for name, (column, how) in packing["aggregates"].items():
+            if how not in AGGREGATIONS:
+                raise ValueError(f"Unknown aggregation {how!r}; expected one of {AGGREGATIONS}")
+            self.packing_aggregates[name] = (column, how)
+        self.packing_items: Dict[str, List[str]] = {}
+        self._packing_rules: Dict[str, List] = {}
+        for category, category_rules in packing["categories"].items():
+            self.packing_items[category], self._packing_rules[category] = self._compile_packing(category_rules)
+
+    @staticmethod
+    def _compile_packing(category_rules: Sequence[Mapping]):
+        """Assign one bit per distinct item and compile each rule into item bitmasks."""
+        items: Dict[str, int] = {}
+
+        def bits(names):
+            mask = 0
+            for name in names:
+                mask |= 1 << items.setdefault(name, len(items))
+            return mask
+
+        compiled = []
+        for rule in category_rules:
+            if "cases" in rule:
+                conditions, values, default = _cases(rule, "items")
+                choices = np.array([bits(names) for names in values + [default or []]], dtype=np.uint64)
+                compiled.append(("select", conditions, choices))
+            else:
+                compiled.append(("flag", _condition(rule.get("when")), bits(rule["items"])))
+        if len(items) > 64:
+            raise ValueError(f"At most 64 items per packing category are supported, got {len(items)}")
+        return list(items), compiled
+
+    def inputs(self, forecast_data: pd.DataFrame) -> _Inputs:
+        """Start an evaluation pass over a forecast frame."""
+        return _Inputs.from_frame(forecast_data, self.defaults)
+
+    # Outfit rules
+
+    def outfit_codes(self, inputs: _Inputs):
+        """Base outfit index and accessory bitmask for every row."""
+        base = inputs.select(self._outfit_conditions, self._base_choices)
+        accessories = np.zeros(inputs.n_rows, dtype=self._accessory_dtype)
+        for bit, condition in enumerate(self._accessory_conditions):
+            accessories[inputs.mask(condition)] |= self._accessory_dtype(1 << bit)
+        return base, accessories
+
+    def outfit_labels(self, base: np.ndarray, accessories: np.ndarray) -> np.ndarray:
+        """Format outfit strings, formatting each distinct combination only once."""
+        codes = base.astype(np.uint64) << np.uint64(len(self.outfit_accessories)) | accessories
+        codes, uniques = pd.factorize(codes)
+        n_bits = np.uint64(len(self.outfit_accessories))
+        labels = []
+        for code in uniques:
+            chosen = [label for bit, label in enumerate(self.outfit_accessories) if int(code) >> bit & 1]
+            outfit = self.base_outfits[int(code >> n_bits)]
+            labels.append(outfit + (f" + {', '.join(chosen)}" if chosen else ""))
+        return np.array(labels, dtype=object)[codes]
+
+    # Activity rules
+
+    def activity_scores(self, inputs: _Inputs) -> np.ndarray:
+        """Integer activity score for every row."""
+        score = np.full(inputs.n_rows, self.base_score)
+        for conditions, choices in self._score_factors:
+            score = score + inputs.select(conditions, choices)
+        low, high = self.score_range
+        if low is not None or high is not None:
+            score = np.clip(score, low, high)
+        return score
+
+    def activity_bucket(self, scores: np.ndarray) -> np.ndarray:
+        """Index into `activity_buckets` for every score."""
+        return np.searchsorted(self.activity_thresholds, scores, side="right")
+
+    # Alert rules
+
+    def alert_flags(self, inputs: _Inputs) -> np.ndarray:
+        """Alert bitmask for every row, one bit per alert rule."""
+        flags = np.zeros(inputs.n_rows, dtype=self.alert_dtype)
+        for bit, condition in enumerate(self._alert_conditions):
+            flags[inputs.mask(condition)] |= self.alert_dtype(1 << bit)
+        return flags
+
+    def alert_severity(self, flags: np.ndarray) -> np.ndarray:
+        """Number of alerts set in each bitmask."""
+        flags = np.asarray(flags)
+        severity = np.zeros(flags.shape, dtype=np.uint8)
+        for bit in range(len(self.alert_messages)):
+            severity += (flags >> bit & 1).astype(np.uint8)
+        return severity
+
+    def describe_alerts(self, flags: int) -> List[str]:
+        """Turn an alert bitmask into its messages."""
+        return [message for bit, message in enumerate(self.alert_messages) if int(flags) >> bit & 1]
+
+    def alert_bit(self, name: str) -> int:
+        """Flag value of a named alert."""
+        return 1 << self.alert_names.index(name)
+
+    # Packing rules
+
+    def trip_summary(self, inputs: _Inputs) -> Dict[str, np.ndarray]:
+        """
+        Aggregate a whole forecast into the packing rule inputs (one row).
+
+        Missing values are skipped, as in the groupby of `trip_summaries`, so a
+        trip gets the same packing list on either path.
+        """
+        summary = {}
+        for name, (column, how) in self.packing_aggregates.items():
+            values = inputs.array(column)
+            summary[name] = np.array([pd.Series(values).agg(how) if len(values) else np.nan])
+        return summary
+
+    def trip_summaries(self, forecast_data: pd.DataFrame, by) -> pd.DataFrame:
+        """
+        Aggregate the forecast rows of many trips into packing rule inputs with one groupby().agg().
+
+        Args:
+            forecast_data (pd.DataFrame): Forecast rows of all trips.
+            by (str or list): Column(s) identifying a trip.
+
+        Returns:
+            pd.DataFrame: One row per trip (in order of first appearance) with the
+            aggregate columns (missing values skipped) and the number of forecast
+            rows ('forecast_days').
+        """
+        columns = list(dict.fromkeys(column for column, _ in self.packing_aggregates.values()))
+        missing = {column: self.defaults[column] for column in columns
+                   if column not in forecast_data.columns and column in self.defaults}
+        if missing:
+            forecast_data = forecast_data.assign(**missing)
+        aggregations = {name: (column, how) for name, (column, how) in self.packing_aggregates.items()}
+        aggregations["forecast_days"] = (columns[0], "size")
+        return forecast_data.groupby(by, sort=False, observed=True).agg(**aggregations)
+
+    def packing_bits(self, trips: Mapping, n_trips: int,
+                     trip_duration_days: Union[int, np.ndarray] = 7) -> Dict[str, np.ndarray]:
+        """
+        Evaluate the packing rules for one or more trips.
+
+        Args:
+            trips (Mapping): Aggregate columns (see `packing_aggregates`), one value per trip.
+            n_trips (int): Number of trips.
+            trip_duration_days (int or array): Trip length, shared or per trip.
+
+        Returns:
+            Dict[str, np.ndarray]: One uint64 item bitmask per trip for each category.
+        """
+        columns = dict(trips)
+        columns["trip_duration_days"] = np.broadcast_to(trip_duration_days, (n_trips,))
+        inputs = _Inputs(columns, n_trips, {})
+
+        packed = {}
+        for category, compiled in self._packing_rules.items():
+            bits = np.zeros(n_trips, dtype=np.uint64)
+            for kind, condition, items in compiled:
+                if kind == "select":
+                    bits |= inputs.select(condition, items)
+                else:
+                    bits[inputs.mask(condition)] |= np.uint64(items)
+            packed[category] = bits
+        return packed
+
+    def decode_packing(self, category: str, bits: int) -> Set[str]:
+        """Turn a packing bitmask back into item names."""
+        return {item for bit, item in enumerate(self.packing_items[category]) if int(bits) >> bit & 1}
+
+    def packing_matrix(self, category: str, bits: np.ndarray) -> pd.DataFrame:
+        """Decode many packing bitmasks at once into one boolean column per item."""
+        bits = np.asarray(bits, dtype=np.uint64)
+        shifts = np.arange(len(self.packing_items[category]), dtype=np.uint64)
+        return pd.DataFrame((bits[:, None] >> shifts) & np.uint64(1) == 1, columns=self.packing_items[category])
+
+    def packing_list(self, forecast_data: pd.DataFrame, trip_duration_days: int = 7) -> Dict[str, Set[str]]:
+        """Packing list for a single trip covering the whole forecast."""
+        inputs = self.inputs(forecast_data)
+        packed = self.packing_bits(self.trip_summary(inputs), 1, trip_duration_days)
+        return {category: self.decode_packing(category, bits[0]) for category, bits in packed.items()}
+
+    def row_outputs(self, inputs: _Inputs) -> Dict[str, np.ndarray]:
+        """Outfit codes, activity score and alert flags for every row."""
+        base, accessories = self.outfit_codes(inputs)
+        return {
+            "outfit_base": base,
+            "outfit_accessories": accessories,
+            "score": self.activity_scores(inputs),
+            "alert_flags": self.alert_flags(inputs),
+        }
+
+    def evaluate(self, forecast_data: pd.DataFrame, trip_duration_days: int = 7,
+                 row_outputs: Optional[Dict[str, np.ndarray]] = None) -> Dict:
+        """
+        Evaluate every app's rules in a single pass over the forecast.
+
+        Columns are read and each distinct comparison is computed once, then
+        shared by the outfit, activity, alert and packing rules.
+
+        Args:
+            forecast_data (pd.DataFrame): Daily forecast (or a flattened forecast panel).
+            trip_duration_days (int): Trip length for the packing rules.
+            row_outputs (Dict, optional): Precomputed `row_outputs` for these rows, e.g. from a cache.
+
+        Returns:
+            Dict: Per-row arrays ('outfit', 'score', 'activity_bucket', 'alert_flags')
+            and the trip's 'packing' item bitmasks by category.
+        """
+        inputs = self.inputs(forecast_data)
+        if row_outputs is None:
+            row_outputs = self.row_outputs(inputs)
+        packed = self.packing_bits(self.trip_summary(inputs), 1, trip_duration_days)
+        return {
+            "outfit": self.outfit_labels(row_outputs["outfit_base"], row_outputs["outfit_accessories"]),
+            "score": row_outputs["score"],
+            "activity_bucket": self.activity_bucket(row_outputs["score"]),
+            "alert_flags": row_outputs["alert_flags"],
+            "packing": {category: int(bits[0]) for category, bits in packed.items()},
+        }
+
+
+@lru_cache(maxsize=32)
+def _compile_cached(key: str) -> CompiledRules:
+    return CompiledRules(json.loads(key))
+
+
+def compile_rules(rules: Union[None, Mapping, CompiledRules] = None) -> CompiledRules:
+    """
+    Compile rules, reusing the cached plan for rule sets seen before.
+
+    Args:
+        rules: None for the defaults, a dict of overrides merged over the
+            defaults, or an already compiled rule set.
+
+    Returns:
+        CompiledRules: The compiled rules.
+    """
+    if isinstance(rules, CompiledRules):
+        return rules
+    merged = DEFAULT_RULES if rules is None else merge_rules(rules)
+    return _compile_cached(json.dumps(merged, sort_keys=True, ensure_ascii=False))